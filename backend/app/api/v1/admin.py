@@ -2,10 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.database import get_db
+from app.core.records import fetch_all
+from app.services.ordering import MissingItemsError, bulk_reorder, move_item
+from app.services.job_queue import job_handler, queued_response, submit_job
 from app.models import Tool, Project, BlogPost, ContactSubmission
 from datetime import datetime
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 router = APIRouter()
 
@@ -17,6 +20,13 @@ class ReorderItem(BaseModel):
 class ReorderRequest(BaseModel):
     items: List[ReorderItem]
 
+class MoveRequest(BaseModel):
+    id: int
+    # Neighbours after the move: after_id sorts directly above, before_id directly below.
+    # Omit after_id to move to the top, before_id to move to the bottom.
+    after_id: Optional[int] = None
+    before_id: Optional[int] = None
+
 @router.post("/populate-database")
 def populate_database(db: Session = Depends(get_db)):
     """Populate the database with sample data (WARNING: This will clear existing data)"""
@@ -217,7 +227,7 @@ def add_project_public(
 def list_tools_public(db: Session = Depends(get_db)):
     """Public endpoint to list tools without authentication"""
     try:
-        tools = db.query(Tool).all()
+        tools = fetch_all(db, Tool)
         return {
             "success": True,
             "data": tools
@@ -279,70 +289,75 @@ def migrate_database(db: Session = Depends(get_db)):
             "error": str(e)
         }
 
-@router.post("/update-tool-categories")
-def update_tool_categories(db: Session = Depends(get_db)):
-    """Clear all tools and reset to use new professional categories"""
+@job_handler("update_tool_categories")
+async def _update_tool_categories_job(db: Session, params: dict, progress):
+    # Professional categories for display
+    professional_categories = [
+        "AI Chat & Assistant", "Image & Visual AI", "Video & Media AI", "Audio & Voice AI", 
+        "Development & Code", "Content Creation", "Productivity & Automation", "Design & UX",
+        "Business & Marketing", "Research & Analytics", "Other"
+    ]
+    
+    # Count tools to be deleted
+    tools_count = db.query(Tool).count()
+    
+    # Delete all tools
+    db.query(Tool).delete()
+    db.commit()
+    
+    return {
+        "message": f"Cleared {tools_count} tools. You can now add new tools with professional categories: {', '.join(professional_categories)}",
+        "data": {"deleted_count": tools_count, "available_categories": professional_categories}
+    }
+
+@router.post("/update-tool-categories", status_code=202)
+def update_tool_categories():
+    """Clear all tools and reset to use new professional categories (background job; poll /jobs/{job_id})"""
     try:
-        # Professional categories for display
-        professional_categories = [
-            "AI Chat & Assistant", "Image & Visual AI", "Video & Media AI", "Audio & Voice AI", 
-            "Development & Code", "Content Creation", "Productivity & Automation", "Design & UX",
-            "Business & Marketing", "Research & Analytics", "Other"
-        ]
-        
-        # Count tools to be deleted
-        tools_count = db.query(Tool).count()
-        
-        # Delete all tools
-        db.query(Tool).delete()
-        db.commit()
-        
-        return {
-            "success": True,
-            "message": f"Cleared {tools_count} tools. You can now add new tools with professional categories: {', '.join(professional_categories)}",
-            "data": {"deleted_count": tools_count, "available_categories": professional_categories}
-        }
+        return queued_response(submit_job("update_tool_categories"), "Tool category reset started")
     except Exception as e:
-        db.rollback()
         return {
             "success": False,
             "error": str(e)
         }
 
-@router.post("/update-blog-categories")
-def update_blog_categories(db: Session = Depends(get_db)):
-    """Clear all blogs and reset to use new professional categories"""
+@job_handler("update_blog_categories")
+async def _update_blog_categories_job(db: Session, params: dict, progress):
+    # Professional blog categories for display
+    professional_blog_categories = [
+        "AI Research & Development", "Machine Learning", "AI Applications", 
+        "AI Business & Industry", "AI Ethics & Policy", "AI Tools & Platforms", 
+        "AI News & Trends", "Other"
+    ]
+    
+    # Count blogs to be deleted
+    blogs_count = db.query(BlogPost).count()
+    
+    # Delete all blogs
+    db.query(BlogPost).delete()
+    db.commit()
+    
+    return {
+        "message": f"Cleared {blogs_count} blogs. Fresh blogs will be fetched with professional categories: {', '.join(professional_blog_categories)}",
+        "data": {"deleted_count": blogs_count, "available_categories": professional_blog_categories}
+    }
+
+@router.post("/update-blog-categories", status_code=202)
+def update_blog_categories():
+    """Clear all blogs and reset to use new professional categories (background job; poll /jobs/{job_id})"""
     try:
-        # Professional blog categories for display
-        professional_blog_categories = [
-            "AI Research & Development", "Machine Learning", "AI Applications", 
-            "AI Business & Industry", "AI Ethics & Policy", "AI Tools & Platforms", 
-            "AI News & Trends", "Other"
-        ]
-        
-        # Count blogs to be deleted
-        blogs_count = db.query(BlogPost).count()
-        
-        # Delete all blogs
-        db.query(BlogPost).delete()
-        db.commit()
-        
-        return {
-            "success": True,
-            "message": f"Cleared {blogs_count} blogs. Fresh blogs will be fetched with professional categories: {', '.join(professional_blog_categories)}",
-            "data": {"deleted_count": blogs_count, "available_categories": professional_blog_categories}
-        }
+        return queued_response(submit_job("update_blog_categories"), "Blog category reset started")
     except Exception as e:
-        db.rollback()
         return {
             "success": False,
             "error": str(e)
         }
+
 @router.get("/list-projects-public")
 def list_projects_public(db: Session = Depends(get_db)):
     """Public endpoint to list projects without authentication"""
     try:
-        projects = db.query(Project).all()
+        projects = fetch_all(db, Project)
         return {
             "success": True,
             "data": projects
@@ -354,7 +369,7 @@ def list_projects_public(db: Session = Depends(get_db)):
 def list_blogs_public(db: Session = Depends(get_db)):
     """Public endpoint to list blogs without authentication"""
     try:
-        blogs = db.query(BlogPost).all()
+        blogs = fetch_all(db, BlogPost)
         return {
             "success": True,
             "data": blogs
@@ -410,24 +425,28 @@ def delete_blog_public(blog_id: int, db: Session = Depends(get_db)):
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Error deleting blog: {str(e)}")
 
-@router.post("/refresh-blogs")
-async def refresh_blogs(db: Session = Depends(get_db)):
-    """Public endpoint to refresh blogs from external RSS sources"""
+@job_handler("refresh_blogs")
+async def _refresh_blogs_job(db: Session, params: dict, progress):
+    from app.services.blog_service import fetch_and_update_blogs
+    from app.services.scheduler import reset_blog_scheduler
+    
+    # Fetch blogs from RSS sources and update database
+    progress(0.05, "Fetching RSS feeds")
+    result = await fetch_and_update_blogs(db)
+    
+    # Reset the scheduler timer to run again in 3 days from now
+    reset_blog_scheduler()
+    
+    return {
+        "message": "Blog refresh completed successfully and timer reset",
+        "data": result
+    }
+
+@router.post("/refresh-blogs", status_code=202)
+def refresh_blogs():
+    """Public endpoint to refresh blogs from external RSS sources (background job; poll /jobs/{job_id})"""
     try:
-        from app.services.blog_service import fetch_and_update_blogs
-        from app.services.scheduler import reset_blog_scheduler
-        
-        # Fetch blogs from RSS sources and update database
-        result = await fetch_and_update_blogs(db)
-        
-        # Reset the scheduler timer to run again in 3 days from now
-        reset_blog_scheduler()
-        
-        return {
-            "success": True,
-            "message": "Blog refresh completed successfully and timer reset",
-            "data": result
-        }
+        return queued_response(submit_job("refresh_blogs"), "Blog refresh started")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error refreshing blogs: {str(e)}")
 
@@ -456,68 +475,70 @@ async def get_scheduler_status():
         raise HTTPException(status_code=500, detail=f"Error getting scheduler status: {str(e)}")
 
 # Drag and Drop Reorder Endpoints
-@router.put("/admin/reorder-tools")
-def reorder_tools(request: ReorderRequest, db: Session = Depends(get_db)):
-    """Reorder tools based on drag and drop - saves to database for global ordering"""
+def _reorder(db: Session, model, label: str, request: ReorderRequest):
+    """Write the whole order in one UPDATE ... CASE statement; unknown ids abort the reorder."""
     try:
-        # Update display_order for each tool
-        for item in request.items:
-            tool = db.query(Tool).filter(Tool.id == item.id).first()
-            if tool:
-                tool.display_order = item.order
-        
-        db.commit()
-        
+        bulk_reorder(db, model, [(item.id, item.order) for item in request.items])
         return {
             "success": True,
-            "message": f"Successfully reordered {len(request.items)} tools globally",
+            "message": f"Successfully reordered {len(request.items)} {label} globally",
             "order": [item.id for item in request.items]
         }
+    except MissingItemsError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         db.rollback()
-        raise HTTPException(status_code=500, detail=f"Error reordering tools: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error reordering {label}: {str(e)}")
 
-@router.put("/admin/reorder-projects")
-def reorder_projects(request: ReorderRequest, db: Session = Depends(get_db)):
-    """Reorder projects based on drag and drop - saves to database for global ordering"""
+def _move(db: Session, model, label: str, request: MoveRequest):
+    """Move one item between two neighbours, updating only that row."""
     try:
-        # Update display_order for each project
-        for item in request.items:
-            project = db.query(Project).filter(Project.id == item.id).first()
-            if project:
-                project.display_order = item.order
-        
-        db.commit()
-        
+        order = move_item(db, model, request.id, after_id=request.after_id, before_id=request.before_id)
         return {
             "success": True,
-            "message": f"Successfully reordered {len(request.items)} projects globally",
-            "order": [item.id for item in request.items]
+            "message": f"Successfully moved {label[:-1]} {request.id}",
+            "id": request.id,
+            "display_order": order
         }
+    except MissingItemsError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         db.rollback()
-        raise HTTPException(status_code=500, detail=f"Error reordering projects: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error moving {label[:-1]}: {str(e)}")
+
+@router.put("/admin/reorder-tools")
+def reorder_tools(request: ReorderRequest, db: Session = Depends(get_db)):
+    """Reorder tools based on drag and drop - saves to database for global ordering"""
+    return _reorder(db, Tool, "tools", request)
+
+@router.put("/admin/reorder-projects")
+def reorder_projects(request: ReorderRequest, db: Session = Depends(get_db)):
+    """Reorder projects based on drag and drop - saves to database for global ordering"""
+    return _reorder(db, Project, "projects", request)
 
 @router.put("/admin/reorder-blogs")
 def reorder_blogs(request: ReorderRequest, db: Session = Depends(get_db)):
     """Reorder blogs based on drag and drop - saves to database for global ordering"""
-    try:
-        # Update display_order for each blog
-        for item in request.items:
-            blog = db.query(BlogPost).filter(BlogPost.id == item.id).first()
-            if blog:
-                blog.display_order = item.order
-        
-        db.commit()
-        
-        return {
-            "success": True,
-            "message": f"Successfully reordered {len(request.items)} blogs globally",
-            "order": [item.id for item in request.items]
-        }
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Error reordering blogs: {str(e)}")
+    return _reorder(db, BlogPost, "blogs", request)
+
+@router.put("/admin/move-tool")
+def move_tool(request: MoveRequest, db: Session = Depends(get_db)):
+    """Move a single tool between two others without renumbering the list"""
+    return _move(db, Tool, "tools", request)
+
+@router.put("/admin/move-project")
+def move_project(request: MoveRequest, db: Session = Depends(get_db)):
+    """Move a single project between two others without renumbering the list"""
+    return _move(db, Project, "projects", request)
+
+@router.put("/admin/move-blog")
+def move_blog(request: MoveRequest, db: Session = Depends(get_db)):
+    """Move a single blog between two others without renumbering the list"""
+    return _move(db, BlogPost, "blogs", request)
 
 @router.post("/admin/migrate-display-order")
 def migrate_display_order(db: Session = Depends(get_db)):
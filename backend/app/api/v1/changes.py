@@ -0,0 +1,40 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.core.http_cache import cached_response
+from app.schemas.common import APIResponse
+from app.services.changes_service import SYNC_COLLECTIONS, get_changes
+
+router = APIRouter()
+
+@router.get("/changes", response_model=APIResponse)
+def list_changes(
+    request: Request,
+    since: Optional[str] = Query(None, description="next_cursor from the previous call; omit for a full sync"),
+    types: Optional[str] = Query(None, description="Comma-separated subset of: tools, projects, blogs"),
+    db: Session = Depends(get_db),
+):
+    """
+    Inserts, updates and deletes since a sync cursor.
+
+    Apply ``deletes`` then ``upserts`` (by id) and keep ``next_cursor`` for
+    the next call. ``full_resync`` means ``upserts`` holds every row and the
+    local copy should be replaced.
+    """
+    selected = None
+    if types:
+        selected = [t.strip() for t in types.split(",") if t.strip()]
+        unknown = [t for t in selected if t not in SYNC_COLLECTIONS]
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"Unknown types: {', '.join(unknown)}")
+
+    def build():
+        try:
+            return APIResponse(success=True, data=get_changes(db, since, selected))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    tables = [table for table, _, _, _ in SYNC_COLLECTIONS.values()]
+    # The body carries a time-based next_cursor, so no shared cache may reuse it
+    return cached_response(request, tables, build, private=True)
@@ -1,14 +1,11 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter
 from app.services.cv_service import query_cv
 
 router = APIRouter()
 
 @router.post("/cv/query")
 async def cv_query(
-    request: dict,
-    db: Session = Depends(get_db)
+    request: dict
 ):
     """Query CV using RAG with option for concise or detailed answers."""
     try:
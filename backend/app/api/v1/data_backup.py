@@ -1,12 +1,19 @@
 """
 Data Backup API Endpoints
 Provides endpoints for backing up and restoring data
+(streamed as gzip-compressed NDJSON, see app.services.data_transfer)
 """
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.database import get_db
 # Data persistence service removed - using PostgreSQL
 from app.schemas.common import APIResponse
+from app.api.v1.manual_admin import verify_admin_session
+from app.services.data_transfer import (
+    IMPORT_MODES, ImportFormatError, export_filename, import_ndjson, iter_export_gzip, resolve_tables
+)
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,25 +28,68 @@ def backup_data(db: Session = Depends(get_db)):
     )
 
 @router.post("/restore-data")
-def restore_data(db: Session = Depends(get_db)):
-    """Restore data from backup - DISABLED (using PostgreSQL)"""
-    raise HTTPException(
-        status_code=410, 
-        detail="Data restore disabled - using PostgreSQL for persistence"
-    )
+def restore_data(
+    file: UploadFile = File(...),
+    batch_size: Optional[int] = None,
+    db: Session = Depends(get_db),
+    session: dict = Depends(verify_admin_session)
+):
+    """Replace the tables in an /export-data file with its rows, keeping their ids"""
+    return _import(db, file, "replace", batch_size)
 
 @router.get("/export-data")
-def export_data(db: Session = Depends(get_db)):
-    """Export data as JSON - DISABLED (using PostgreSQL)"""
-    raise HTTPException(
-        status_code=410, 
-        detail="Data export disabled - using PostgreSQL for persistence"
+def export_data(tables: Optional[str] = None, session: dict = Depends(verify_admin_session)):
+    """
+    Stream every tool, project, blog post and contact submission as gzip-compressed NDJSON.
+
+    Contact submissions contain personal data, so this requires an admin session.
+    ``tables`` is an optional comma-separated subset (ai_tools, projects, blog_posts, contact_submissions).
+    """
+    try:
+        selected = resolve_tables([t.strip() for t in tables.split(",") if t.strip()] if tables else None)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    logger.info(f"Streaming data export of {', '.join(selected)}")
+    return StreamingResponse(
+        iter_export_gzip(selected),
+        media_type="application/gzip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{export_filename()}"',
+            "Cache-Control": "no-store",
+        },
     )
 
 @router.post("/import-data")
-def import_data(data: dict, db: Session = Depends(get_db)):
-    """Import data from JSON - DISABLED (using PostgreSQL)"""
-    raise HTTPException(
-        status_code=410, 
-        detail="Data import disabled - using PostgreSQL for persistence"
+def import_data(
+    file: UploadFile = File(...),
+    mode: str = "upsert",
+    batch_size: Optional[int] = None,
+    db: Session = Depends(get_db),
+    session: dict = Depends(verify_admin_session)
+):
+    """
+    Import an /export-data file (gzip or plain NDJSON), streamed in batches.
+
+    ``mode``: upsert (match on natural key, update or insert), insert (skip existing rows)
+    or replace (same as /restore-data).
+    """
+    if mode not in IMPORT_MODES:
+        raise HTTPException(status_code=422, detail=f"mode must be one of: {', '.join(IMPORT_MODES)}")
+    return _import(db, file, mode, batch_size)
+
+def _import(db: Session, file: UploadFile, mode: str, batch_size: Optional[int]) -> APIResponse:
+    if batch_size is not None and batch_size < 1:
+        raise HTTPException(status_code=422, detail="batch_size must be positive")
+    try:
+        report = import_ndjson(db, file.file, mode=mode, batch_size=batch_size)
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Data import failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
+    logger.info(f"Imported {report['rows']} rows in {report['seconds']}s ({report['rows_per_second']} rows/s)")
+    return APIResponse(
+        success=True,
+        data=report,
+        message=f"Imported {report['rows']} rows in {report['seconds']}s ({report['rows_per_second']} rows/s)"
     )
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.core.change_tracking import version_token
+from app.core.snapshots import snapshot_response
+from app.schemas.common import APIResponse
+from app.services.stats_service import category_facets, get_content_stats
+from app.models.blog import BlogPost
+from app.models.project import Project
+from app.models.tool import Tool
+
+router = APIRouter()
+
+# Hard upper bound per collection; the full lists stay on their own endpoints
+MAX_ITEMS = 50
+
+# Trimmed projections: only what the homepage sections render
+TOOL_COLUMNS = (Tool.id, Tool.name, Tool.description, Tool.category, Tool.url, Tool.pricing, Tool.image_url)
+PROJECT_COLUMNS = (
+    Project.id, Project.name, Project.description, Project.url, Project.github_url,
+    Project.category, Project.technologies, Project.image_url,
+)
+BLOG_COLUMNS = (
+    BlogPost.id, BlogPost.title, BlogPost.excerpt, BlogPost.category, BlogPost.featured,
+    BlogPost.published, BlogPost.source, BlogPost.url, BlogPost.published_date,
+)
+
+# collection -> (table, model, columns)
+COLLECTIONS = {
+    "tools": ("ai_tools", Tool, TOOL_COLUMNS),
+    "projects": ("projects", Project, PROJECT_COLUMNS),
+    "blogs": ("blog_posts", BlogPost, BLOG_COLUMNS),
+}
+
+@router.get("/home", response_model=APIResponse)
+def home(
+    request: Request,
+    tools: int = Query(12, ge=0, le=MAX_ITEMS, description="Number of tools to include"),
+    projects: int = Query(6, ge=0, le=MAX_ITEMS, description="Number of projects to include"),
+    blogs: int = Query(6, ge=0, le=MAX_ITEMS, description="Number of blog posts to include"),
+    db: Session = Depends(get_db),
+):
+    """
+    Everything the homepage needs in one round-trip.
+
+    Each collection is a capped, trimmed projection in the same order as its
+    list endpoint, with its total, category facets and a per-collection
+    ``version`` (changes whenever that table is written). The response is
+    served from a snapshot with an ETag covering all three tables.
+    """
+    limits = {"tools": tools, "projects": projects, "blogs": blogs}
+    tables = [table for table, _, _ in COLLECTIONS.values()]
+    return snapshot_response(request, tables, lambda session: _home_payload(session, limits), db)
+
+def _collection(db: Session, name: str, table: str, model, columns, limit: int) -> dict:
+    items = []
+    if limit:
+        rows = db.query(*columns).order_by(model.display_order.asc(), model.id.desc()).limit(limit).all()
+        items = [dict(row._mapping) for row in rows]
+        for item in items:
+            if item.get("published_date"):
+                item["published_date"] = item["published_date"].isoformat()
+
+    # Totals and facets come from the shared grouped-count cache
+    return {
+        "items": items,
+        "total": get_content_stats(db)[name]["total"],
+        "facets": category_facets(db, name),
+        "version": version_token([table]),
+    }
+
+def _home_payload(db: Session, limits: dict) -> APIResponse:
+    data = {
+        name: _collection(db, name, table, model, columns, limits[name])
+        for name, (table, model, columns) in COLLECTIONS.items()
+    }
+    return APIResponse(success=True, data=data)
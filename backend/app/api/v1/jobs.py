@@ -0,0 +1,38 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.api.v1.manual_admin import verify_admin_session
+from app.schemas.common import APIResponse
+from app.services.job_queue import JOB_STATUSES, get_job, list_jobs
+
+router = APIRouter()
+
+@router.get("/jobs/{job_id}", response_model=APIResponse)
+def job_status(
+    job_id: str,
+    db: Session = Depends(get_db),
+    session: dict = Depends(verify_admin_session),
+):
+    """
+    Status, progress, duration and (once finished) result or error of a background job.
+
+    Results and errors can carry internal details, so this needs an admin
+    session like the job list does.
+    """
+    job = get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return APIResponse(success=True, data=job)
+
+@router.get("/jobs", response_model=APIResponse)
+def recent_jobs(
+    status: Optional[str] = Query(None, description=f"One of: {', '.join(JOB_STATUSES)}"),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    session: dict = Depends(verify_admin_session),
+):
+    """Most recent background jobs (without results), newest first."""
+    if status and status not in JOB_STATUSES:
+        raise HTTPException(status_code=422, detail=f"status must be one of: {', '.join(JOB_STATUSES)}")
+    return APIResponse(success=True, data={"items": list_jobs(db, status, limit)})
@@ -1,14 +1,21 @@
 from fastapi import APIRouter, Header, HTTPException, Depends, UploadFile, File, Form, Request
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from app.database import get_db
+from app.database import get_async_db, get_db
+from app.core.records import fetch_all
 from app.models import Tool, Project, BlogPost
 from app.config import settings
 from app.core.security import get_security_manager
 from app.core.storage import get_storage_service
-from app.services.chat_service import ask_model
+from app.services.blog_writer import generate_blog_draft, stream_blog_draft
+from app.services.job_queue import job_handler, queued_response, submit_job
+from app.services.stats_service import get_content_stats
 from typing import Optional
+from contextlib import aclosing
 from datetime import datetime
 import os
 import uuid
@@ -45,12 +52,12 @@ async def add_tool(
     request: Request,
     tool: ToolCreate, 
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Manually add a new AI tool."""
     try:
         # Check if tool already exists
-        existing = db.query(Tool).filter(Tool.url == tool.url).first()
+        existing = await db.scalar(select(Tool.id).where(Tool.url == tool.url).limit(1))
         if existing:
             return {"success": False, "error": "Tool with this URL already exists"}
         
@@ -66,12 +73,12 @@ async def add_tool(
             source="Manual Admin"
         )
         db.add(new_tool)
-        db.commit()
-        db.refresh(new_tool)
+        await db.commit()
+        await db.refresh(new_tool)
         
         return {"success": True, "message": "Tool added successfully", "data": new_tool}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 @router.delete("/delete-tool/{tool_id}")
@@ -79,20 +86,20 @@ async def delete_tool(
     request: Request,
     tool_id: int,
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a tool by ID."""
     try:
-        tool = db.query(Tool).filter(Tool.id == tool_id).first()
+        tool = await db.get(Tool, tool_id)
         if not tool:
             return {"success": False, "error": "Tool not found"}
         
-        db.delete(tool)
-        db.commit()
+        await db.delete(tool)
+        await db.commit()
         
         return {"success": True, "message": "Tool deleted successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 # Project Management
@@ -110,7 +117,7 @@ async def add_project(
     request: Request,
     project: ProjectCreate, 
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Manually add a new project."""
     try:
@@ -124,12 +131,12 @@ async def add_project(
             image_url=project.image_url
         )
         db.add(new_project)
-        db.commit()
-        db.refresh(new_project)
+        await db.commit()
+        await db.refresh(new_project)
         
         return {"success": True, "message": "Project added successfully", "data": new_project}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 @router.delete("/delete-project/{project_id}")
@@ -137,20 +144,20 @@ async def delete_project(
     request: Request,
     project_id: int,
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a project by ID."""
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.get(Project, project_id)
         if not project:
             return {"success": False, "error": "Project not found"}
         
-        db.delete(project)
-        db.commit()
+        await db.delete(project)
+        await db.commit()
         
         return {"success": True, "message": "Project deleted successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 @router.post("/upload-image-public")
@@ -272,7 +279,7 @@ async def upload_image(
 async def update_project_public(
     request: Request,
     project_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Public endpoint to update projects without authentication"""
     try:
@@ -280,7 +287,7 @@ async def update_project_public(
         body = await request.json()
         
         # Find the project
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.get(Project, project_id)
         if not project:
             return {"success": False, "error": "Project not found"}
         
@@ -323,8 +330,8 @@ async def update_project_public(
         if "image_url" in body:
             project.image_url = body["image_url"]
         
-        db.commit()
-        db.refresh(project)
+        await db.commit()
+        await db.refresh(project)
         
         return {
             "success": True,
@@ -332,7 +339,7 @@ async def update_project_public(
             "data": {"project_id": project.id, "name": project.name}
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 @router.put("/update-project/{project_id}")
@@ -341,11 +348,11 @@ async def update_project(
     project_id: int,
     project: ProjectCreate,
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a project by ID."""
     try:
-        existing_project = db.query(Project).filter(Project.id == project_id).first()
+        existing_project = await db.get(Project, project_id)
         if not existing_project:
             return {"success": False, "error": "Project not found"}
         
@@ -358,18 +365,18 @@ async def update_project(
         existing_project.technologies = project.technologies
         existing_project.image_url = project.image_url
         
-        db.commit()
+        await db.commit()
         
         return {"success": True, "message": "Project updated successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 @router.put("/update-tool-public/{tool_id}")
 async def update_tool_public(
     request: Request,
     tool_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Public endpoint to update tools without authentication"""
     try:
@@ -377,7 +384,7 @@ async def update_tool_public(
         body = await request.json()
         
         # Find the tool
-        tool = db.query(Tool).filter(Tool.id == tool_id).first()
+        tool = await db.get(Tool, tool_id)
         if not tool:
             return {"success": False, "error": "Tool not found"}
         
@@ -420,8 +427,8 @@ async def update_tool_public(
         if "image_url" in body:
             tool.image_url = body["image_url"]
         
-        db.commit()
-        db.refresh(tool)
+        await db.commit()
+        await db.refresh(tool)
         
         return {
             "success": True,
@@ -429,7 +436,7 @@ async def update_tool_public(
             "data": {"tool_id": tool.id, "name": tool.name}
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 @router.put("/update-tool/{tool_id}")
@@ -438,11 +445,11 @@ async def update_tool(
     tool_id: int,
     tool: ToolCreate,
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a tool by ID."""
     try:
-        existing_tool = db.query(Tool).filter(Tool.id == tool_id).first()
+        existing_tool = await db.get(Tool, tool_id)
         if not existing_tool:
             return {"success": False, "error": "Tool not found"}
         
@@ -455,11 +462,11 @@ async def update_tool(
         existing_tool.status = tool.status
         existing_tool.image_url = tool.image_url
         
-        db.commit()
+        await db.commit()
         
         return {"success": True, "message": "Tool updated successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 # Blog Generation
@@ -469,67 +476,59 @@ class BlogGenerate(BaseModel):
     tone: str = "professional"  # professional, casual, technical
     length: str = "medium"  # short, medium, long
 
-@router.post("/generate-blog")
+@job_handler("generate_blog")
+async def _generate_blog_job(db: Session, params: dict, progress):
+    progress(0.1, "Writing draft")
+    return await generate_blog_draft(**params)
+
+@router.post("/generate-blog", status_code=202)
 async def generate_blog(
     request: Request,
     blog: BlogGenerate, 
     session: dict = Depends(verify_admin_session)
 ):
-    """Generate a proper blog post that feels like you wrote it."""
+    """Generate a proper blog post that feels like you wrote it (as a background job; poll /jobs/{job_id})."""
     try:
-        # Create a detailed prompt for blog generation
-        prompt = f"""
-        Write a natural, engaging blog post about "{blog.topic}" in the {blog.category} category.
-        
-        Requirements:
-        - Write in a {blog.tone} tone that feels conversational and authentic
-        - Make it {blog.length} length (2-3 paragraphs for medium, 4-5 for long)
-        - Write as if Daniyal Areeb (a software engineer and AI enthusiast) wrote it personally
-        - Include personal insights, experiences, and real-world examples
-        - Make it engaging and informative without being overly technical
-        - Use natural language flow - avoid bullet points, asterisks, or excessive formatting
-        - Write in complete sentences and paragraphs
-        - Include practical examples or use cases that readers can relate to
-        - End with a thoughtful conclusion that ties everything together
-        - Make it feel like a genuine blog post someone would actually read
-        
-        Write the blog post in clean markdown format with proper headings and natural paragraph flow.
-        Avoid using asterisks (*), hyphens (-), or bullet points for lists.
-        """
-        
-        # Generate the blog content
-        content = await ask_model(prompt, mode="home")
-        
-        # Extract title from the first line
-        lines = content.split('\n')
-        title = lines[0].replace('# ', '').replace('#', '').strip()
-        
-        # Create excerpt from first paragraph
-        excerpt = ""
-        for line in lines:
-            if line.strip() and not line.startswith('#') and not line.startswith('*'):
-                excerpt = line.strip()
-                break
-        
-        return {
-            "success": True, 
-            "data": {
-                "title": title,
-                "excerpt": excerpt[:200] + "..." if len(excerpt) > 200 else excerpt,
-                "content": content,
-                "category": blog.category,
-                "topic": blog.topic
-            }
-        }
+        job_id = submit_job("generate_blog", blog.model_dump())
+        return queued_response(job_id, "Blog generation started")
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+@router.post("/generate-blog/stream")
+async def generate_blog_stream(
+    request: Request,
+    blog: BlogGenerate, 
+    session: dict = Depends(verify_admin_session)
+):
+    """
+    Stream blog generation as NDJSON events while the model writes.
+
+    Events: {"type": "delta", "text"} for each chunk of markdown, "title" and
+    "excerpt" as soon as they can be extracted, then "done" with the full
+    draft (same shape as the /generate-blog job result) or "error".
+    Aborting the request cancels generation: the stream is closed and with
+    it the upstream model request.
+    """
+    async def events():
+        try:
+            async with aclosing(stream_blog_draft(**blog.model_dump())) as stream:
+                async for event in stream:
+                    yield json.dumps(event) + "\n"
+        except Exception as e:
+            yield json.dumps({"type": "error", "error": str(e)}) + "\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
 @router.post("/save-generated-blog")
 async def save_generated_blog(
     request: Request,
     blog_data: dict, 
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Save a generated blog post to the database."""
     try:
@@ -544,12 +543,12 @@ async def save_generated_blog(
             published_date=datetime.now()
         )
         db.add(new_blog)
-        db.commit()
-        db.refresh(new_blog)
+        await db.commit()
+        await db.refresh(new_blog)
         
         return {"success": True, "message": "Blog saved successfully", "data": new_blog}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 @router.delete("/delete-blog/{blog_id}")
@@ -557,31 +556,31 @@ async def delete_blog(
     request: Request,
     blog_id: int,
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a blog by ID."""
     try:
-        blog = db.query(BlogPost).filter(BlogPost.id == blog_id).first()
+        blog = await db.get(BlogPost, blog_id)
         if not blog:
             return {"success": False, "error": "Blog not found"}
         
-        db.delete(blog)
-        db.commit()
+        await db.delete(blog)
+        await db.commit()
         
         return {"success": True, "message": "Blog deleted successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 # List endpoints
 @router.get("/list-tools")
 async def list_tools(
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all tools."""
     try:
-        tools = db.query(Tool).order_by(Tool.display_order.asc(), Tool.id.desc()).all()
+        tools = await db.run_sync(fetch_all, Tool, order_by=(Tool.display_order.asc(), Tool.id.desc()))
         return {"success": True, "data": tools}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -589,11 +588,11 @@ async def list_tools(
 @router.get("/list-projects")
 async def list_projects(
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all projects."""
     try:
-        projects = db.query(Project).order_by(Project.id.desc()).all()
+        projects = await db.run_sync(fetch_all, Project, order_by=(Project.id.desc(),))
         return {"success": True, "data": projects}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -601,11 +600,11 @@ async def list_projects(
 @router.get("/list-blogs")
 async def list_blogs(
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all blogs."""
     try:
-        blogs = db.query(BlogPost).order_by(BlogPost.id.desc()).all()
+        blogs = await db.run_sync(fetch_all, BlogPost, order_by=(BlogPost.id.desc(),))
         return {"success": True, "data": blogs}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -614,52 +613,32 @@ async def list_blogs(
 async def delete_all_blogs(
     request: Request,
     session: dict = Depends(verify_admin_session), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete all blog posts."""
     try:
-        count = db.query(BlogPost).delete()
-        db.commit()
+        count = (await db.execute(delete(BlogPost))).rowcount
+        await db.commit()
         return {"success": True, "message": f"Deleted {count} blogs successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"success": False, "error": str(e)}
 
 # Dashboard Stats
 @router.get("/manual-stats")
 async def get_manual_stats(
     session: dict = Depends(verify_admin_session),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get statistics for manually added content."""
     try:
-        manual_tools = db.query(Tool).filter(Tool.auto_fetched == False).count()
-        auto_tools = db.query(Tool).filter(Tool.auto_fetched == True).count()
-        total_projects = db.query(Project).count()
-        total_blogs = db.query(BlogPost).count()
-        
-        # Get category breakdown
-        tool_categories = db.query(Tool.category).distinct().all()
-        project_categories = db.query(Project.category).distinct().all()
-        blog_categories = db.query(BlogPost.category).distinct().all()
-        
+        # One grouped query for all tables, cached per content version
+        stats = await db.run_sync(get_content_stats)
         return {
             "success": True,
             "data": {
-                "tools": {
-                    "manual": manual_tools,
-                    "auto": auto_tools,
-                    "total": manual_tools + auto_tools,
-                    "categories": [cat[0] for cat in tool_categories]
-                },
-                "projects": {
-                    "total": total_projects,
-                    "categories": [cat[0] for cat in project_categories]
-                },
-                "blogs": {
-                    "total": total_blogs,
-                    "categories": [cat[0] for cat in blog_categories]
-                }
+                name: {key: value for key, value in entry.items() if key != "by_category"}
+                for name, entry in stats.items()
             }
         }
     except Exception as e:
@@ -668,13 +647,13 @@ async def get_manual_stats(
 # Add this endpoint to fix existing URLs
 @router.post("/fix-image-urls")
 async def fix_image_urls(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_admin: dict = Depends(verify_admin_session)
 ):
     """Fix malformed image URLs in database (https// -> https://)"""
     try:
         # Fix projects
-        projects = db.query(Project).filter(Project.image_url.contains('https//')).all()
+        projects = (await db.scalars(select(Project).where(Project.image_url.contains('https//')))).all()
         fixed_count = 0
         for project in projects:
             if project.image_url and 'https//' in project.image_url:
@@ -682,14 +661,29 @@ async def fix_image_urls(
                 fixed_count += 1
         
         # Fix tools
-        tools = db.query(Tool).filter(Tool.image_url.contains('https//')).all()
+        tools = (await db.scalars(select(Tool).where(Tool.image_url.contains('https//')))).all()
         for tool in tools:
             if tool.image_url and 'https//' in tool.image_url:
                 tool.image_url = tool.image_url.replace('https//', 'https://')
                 fixed_count += 1
         
-        db.commit()
+        await db.commit()
         return {"success": True, "data": {"fixed_count": fixed_count, "message": f"Fixed {fixed_count} malformed URLs"}}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
+        return {"success": False, "error": str(e)}
+
+# Plain def: the export is mostly file writes, so it runs on the thread pool with a sync session
+@router.post("/static-export")
+def run_static_export(
+    full: bool = False,
+    db: Session = Depends(get_db),
+    current_admin: dict = Depends(verify_admin_session)
+):
+    """Render the public lists to precompressed static JSON (only changed files unless full=true)."""
+    try:
+        from app.services.static_export import export_static
+        result = export_static(db, full=full)
+        return {"success": True, "data": result}
+    except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1,22 +1,41 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.core.http_cache import cached_response
+from app.core.snapshots import snapshot_response
 from app.schemas.common import APIResponse
-from app.models.blog import BlogPost
+from app.services.content_service import blog_list_payload, blog_detail_payload
 
 router = APIRouter()
 
 @router.get("/news/list", response_model=APIResponse)
-def list_blogs(db: Session = Depends(get_db)):
-    items = db.query(BlogPost).order_by(BlogPost.display_order.asc(), BlogPost.id.desc()).all()
-    # shape like frontend expects
-    data = {
-        "items": [
-            {
-                "id": b.id, "title": b.title, "excerpt": b.excerpt, "category": b.category,
-                "published": b.published, "featured": b.featured,
-                "content": b.content
-            } for b in items
-        ]
-    }
-    return APIResponse(success=True, data=data)
+def list_blogs(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size; enables keyset pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    category: Optional[str] = Query(None),
+    featured: Optional[bool] = Query(None),
+    view: Optional[str] = Query(None, pattern="^(full|summary)$", description="summary omits content"),
+    db: Session = Depends(get_db),
+):
+    """
+    List blog posts ordered by (display_order, id desc).
+
+    Without ``limit``/``cursor`` every post is returned with its content, as
+    before. With them the list is paginated on (display_order, id) and uses
+    the summary projection unless ``view=full``; fetch a single post's
+    content from /news/{blog_id}.
+
+    Responses are served from a pre-encoded snapshot that is rebuilt after
+    writes, and carry an ETag; a matching If-None-Match gets a 304.
+    """
+    return snapshot_response(
+        request, ["blog_posts"],
+        lambda session: blog_list_payload(session, limit, cursor, category, featured, view), db,
+    )
+
+@router.get("/news/{blog_id}", response_model=APIResponse)
+def get_blog(request: Request, blog_id: int, db: Session = Depends(get_db)):
+    """Full detail of a single blog post, including content."""
+    return cached_response(request, ["blog_posts"], lambda: blog_detail_payload(db, blog_id))
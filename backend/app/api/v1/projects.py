@@ -1,26 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.core.snapshots import snapshot_response
 from app.schemas.common import APIResponse
-from app.models.project import Project
+from app.services.content_service import projects_payload
 
 router = APIRouter()
 
 @router.get("/projects/list", response_model=APIResponse)
-def projects_list(db: Session = Depends(get_db)):
-    items = db.query(Project).order_by(Project.display_order.asc(), Project.id.desc()).all()
-    data = {
-        "items": [
-            {
-                "id": p.id, 
-                "name": p.name, 
-                "description": p.description, 
-                "url": p.url,
-                "github_url": p.github_url,
-                "category": p.category,
-                "technologies": p.technologies,
-                "image_url": getattr(p, 'image_url', None)
-            } for p in items
-        ]
-    }
-    return APIResponse(success=True, data=data)
+def projects_list(request: Request, db: Session = Depends(get_db)):
+    return snapshot_response(request, ["projects"], projects_payload, db)
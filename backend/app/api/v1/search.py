@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query, HTTPException
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.schemas.common import APIResponse
+from app.core.search import search, SEARCH_TYPES
+
+router = APIRouter()
+
+@router.get("/search", response_model=APIResponse)
+def search_content(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: str = Query(None, description="Comma-separated subset of: blogs, tools, projects"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """Full-text search across blogs, tools and projects, ranked with highlighted snippets."""
+    selected = None
+    if types:
+        selected = [t.strip() for t in types.split(",") if t.strip()]
+        unknown = [t for t in selected if t not in SEARCH_TYPES]
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"Unknown search types: {', '.join(unknown)}")
+    result = search(db, q, selected, limit)
+    return APIResponse(success=True, data={"query": q, **result})
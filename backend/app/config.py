@@ -21,6 +21,17 @@ class Settings(BaseSettings):
     # Database - PostgreSQL for reliable persistence
     DATABASE_URL: str = os.environ.get('DATABASE_URL', 'sqlite:///./data/portfolio.db')
     
+    # Postgres connection pools (sync and async engine each get one; keep 2 x (size + overflow) under the plan's limit)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: float = 30.0   # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800     # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    
+    # SQLite (local development): memory-mapped I/O bytes and lock wait in milliseconds
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    
     # ChromaDB (external service)
     CHROMADB_URL: str = "http://localhost:8001"
     
@@ -89,6 +100,37 @@ class Settings(BaseSettings):
                 return [origin.strip() for origin in v.split(',') if origin.strip()]
         return v
     
+    # Blog ingestion - stream feeds and stop reading once enough entries are parsed
+    BLOG_STREAMING_PARSER: bool = True
+    
+    # HTTP caching for public list endpoints (ETag revalidation + CDN edge caching)
+    PUBLIC_CACHE_MAX_AGE: int = 0
+    PUBLIC_CACHE_S_MAXAGE: int = 60
+    PUBLIC_CACHE_STALE_WHILE_REVALIDATE: int = 300
+    
+    # Response compression (gzip/brotli) for JSON and text responses
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_MEMO_MB: int = 32
+    COMPRESSION_THREAD_MIN_SIZE: int = 65536  # bodies this large are compressed off the event loop
+    
+    # Delta sync (/changes): how long delete tombstones are kept
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+    
+    # Dashboard/startup row counts: seconds to reuse them when no write went through the app
+    STATS_CACHE_TTL_SECONDS: int = 30
+    
+    # Background admin jobs (/jobs): jobs run at once, and days finished jobs are kept
+    JOB_CONCURRENCY: int = 2
+    JOB_RETENTION_DAYS: int = 14
+    
+    # NDJSON import (/import-data, /restore-data): rows written per INSERT/UPDATE batch
+    IMPORT_BATCH_SIZE: int = 1000
+    
+    # Static JSON export (served at /static/export, rebuilt after content changes when enabled)
+    STATIC_EXPORT_ENABLED: bool = False
+    STATIC_EXPORT_DIR: str = ""  # defaults to $VOLUME_MOUNT_PATH/static_export
+    STATIC_EXPORT_DEBOUNCE_SECONDS: float = 5.0
+    
     # API
     API_V1_STR: str = "/api/v1"
 
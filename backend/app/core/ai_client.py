@@ -2,9 +2,10 @@
 OpenRouter AI client for chat completions and embeddings.
 Handles multiple free models with fallback mechanisms.
 """
+import json
 import os
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from app.config import settings
 
 class OpenRouterClient:
@@ -232,3 +233,55 @@ async def chat_complete(prompt: str, model: str, max_tokens: int = 300, temperat
             raise Exception(f"OpenRouter API error {r.status_code}: {r.text}")
         data = r.json()
         return data["choices"][0]["message"]["content"]
+
+# Streaming variant of chat_complete: yields the reply as it is generated
+async def chat_complete_stream(prompt: str, model: str, max_tokens: int = 300, temperature: float = 0.7) -> AsyncIterator[str]:
+    """
+    Stream a chat completion (OpenRouter server-sent events), yielding text deltas.
+
+    Raises before yielding anything if the request is rejected, so callers can
+    fall back to another model. Closing the generator early (e.g. the client
+    disconnected) closes the upstream connection, which stops generation.
+    """
+    payload = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": "Follow the system message strictly."},
+            {"role": "user", "content": prompt},
+        ],
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "stream": True,
+    }
+    
+    headers = {
+        "Authorization": f"Bearer {settings.OPENROUTER_API_KEY.strip()}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://daniyalareeb.com",
+        "X-Title": "DanPortfolio",
+    }
+    
+    # Generous read timeout: tokens can pause, but the connect should fail fast
+    timeout = httpx.Timeout(60.0, connect=15.0)
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        async with client.stream("POST", f"{settings.OPENROUTER_BASE_URL}/chat/completions", headers=headers, json=payload) as r:
+            if r.status_code != 200:
+                body = await r.aread()
+                raise Exception(f"OpenRouter API error {r.status_code}: {body.decode('utf-8', 'replace')}")
+            async for line in r.aiter_lines():
+                # SSE: "data: {...}" events, ": keep-alive" comments, "data: [DONE]" at the end
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                except ValueError:
+                    continue
+                if chunk.get("error"):
+                    raise Exception(f"OpenRouter stream error: {chunk['error']}")
+                choices = chunk.get("choices") or []
+                delta = (choices[0].get("delta") or {}).get("content") if choices else None
+                if delta:
+                    yield delta
@@ -0,0 +1,127 @@
+"""
+Per-table content versions for the public content tables.
+
+Every committed ORM write to a tracked table (instance adds/updates/deletes
+as well as bulk ``query(...).update()/.delete()``) bumps that table's
+version, via SQLAlchemy Session events registered once for all sessions.
+Because the hooks sit on the Session class, every write path in admin.py,
+manual_admin.py, the blog refresh job and the scheduler is covered without
+touching the endpoints themselves.
+
+Versions are kept in memory and prefixed with a per-process boot id, so a
+restart can never reissue an old version for different content. Writes made
+by other processes (one-off scripts, psql) are not seen until the next
+restart; the web dyno runs a single worker, so that is the only gap.
+
+The same hooks write a ``tombstones`` row for every deleted tracked row
+(including bulk deletes, whose ids are selected just before the DELETE runs),
+in the same transaction as the delete, for the /changes delta feed.
+"""
+import threading
+import uuid
+from typing import Callable, Dict, Iterable, List
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+TRACKED_TABLES = ("ai_tools", "projects", "blog_posts")
+
+BOOT_ID = uuid.uuid4().hex[:12]
+
+_versions: Dict[str, int] = {table: 1 for table in TRACKED_TABLES}
+_lock = threading.Lock()
+_listeners: List[Callable[[set], None]] = []
+_registered = False
+
+_PENDING_KEY = "changed_tables"
+
+def get_version(table: str) -> int:
+    return _versions.get(table, 0)
+
+def get_versions(tables: Iterable[str] = TRACKED_TABLES) -> Dict[str, int]:
+    return {table: _versions.get(table, 0) for table in tables}
+
+def version_token(tables: Iterable[str]) -> str:
+    """Compact token identifying the current content of ``tables`` in this process."""
+    return BOOT_ID + "-" + ".".join(str(_versions.get(t, 0)) for t in tables)
+
+def bump_version(*tables: str) -> None:
+    """Mark tables as changed and notify listeners (e.g. snapshot rebuilders)."""
+    changed = {t for t in tables if t in _versions}
+    if not changed:
+        return
+    with _lock:
+        for table in changed:
+            _versions[table] += 1
+    for listener in list(_listeners):
+        try:
+            listener(changed)
+        except Exception:
+            pass
+
+def on_change(listener: Callable[[set], None]) -> None:
+    """Register a callback invoked with the set of tables changed by each commit."""
+    _listeners.append(listener)
+
+def _table_of(obj) -> str:
+    table = getattr(obj, "__table__", None)
+    return table.name if table is not None else ""
+
+def _pending(session) -> set:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+def _record_tombstones(session, table: str, ids) -> None:
+    from app.models.tombstone import Tombstone
+
+    rows = [{"table_name": table, "row_id": row_id} for row_id in ids if row_id is not None]
+    if rows:
+        session.connection().execute(insert(Tombstone.__table__), rows)
+
+def _after_flush(session, flush_context):
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = _table_of(obj)
+        if table in _versions:
+            _pending(session).add(table)
+    deleted: Dict[str, list] = {}
+    for obj in session.deleted:
+        table = _table_of(obj)
+        if table in _versions:
+            deleted.setdefault(table, []).append(getattr(obj, "id", None))
+    for table, ids in deleted.items():
+        _record_tombstones(session, table, ids)
+
+def _do_orm_execute(orm_execute_state):
+    # Bulk query(...).update()/.delete() and update()/delete()/insert() statements skip the flush
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.local_table.name in _versions:
+        table = mapper.local_table
+        _pending(orm_execute_state.session).add(table.name)
+        if orm_execute_state.is_delete:
+            # Capture the ids a bulk DELETE is about to remove
+            ids_query = select(table.c.id)
+            where = orm_execute_state.statement.whereclause
+            if where is not None:
+                ids_query = ids_query.where(where)
+            ids = orm_execute_state.session.connection().execute(ids_query).scalars().all()
+            _record_tombstones(orm_execute_state.session, table.name, ids)
+
+def _after_commit(session):
+    tables = session.info.pop(_PENDING_KEY, None)
+    if tables:
+        bump_version(*tables)
+
+def _after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+def register_session_events() -> None:
+    """Attach the tracking hooks to every Session (idempotent)."""
+    global _registered
+    if _registered:
+        return
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "do_orm_execute", _do_orm_execute)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
+    _registered = True
@@ -0,0 +1,193 @@
+"""
+gzip / brotli response compression (pure ASGI middleware).
+
+Only complete, single-body responses are compressed: anything streamed
+without a Content-Length (NDJSON, SSE, large file transfers) is passed
+through untouched so it isn't buffered, as are responses that are already
+encoded (e.g. the precompressed static export), small bodies and
+non-text content types.
+
+Compressed bodies of cacheable responses (those with an ETag and without
+``no-store``/``private``) are memoised by (path, ETag, encoding), so hot
+endpoints served from snapshots don't recompress the same bytes per hit.
+Bodies of at least ``thread_min_size`` bytes are compressed in a worker
+thread so a large miss doesn't stall the event loop for other requests.
+"""
+import gzip
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is in requirements.txt
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/javascript", "application/xml",
+    "application/rss+xml", "application/atom+xml", "image/svg+xml", "text/",
+)
+
+def accepted_encodings(accept_encoding: str) -> List[str]:
+    """br and/or gzip, in order of preference, that an Accept-Encoding header allows (q=0 refuses)."""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token] = q
+    encodings = []
+    if accepted.get("br", 0) > 0:
+        encodings.append("br")
+    if accepted.get("gzip", accepted.get("*", 0)) > 0:
+        encodings.append("gzip")
+    return encodings
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header, honouring q=0."""
+    for encoding in accepted_encodings(accept_encoding):
+        if encoding != "br" or brotli is not None:
+            return encoding
+    return None
+
+class CompressionMemo:
+    """Small thread-safe LRU of compressed bodies, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        with self._lock:
+            body = self._items.get(key)
+            if body is not None:
+                self._items.move_to_end(key)
+            return body
+
+    def put(self, key: tuple, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._items[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        memo_bytes: int = 32 * 1024 * 1024,
+        thread_min_size: int = 64 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.memo = CompressionMemo(memo_bytes)
+        self.thread_min_size = thread_min_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, scope["path"], encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    async def compress_async(self, body: bytes, encoding: str) -> bytes:
+        """compress(), off the event loop for large bodies (zlib and brotli release the GIL)."""
+        if len(body) < self.thread_min_size:
+            return self.compress(body, encoding)
+        return await anyio.to_thread.run_sync(self.compress, body, encoding)
+
+class _CompressingResponder:
+    def __init__(self, middleware: CompressionMiddleware, path: str, encoding: str, send: Send):
+        self.middleware = middleware
+        self.path = path
+        self.encoding = encoding
+        self._send = send
+        self.start: Optional[Message] = None
+        self.passthrough = False
+
+    def _should_compress(self, headers: Headers, status: int) -> bool:
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers or "content-length" not in headers:
+            return False
+        if int(headers["content-length"]) < self.middleware.minimum_size:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _memo_key(self, headers: Headers) -> Optional[tuple]:
+        etag = headers.get("etag")
+        cache_control = headers.get("cache-control", "").lower()
+        if not etag or "no-store" in cache_control or "private" in cache_control:
+            return None
+        return (self.path, etag, self.encoding)
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = not self._should_compress(headers, message["status"])
+            if self.passthrough:
+                await self._send(message)
+            else:
+                self.start = message
+            return
+        if self.passthrough or message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if message.get("more_body", False):
+            # Multi-chunk body (e.g. a file): stream it through uncompressed
+            self.passthrough = True
+            await self._send(self.start)
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        headers = MutableHeaders(raw=self.start["headers"])
+        key = self._memo_key(headers)
+        compressed = self.middleware.memo.get(key) if key else None
+        if compressed is None:
+            compressed = await self.middleware.compress_async(body, self.encoding)
+            if key:
+                self.middleware.memo.put(key, compressed)
+
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        if "accept-encoding" not in headers.get("vary", "").lower():
+            headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The encoded body differs byte-for-byte, so the validator becomes weak
+            headers["ETag"] = "W/" + etag
+        await self._send(self.start)
+        await self._send({"type": "http.response.body", "body": compressed})
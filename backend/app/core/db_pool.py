@@ -0,0 +1,160 @@
+"""
+Connection pool settings and telemetry for the sync and async engines.
+
+Postgres pools are sized from settings (DB_POOL_*). Heroku Postgres plans
+cap connections per database (20 on the smallest ones) and the sync and
+async engines each keep their own pool, so the defaults allow at most
+2 x (DB_POOL_SIZE + DB_MAX_OVERFLOW) = 20 connections. pre-ping and
+recycle drop connections the server or Heroku's router closed while idle.
+
+SQLite (local development) gets WAL, synchronous=NORMAL, a memory map and a
+busy timeout on every new connection, so the job queue, scheduler and
+request threads stop tripping over "database is locked".
+
+Queue pools are timed: every checkout records how long it waited (including
+opening a new connection), and ``pool_metrics()`` reports that together
+with the pool's size, checked-out connections and overflow, for
+``/metrics/db-pool``.
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.config import settings
+
+RECENT_CHECKOUTS = 1000
+
+class PoolMetrics:
+    """Checkout counts and wait times of one engine's pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._recent = deque(maxlen=RECENT_CHECKOUTS)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            self._recent.append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            checkouts, timeouts, total, slowest = self.checkouts, self.timeouts, self.wait_total, self.wait_max
+
+        def percentile(p: float) -> float:
+            return round(recent[min(len(recent) - 1, int(p * len(recent)))] * 1000, 3) if recent else 0.0
+
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_ms": {
+                "avg": round(total / checkouts * 1000, 3) if checkouts else 0.0,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(slowest * 1000, 3),
+            },
+        }
+
+class _TimedCheckout:
+    """Mixin timing QueuePool._do_get; the metrics object is a class attribute so pool.recreate() keeps it."""
+    _metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self._metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self._metrics.record(time.perf_counter() - start)
+        return connection
+
+_metrics: Dict[str, PoolMetrics] = {}
+_engines: Dict[str, Engine] = {}
+
+def _timed_pool(base: type, name: str) -> type:
+    metrics = _metrics.setdefault(name, PoolMetrics(name))
+    return type(f"Timed{base.__name__}", (_TimedCheckout, base), {"_metrics": metrics})
+
+def _is_memory_sqlite(database: Optional[str]) -> bool:
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+def engine_options(url: str, name: str, is_async: bool = False) -> dict:
+    """Keyword arguments for create_engine/create_async_engine (pool class, sizing, connect args)."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        if is_async:
+            # aiosqlite uses NullPool for files and StaticPool for :memory: - nothing to size
+            return {}
+        options = {"connect_args": {"check_same_thread": False}}
+        if not _is_memory_sqlite(parsed.database):
+            options["poolclass"] = _timed_pool(QueuePool, name)
+        return options
+    return {
+        "poolclass": _timed_pool(AsyncAdaptedQueuePool if is_async else QueuePool, name),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        # execute() then fetchone(): the aiosqlite adapter's execute() returns None
+        cursor.execute("PRAGMA database_list")
+        database = cursor.fetchone()
+        if database and database[2]:
+            # WAL needs a file; in-memory databases keep their journal
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    finally:
+        cursor.close()
+
+def configure_engine(engine: Engine, name: str) -> None:
+    """Register an engine for pool_metrics() and apply the SQLite pragmas (pass async_engine.sync_engine)."""
+    _engines[name] = engine
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+
+def pool_metrics() -> dict:
+    """Per engine: pool class and settings, current size/checked-out/overflow, checkout wait times."""
+    report = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        entry = {"dialect": engine.dialect.name, "pool": type(pool).__name__.replace("Timed", "", 1)}
+        if isinstance(pool, QueuePool):
+            entry.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+                max_overflow=pool._max_overflow,
+                timeout_seconds=pool.timeout(),
+                recycle_seconds=pool._recycle,
+                pre_ping=pool._pre_ping,
+            )
+        else:
+            entry["status"] = pool.status()
+        if name in _metrics:
+            entry.update(_metrics[name].snapshot())
+        report[name] = entry
+    return report
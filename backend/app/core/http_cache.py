@@ -0,0 +1,69 @@
+"""
+Conditional GET support for the public read endpoints.
+
+ETags are derived from the in-memory table versions in change_tracking plus
+the request path and (order-independent) query string, so a matching
+``If-None-Match`` is answered with 304 before the handler touches the
+database. ``Cache-Control`` lets browsers and the CDN edge reuse responses;
+per-client responses (e.g. /changes, which depends on the caller's cursor)
+are sent ``private, no-cache`` and rely on the ETag alone.
+"""
+import hashlib
+from typing import Any, Callable, Iterable
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+from app.core.change_tracking import version_token
+
+# Browser-only caching that always revalidates with If-None-Match
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+def cache_control() -> str:
+    return (
+        f"public, max-age={settings.PUBLIC_CACHE_MAX_AGE}, "
+        f"s-maxage={settings.PUBLIC_CACHE_S_MAXAGE}, "
+        f"stale-while-revalidate={settings.PUBLIC_CACHE_STALE_WHILE_REVALIDATE}"
+    )
+
+def request_variant(request: Request) -> str:
+    """Path plus sorted query parameters, so ?a=1&b=2 and ?b=2&a=1 share an ETag."""
+    params = sorted(request.query_params.multi_items())
+    return request.url.path + "?" + "&".join(f"{k}={v}" for k, v in params)
+
+def make_etag(tables: Iterable[str], variant: str = "") -> str:
+    token = version_token(tables)
+    if variant:
+        token += "-" + hashlib.sha1(variant.encode("utf-8")).hexdigest()[:12]
+    return f'"{token}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [c.strip() for c in header.split(",")]
+    # Weak comparison is what If-None-Match specifies
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+def cache_headers(etag: str, private: bool = False) -> dict:
+    control = PRIVATE_CACHE_CONTROL if private else cache_control()
+    return {"ETag": etag, "Cache-Control": control, "Vary": "Accept-Encoding"}
+
+def not_modified(etag: str, private: bool = False) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag, private))
+
+def cached_response(request: Request, tables: Iterable[str], build: Callable[[], Any], private: bool = False) -> Response:
+    """
+    Serve ``build()`` as JSON with ETag/Cache-Control, or 304 if the client copy is current.
+
+    ``build`` is only called on a miss, so a 304 never queries the database.
+    ``private`` keeps shared caches out and makes browsers revalidate every time.
+    """
+    tables = list(tables)
+    etag = make_etag(tables, request_variant(request))
+    if etag_matches(request, etag):
+        return not_modified(etag, private)
+    content = jsonable_encoder(build())
+    return JSONResponse(content=content, headers=cache_headers(etag, private))
@@ -0,0 +1,54 @@
+"""
+StaticFiles that serve precompressed siblings (``.br`` / ``.gz``) when the
+client accepts them, with cache headers suited to the static JSON export.
+"""
+import mimetypes
+import os
+import stat
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.core.compression import accepted_encodings
+from app.core.http_cache import cache_control
+
+# (suffix, Content-Encoding) in order of preference
+ENCODINGS = ((".br", "br"), (".gz", "gzip"))
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Serve ``foo.json.br`` / ``foo.json.gz`` for ``foo.json`` when accepted.
+
+    Files under ``immutable_prefix`` are content-addressed and cached forever;
+    everything else gets the same Cache-Control as the live endpoints.
+    """
+
+    def __init__(self, *args, immutable_prefix: str = "v/", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.immutable_prefix = immutable_prefix
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        response = None
+        if scope["method"] in ("GET", "HEAD") and not path.endswith((".br", ".gz")):
+            for suffix, encoding in ENCODINGS:
+                if encoding not in accepted:
+                    continue
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+                if stat_result and stat.S_ISREG(stat_result.st_mode):
+                    response = self.file_response(full_path, stat_result, scope)
+                    response.headers["Content-Encoding"] = encoding
+                    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                    response.headers["Content-Type"] = media_type
+                    break
+        if response is None:
+            response = await super().get_response(path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        normalized = path.replace(os.sep, "/").lstrip("/")
+        response.headers["Cache-Control"] = IMMUTABLE if normalized.startswith(self.immutable_prefix) else cache_control()
+        return response
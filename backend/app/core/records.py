@@ -0,0 +1,52 @@
+"""
+Lightweight read layer for list endpoints.
+
+Loading ORM instances for a read-only list pays for identity-map
+bookkeeping, attribute instrumentation and a per-object state, only for the
+caller to copy a few attributes into a dict. These helpers run Core
+``select()`` statements over just the needed columns instead: the driver's
+rows come back as plain tuples and each becomes a ``__slots__`` dataclass
+record (one class per column set), with no per-row dict. orjson serialises
+those dataclasses natively (see snapshots.encode_json); jsonable_encoder and
+pydantic handle them too. Records also answer ``record["id"]`` and
+``record.get("category")`` like the dicts they replace.
+"""
+from dataclasses import make_dataclass
+from functools import lru_cache
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+def columns_of(model, exclude: Sequence[str] = ()) -> list:
+    """All mapped table columns of ``model`` (what admin lists used to serialise)."""
+    return [c for c in model.__table__.columns if c.key not in exclude]
+
+class _MappingAccess:
+    """Dict-style reads on a record, for code written against the old row dicts."""
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+@lru_cache(maxsize=None)
+def record_type(keys: Tuple[str, ...]) -> type:
+    """The slotted record dataclass for one set of column labels (built once per set)."""
+    return make_dataclass("Record", keys, bases=(_MappingAccess,), slots=True)
+
+def fetch_records(db: Session, stmt: Select) -> List[Any]:
+    """Execute a column ``select`` and return one record per row, with a field per column label."""
+    result = db.execute(stmt)
+    record = record_type(tuple(result.keys()))
+    return [record(*row) for row in result.tuples()]
+
+def fetch_all(db: Session, model, order_by=(), exclude: Sequence[str] = ()) -> List[Any]:
+    """Every row of ``model`` as column records, in ``order_by`` order."""
+    return fetch_records(db, select(*columns_of(model, exclude)).order_by(*order_by))
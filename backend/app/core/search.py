@@ -0,0 +1,321 @@
+"""
+Full-text search indexes for blogs, tools and projects.
+
+PostgreSQL gets a GIN index on a ``to_tsvector`` expression per table, and
+queries repeat the exact same expression so the planner can use it.
+SQLite gets an external-content FTS5 table per source table, populated by
+AFTER INSERT/UPDATE/DELETE triggers.
+
+Both mechanisms live inside the database, so every write path (ORM adds and
+deletes in manual_admin.py, bulk ``query(...).delete()`` in admin.py, the
+blog refresh job, migration scripts) keeps the index in sync without any
+application code having to remember to do it.
+
+Tool name/description search (``search_tools``) is typo tolerant: pg_trgm
+GIN indexes with similarity ranking on PostgreSQL, and an FTS5 ``trigram``
+table on SQLite whose candidates are ranked with the same trigram
+similarity computed in Python.
+"""
+import html
+import logging
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.utils.text import trigram_similarity, word_similarity
+
+logger = logging.getLogger(__name__)
+
+# table -> searchable columns (first column is the most important / used as title)
+SEARCH_TABLES: Dict[str, List[str]] = {
+    "blog_posts": ["title", "excerpt", "content", "category"],
+    "ai_tools": ["name", "description", "category"],
+    "projects": ["name", "description", "technologies", "category"],
+}
+
+# Public result type -> (table, title column, column used for the snippet, extra filter)
+SEARCH_TYPES = {
+    "blogs": ("blog_posts", "title", "content", "t.published = TRUE"),
+    "tools": ("ai_tools", "name", "description", None),
+    "projects": ("projects", "name", "description", None),
+}
+
+TS_CONFIG = "english"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# Private-use sentinels the database puts around matches; swapped for <mark> after escaping the text
+_SENTINEL_START = "\ue000"
+_SENTINEL_END = "\ue001"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Fuzzy tool search: trigram-indexed columns and pg_trgm's default thresholds
+TRIGRAM_TABLE = "ai_tools"
+TRIGRAM_COLUMNS = ["name", "description"]
+SIMILARITY_THRESHOLD = 0.3        # pg_trgm.similarity_threshold (name % q)
+WORD_SIMILARITY_THRESHOLD = 0.6   # pg_trgm.word_similarity_threshold (q <% column)
+DESCRIPTION_WEIGHT = 0.6          # description matches rank below name matches
+SQLITE_TRIGRAM_CANDIDATES = 500
+
+def _pg_document(table: str, alias: str = "") -> str:
+    prefix = f"{alias}." if alias else ""
+    parts = " || ' ' || ".join(f"coalesce({prefix}{col}, '')" for col in SEARCH_TABLES[table])
+    return f"to_tsvector('{TS_CONFIG}', {parts})"
+
+def _fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+def _ensure_sqlite(conn) -> None:
+    for table, columns in SEARCH_TABLES.items():
+        fts = _fts_table(table)
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": fts}
+        ).first()
+        cols = ", ".join(columns)
+        new_cols = ", ".join(f"new.{c}" for c in columns)
+        old_cols = ", ".join(f"old.{c}" for c in columns)
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{cols}, content='{table}', content_rowid='id', tokenize='porter unicode61')"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        ))
+        if not exists:
+            # Index rows that were written before the FTS table existed
+            conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+            logger.info("Created FTS5 index %s", fts)
+
+def _ensure_postgres(conn) -> None:
+    for table in SEARCH_TABLES:
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_fts ON {table} USING GIN ({_pg_document(table)})"
+        ))
+
+def _ensure_sqlite_trigram(conn) -> None:
+    fts = f"{TRIGRAM_TABLE}_trgm"
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": fts}
+    ).first()
+    cols = ", ".join(TRIGRAM_COLUMNS)
+    new_cols = ", ".join(f"new.{c}" for c in TRIGRAM_COLUMNS)
+    old_cols = ", ".join(f"old.{c}" for c in TRIGRAM_COLUMNS)
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{TRIGRAM_TABLE}', content_rowid='id', tokenize='trigram')"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {TRIGRAM_TABLE} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {TRIGRAM_TABLE} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {TRIGRAM_TABLE} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+    ))
+    if not exists:
+        conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+        logger.info("Created FTS5 trigram index %s", fts)
+
+def _ensure_postgres_trigram(conn) -> None:
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for col in TRIGRAM_COLUMNS:
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{TRIGRAM_TABLE}_{col}_trgm "
+            f"ON {TRIGRAM_TABLE} USING GIN ({col} gin_trgm_ops)"
+        ))
+
+def ensure_search_indexes(engine: Engine) -> None:
+    """Create the full-text and trigram indexes (and SQLite sync triggers) if they don't exist yet."""
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            _ensure_sqlite(conn)
+        elif engine.dialect.name == "postgresql":
+            _ensure_postgres(conn)
+        else:
+            logger.warning("Full-text search not supported on %s", engine.dialect.name)
+    # Separate transaction: CREATE EXTENSION needs privileges some hosts don't grant
+    try:
+        with engine.begin() as conn:
+            if engine.dialect.name == "sqlite":
+                _ensure_sqlite_trigram(conn)
+            elif engine.dialect.name == "postgresql":
+                _ensure_postgres_trigram(conn)
+    except Exception as e:
+        logger.warning("Trigram index for tool search not available: %s", e)
+
+def rebuild_search_indexes(engine: Engine) -> None:
+    """Rebuild SQLite FTS tables from their source tables (Postgres indexes never drift)."""
+    ensure_search_indexes(engine)
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            for fts in [_fts_table(table) for table in SEARCH_TABLES] + [f"{TRIGRAM_TABLE}_trgm"]:
+                conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+def _fts5_query(q: str) -> Optional[str]:
+    """Turn free text into a safe FTS5 query: every term must match, last term as a prefix."""
+    tokens = _TOKEN_RE.findall(q)
+    if not tokens:
+        return None
+    quoted = [f'"{t}"' for t in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+def _search_sqlite(db: Session, kind: str, q: str, limit: int) -> List[dict]:
+    table, title_col, snippet_col, extra = SEARCH_TYPES[kind]
+    match = _fts5_query(q)
+    if not match:
+        return []
+    fts = _fts_table(table)
+    columns = SEARCH_TABLES[table]
+    snippet_idx = columns.index(snippet_col)
+    # Title matches weigh most, then the snippet column, then the rest
+    weights = ", ".join("10.0" if c == title_col else "2.0" if c == snippet_col else "1.0" for c in columns)
+    where = f"{fts} MATCH :match" + (f" AND {extra}" if extra else "")
+    rows = db.execute(text(
+        f"SELECT t.id AS id, t.{title_col} AS title, t.category AS category, "
+        f"highlight({fts}, 0, :hs, :he) AS title_hl, "
+        f"snippet({fts}, {snippet_idx}, :hs, :he, '…', 24) AS snippet, "
+        f"bm25({fts}, {weights}) AS rank "
+        f"FROM {fts} JOIN {table} t ON t.id = {fts}.rowid "
+        f"WHERE {where} ORDER BY rank LIMIT :limit"
+    ), {"match": match, "hs": _SENTINEL_START, "he": _SENTINEL_END, "limit": limit}).mappings().all()
+    # bm25() is lower-is-better; flip so every backend ranks higher-is-better
+    return [{**dict(r), "score": -float(r["rank"])} for r in rows]
+
+def _search_postgres(db: Session, kind: str, q: str, limit: int) -> List[dict]:
+    table, title_col, snippet_col, extra = SEARCH_TYPES[kind]
+    document = _pg_document(table, "t")
+    options = f"StartSel={_SENTINEL_START}, StopSel={_SENTINEL_END}, MaxWords=35, MinWords=15"
+    where = f"{document} @@ query" + (f" AND {extra}" if extra else "")
+    rows = db.execute(text(
+        f"SELECT t.id AS id, t.{title_col} AS title, t.category AS category, "
+        f"ts_headline('{TS_CONFIG}', coalesce(t.{title_col}, ''), query, :opts) AS title_hl, "
+        f"ts_headline('{TS_CONFIG}', coalesce(t.{snippet_col}, ''), query, :opts) AS snippet, "
+        f"ts_rank_cd(setweight(to_tsvector('{TS_CONFIG}', coalesce(t.{title_col}, '')), 'A') || {document}, query) AS rank "
+        f"FROM {table} t, websearch_to_tsquery('{TS_CONFIG}', :q) query "
+        f"WHERE {where} ORDER BY rank DESC LIMIT :limit"
+    ), {"q": q, "opts": options, "limit": limit}).mappings().all()
+    return [{**dict(r), "score": float(r["rank"])} for r in rows]
+
+def _highlight_html(marked: Optional[str]) -> Optional[str]:
+    """HTML-escape database text, then turn the match sentinels into <mark> tags."""
+    if marked is None:
+        return None
+    return html.escape(marked).replace(_SENTINEL_START, HIGHLIGHT_START).replace(_SENTINEL_END, HIGHLIGHT_END)
+
+def search(db: Session, q: str, types: Optional[List[str]] = None, limit: int = 20) -> Dict[str, object]:
+    """
+    Ranked, highlighted search across blogs, tools and projects.
+
+    Returns:
+        dict: ``items`` merged across types ordered by score, plus per-type ``counts``.
+        ``title_highlighted`` and ``snippet`` are HTML (escaped text with <mark> tags).
+
+    bm25 and ts_rank_cd scores aren't comparable across tables, so each
+    type's scores are scaled to its best match (1.0) before merging; ties
+    keep each type's own rank order.
+    """
+    dialect = db.get_bind().dialect.name
+    runner = _search_postgres if dialect == "postgresql" else _search_sqlite
+    kinds = [k for k in (types or SEARCH_TYPES) if k in SEARCH_TYPES]
+
+    items, counts = [], {}
+    for kind in kinds:
+        rows = runner(db, kind, q, limit)
+        counts[kind] = len(rows)
+        best = max((r["score"] for r in rows), default=0.0)
+        for position, r in enumerate(rows):
+            items.append((position, {
+                "type": kind,
+                "id": r["id"],
+                "title": r["title"],
+                "title_highlighted": _highlight_html(r["title_hl"]),
+                "snippet": _highlight_html(r["snippet"]),
+                "category": r["category"],
+                "score": round(r["score"] / best, 4) if best > 0 else 0.0,
+            }))
+    items.sort(key=lambda entry: (-entry[1]["score"], entry[0]))
+    return {"items": [item for _, item in items[:limit]], "counts": counts}
+
+def _tool_ids_postgres(db: Session, q: str, category: Optional[str], limit: int) -> List[int]:
+    # %, <% and ILIKE are all served by the gin_trgm_ops indexes
+    where = (
+        "(t.name % :q OR :q <% t.name OR :q <% t.description "
+        "OR t.name ILIKE :like OR t.description ILIKE :like)"
+    )
+    if category:
+        where += " AND t.category = :category"
+    rows = db.execute(text(
+        "SELECT t.id FROM ai_tools t "
+        f"WHERE {where} "
+        "ORDER BY greatest(similarity(t.name, :q), word_similarity(:q, t.name), "
+        "word_similarity(:q, t.description) * :dw, "
+        "CASE WHEN t.name ILIKE :like THEN 1.0 ELSE 0.0 END) DESC, "
+        "t.display_order ASC, t.id DESC LIMIT :limit"
+    ), {"q": q, "like": f"%{q}%", "category": category, "dw": DESCRIPTION_WEIGHT, "limit": limit}).all()
+    return [r[0] for r in rows]
+
+def _tool_score(q: str, name: str, description: str) -> float:
+    """Python equivalent of the Postgres ranking expression (0 = not a match)."""
+    needle = q.lower()
+    name, description = name or "", description or ""
+    name_sim = max(trigram_similarity(q, name), word_similarity(q, name))
+    desc_sim = word_similarity(q, description)
+    if needle in name.lower():
+        return 1.0
+    if name_sim >= SIMILARITY_THRESHOLD or desc_sim >= WORD_SIMILARITY_THRESHOLD or needle in description.lower():
+        return max(name_sim, desc_sim * DESCRIPTION_WEIGHT, 0.01)
+    return 0.0
+
+def _tool_ids_sqlite(db: Session, q: str, category: Optional[str], limit: int) -> List[int]:
+    fts = f"{TRIGRAM_TABLE}_trgm"
+    needle = q.lower()
+    grams = {needle[i:i + 3] for i in range(len(needle) - 2)}
+    grams = [g for g in grams if '"' not in g]
+    if not grams:
+        return []
+    # Any shared trigram makes a candidate; the index does the narrowing, Python the ranking
+    match = " OR ".join(f'"{g}"' for g in grams)
+    where = f"{fts} MATCH :match" + (" AND t.category = :category" if category else "")
+    rows = db.execute(text(
+        f"SELECT t.id, t.name, t.description, t.display_order FROM {fts} "
+        f"JOIN ai_tools t ON t.id = {fts}.rowid WHERE {where} "
+        f"ORDER BY bm25({fts}) LIMIT :cand"
+    ), {"match": match, "category": category, "cand": SQLITE_TRIGRAM_CANDIDATES}).all()
+    scored = [(_tool_score(q, r.name, r.description), r.display_order or 0, r.id) for r in rows]
+    scored = [s for s in scored if s[0] > 0]
+    scored.sort(key=lambda s: (-s[0], s[1], -s[2]))
+    return [s[2] for s in scored[:limit]]
+
+def search_tools(db: Session, q: str, category: Optional[str] = None, limit: int = 20) -> Optional[List[int]]:
+    """
+    Typo-tolerant tool search over name and description, best match first.
+
+    Returns:
+        list: matching tool ids in rank order, or None when the query is too
+        short for trigrams (callers should fall back to a plain LIKE filter)
+    """
+    q = (q or "").strip()
+    if len(q) < 3:
+        return None
+    if db.get_bind().dialect.name == "postgresql":
+        return _tool_ids_postgres(db, q, category, limit)
+    return _tool_ids_sqlite(db, q, category, limit)
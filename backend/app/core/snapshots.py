@@ -0,0 +1,155 @@
+"""
+Pre-encoded JSON snapshots of the public list endpoints.
+
+The first request for a given list (path + normalised query string) builds
+the payload from the database once, encodes it to bytes and keeps it in
+memory, tagged with the table versions it was built from. Later requests
+with the same versions get those bytes back as a raw ``Response``: no
+session, no ORM objects, no serialisation.
+
+When a commit changes a tracked table (see change_tracking), every snapshot
+that depends on it is rebuilt by a background thread, so the next reader
+still finds ready-made bytes. A snapshot is only served while its versions
+match the current ones, so a rebuild that hasn't finished yet falls back to
+building the response live instead of serving stale content.
+"""
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, List, Tuple
+
+from fastapi import HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.change_tracking import on_change, version_token
+from app.core.http_cache import cache_headers, etag_matches, make_etag, not_modified, request_variant
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on distinct (path, query) variants kept in memory
+MAX_SNAPSHOTS = 128
+
+Builder = Callable[[Session], Any]
+
+@dataclass
+class Snapshot:
+    tables: Tuple[str, ...]
+    builder: Builder
+    token: str = ""
+    body: bytes = b""
+    etag: str = ""
+
+_snapshots: "OrderedDict[str, Snapshot]" = OrderedDict()
+_lock = threading.Lock()
+_dirty = threading.Event()
+_worker = None
+
+def _orjson_default(value: Any) -> Any:
+    # Open pydantic models one level at a time (model_dump would turn every record into a dict)
+    if isinstance(value, BaseModel):
+        return dict(value)
+    return jsonable_encoder(value)
+
+def encode_json(payload: Any) -> bytes:
+    """Encode an API payload (pydantic models, dicts, records, datetimes) to compact JSON bytes."""
+    if orjson is not None:
+        # orjson walks dicts/lists/dataclass records/datetimes natively; only exotic values go through jsonable_encoder
+        return orjson.dumps(payload, default=_orjson_default)
+    content = jsonable_encoder(payload)
+    return json.dumps(content, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def _build(key: str, snap: Snapshot, db: Session) -> bool:
+    """Fill ``snap`` from the database; returns False if a write landed meanwhile (don't cache it)."""
+    # Capture versions before reading so a concurrent commit makes this build stale, never mislabelled
+    token = version_token(snap.tables)
+    snap.body = encode_json(snap.builder(db))
+    if token != version_token(snap.tables):
+        return False
+    snap.token, snap.etag = token, make_etag(snap.tables, key)
+    return True
+
+def _store(key: str, snap: Snapshot) -> None:
+    with _lock:
+        _snapshots[key] = snap
+        _snapshots.move_to_end(key)
+        while len(_snapshots) > MAX_SNAPSHOTS:
+            _snapshots.popitem(last=False)
+
+def _raw_response(request: Request, snap: Snapshot) -> Response:
+    if etag_matches(request, snap.etag):
+        return not_modified(snap.etag)
+    return Response(content=snap.body, media_type="application/json", headers=cache_headers(snap.etag))
+
+def snapshot_response(request: Request, tables: List[str], builder: Builder, db: Session) -> Response:
+    """
+    Serve the snapshot for this request's path and query, building it on a miss.
+
+    ``builder(db)`` must depend only on the request parameters it closes over,
+    since it is re-run in the background with a fresh session after writes.
+    HTTPExceptions raised by the builder (bad cursor, ...) propagate unchanged.
+    """
+    key = request_variant(request)
+    snap = _snapshots.get(key)
+    if snap is not None and snap.token == version_token(snap.tables):
+        return _raw_response(request, snap)
+
+    snap = Snapshot(tables=tuple(tables), builder=builder)
+    if _build(key, snap, db):
+        _store(key, snap)
+        return _raw_response(request, snap)
+    # Content changed while building: serve this result once, without an ETag
+    return Response(content=snap.body, media_type="application/json", headers={"Cache-Control": "no-cache"})
+
+def _rebuild_stale() -> None:
+    from app.database import SessionLocal
+
+    with _lock:
+        stale = [(k, s) for k, s in _snapshots.items() if s.token != version_token(s.tables)]
+    if not stale:
+        return
+    db = SessionLocal()
+    try:
+        for key, snap in stale:
+            fresh = Snapshot(tables=snap.tables, builder=snap.builder)
+            try:
+                if _build(key, fresh, db):
+                    with _lock:
+                        if key in _snapshots:
+                            _snapshots[key] = fresh
+            except HTTPException:
+                # e.g. the cursor now points past the end; let the next request decide
+                with _lock:
+                    _snapshots.pop(key, None)
+            except Exception as e:
+                logger.warning("Snapshot rebuild failed for %s: %s", key, e)
+    finally:
+        db.close()
+
+def _run_worker() -> None:
+    while True:
+        _dirty.wait()
+        _dirty.clear()
+        try:
+            _rebuild_stale()
+        except Exception as e:
+            logger.warning("Snapshot rebuild pass failed: %s", e)
+
+def _on_tables_changed(tables: set) -> None:
+    global _worker
+    if _worker is None:
+        with _lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_run_worker, name="snapshot-rebuild", daemon=True)
+                _worker.start()
+    _dirty.set()
+
+on_change(_on_tables_changed)
@@ -0,0 +1,160 @@
+"""
+Application init steps, run in the background after the app starts serving.
+
+The lifespan handler in main.py only launches ``run_startup()`` and yields,
+so uvicorn accepts connections as soon as the modules are imported and the
+dyno boot no longer waits on the database, the seed data or Supabase.
+
+Independent steps run concurrently (each blocking step in a worker thread):
+
+    database -> search_indexes
+             -> seed -> static_export
+             -> jobs
+    storage
+    scheduler
+
+``/health/live`` only says the process is up; ``/health/ready`` reports
+every step and returns 503 until the ``REQUIRED_STEPS`` have succeeded.
+"""
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+from app.config import settings
+
+STEP_NAMES = ("database", "search_indexes", "seed", "static_export", "jobs", "storage", "scheduler")
+# Steps that must succeed before the app can answer content requests
+REQUIRED_STEPS = ("database", "search_indexes")
+
+_steps: Dict[str, dict] = {name: {"status": "pending"} for name in STEP_NAMES}
+_started_at: Optional[float] = None
+
+def _init_database() -> str:
+    from app.database import Base, engine
+    import app.models  # noqa: F401 - register every table on Base.metadata
+    Base.metadata.create_all(bind=engine)
+    return "Database tables initialized"
+
+def _init_search_indexes() -> str:
+    from app.core.search import ensure_search_indexes
+    from app.database import engine
+    ensure_search_indexes(engine)
+    return "Search indexes ready"
+
+def _seed_if_empty() -> str:
+    """Populate the sample data, but only on a completely empty database (first deployment)."""
+    from app.database import SessionLocal
+    from app.services.stats_service import get_content_stats
+
+    db = SessionLocal()
+    try:
+        stats = get_content_stats(db, max_age=0)
+        tools_count = stats["tools"]["total"]
+        projects_count = stats["projects"]["total"]
+        blogs_count = stats["blogs"]["total"]
+        print(f"📊 Database status: {tools_count} tools, {projects_count} projects, {blogs_count} blogs")
+        if tools_count or projects_count or blogs_count:
+            return "Database has existing data - PostgreSQL persistence working!"
+        print("📝 Database is empty, populating with sample data...")
+        from app.api.v1.admin import populate_database
+        return f"Sample data populated: {populate_database(db)}"
+    finally:
+        db.close()
+
+def _build_static_export() -> str:
+    if not settings.STATIC_EXPORT_ENABLED:
+        return "skipped"
+    from app.database import SessionLocal
+    from app.services.static_export import export_static
+    db = SessionLocal()
+    try:
+        result = export_static(db)
+        return f"Static export ready: {len(result['written'])} files written"
+    finally:
+        db.close()
+
+def _recover_jobs() -> str:
+    from app.services.job_queue import recover_jobs
+    recovered = recover_jobs()
+    return f"Job queue ready ({recovered['requeued']} re-queued, {recovered['interrupted']} interrupted)"
+
+def _init_storage() -> str:
+    from app.core.storage import get_storage_service
+    if get_storage_service().is_configured():
+        return "Supabase Storage ready for uploads"
+    return "Supabase Storage not configured - images will use local storage"
+
+def _start_scheduler() -> str:
+    from app.services.scheduler import start_scheduler
+    start_scheduler()
+    return "Scheduler started"
+
+async def _step(name: str, fn: Callable[[], str]) -> bool:
+    """Run one blocking step in a worker thread, recording status and duration. True on success."""
+    step = _steps[name]
+    step.update(status="running", started=time.monotonic())
+    try:
+        message = await asyncio.to_thread(fn)
+    except Exception as e:
+        step.update(status="failed", error=str(e) or type(e).__name__)
+        print(f"⚠️  Warning: startup step '{name}' failed: {e}")
+        return False
+    finally:
+        step["seconds"] = round(time.monotonic() - step.pop("started"), 3)
+    if message == "skipped":
+        step["status"] = "skipped"
+    else:
+        step.update(status="ok", message=message)
+        print(f"✅ {message}")
+    return True
+
+def _skip(*names: str) -> None:
+    for name in names:
+        _steps[name].update(status="skipped", error="database unavailable")
+
+async def _database_chain() -> None:
+    if not await _step("database", _init_database):
+        print("⚠️  App will continue but database features may not work")
+        _skip("search_indexes", "seed", "static_export", "jobs")
+        return
+
+    async def seed_then_export() -> None:
+        await _step("seed", _seed_if_empty)
+        await _step("static_export", _build_static_export)
+
+    await asyncio.gather(
+        _step("search_indexes", _init_search_indexes),
+        seed_then_export(),
+        _step("jobs", _recover_jobs),
+    )
+
+async def run_startup() -> None:
+    """Run every init step; failures are recorded and reported, never raised."""
+    global _started_at
+    _started_at = time.monotonic()
+    print(f"📊 Database URL configured: {'Yes' if settings.DATABASE_URL else 'No'}")
+    await asyncio.gather(
+        _database_chain(),
+        _step("storage", _init_storage),
+        _step("scheduler", _start_scheduler),
+    )
+    elapsed = time.monotonic() - _started_at
+    failed = [name for name, step in _steps.items() if step["status"] == "failed"]
+    if failed:
+        print(f"⚠️  Startup finished in {elapsed:.2f}s with failed steps: {', '.join(failed)}")
+    else:
+        print(f"✅ Application startup complete in {elapsed:.2f}s")
+
+def readiness() -> dict:
+    """{"ready", "steps"} - ready once every REQUIRED_STEPS entry has succeeded."""
+    steps = {}
+    for name, step in _steps.items():
+        info = dict(step)
+        if "started" in info:
+            info["seconds"] = round(time.monotonic() - info.pop("started"), 3)
+        info["required"] = name in REQUIRED_STEPS
+        steps[name] = info
+    return {
+        "ready": all(_steps[name]["status"] == "ok" for name in REQUIRED_STEPS),
+        "steps": steps,
+    }
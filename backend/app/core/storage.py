@@ -2,22 +2,25 @@
 Supabase Storage Service for Persistent Image Uploads
 
 This module handles file uploads to Supabase Storage, ensuring images
-persist across Heroku dyno restarts and deployments.
+persist across Heroku dyno restarts and deployments. The supabase client
+library is only imported when credentials are configured.
 """
 
 import os
 import uuid
-from typing import Optional
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, Optional
 from app.config import settings
 import httpx
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 class StorageService:
     """Service for managing file uploads to Supabase Storage."""
     
     def __init__(self):
         """Initialize Supabase client if credentials are configured."""
-        self.client: Optional[Client] = None
+        self.client: Optional["Client"] = None
         self.bucket: str = settings.SUPABASE_STORAGE_BUCKET
         
         # Debug: Check what values are being read
@@ -51,6 +54,7 @@ class StorageService:
         # Only initialize if Supabase is configured
         if supabase_url and supabase_key and supabase_url != "https://your-project.supabase.co" and supabase_key != "your-supabase-anon-key":
             try:
+                from supabase import create_client
                 self.client = create_client(supabase_url, supabase_key)
                 print(f"✅ Supabase Storage initialized (bucket: {self.bucket})")
             except Exception as e:
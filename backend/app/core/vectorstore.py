@@ -1,9 +1,9 @@
 """
 ChromaDB wrapper for storing your CV + portfolio notes and running RAG-like retrieval.
 Uses local ChromaDB SQLite database integrated into the FastAPI backend.
+chromadb is imported on first use - it is by far the slowest import in the app.
 """
 import os
-import chromadb
 from typing import List, Tuple
 import logging
 from pathlib import Path
@@ -27,6 +27,7 @@ def get_chroma_client():
         os.makedirs(CHROMADB_PATH, exist_ok=True)
         
         # Create persistent client
+        import chromadb
         client = chromadb.PersistentClient(path=CHROMADB_PATH)
         
         # Get or create collection
@@ -1,21 +1,58 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker,declarative_base
 from app.config import settings
+from app.core.change_tracking import register_session_events
+from app.core.db_pool import configure_engine, engine_options
 
-# create a database engine
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {})
+# create a database engine (pool sizing / SQLite pragmas: see core/db_pool.py)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL, "sync"))
+configure_engine(engine, "sync")
 
 # session local will be used for DB session
 
 SessionLocal = sessionmaker(autocommit=False,autoflush=False,bind=engine)
 
+def async_database_url(url: str) -> str:
+    """The same database through its asyncio driver: asyncpg for Postgres, aiosqlite for SQLite."""
+    parsed = make_url(url.replace("postgres://", "postgresql://", 1))
+    backend = parsed.get_backend_name()
+    if backend == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+        # asyncpg spells libpq's sslmode as ssl
+        if "sslmode" in parsed.query:
+            query = dict(parsed.query)
+            query["ssl"] = query.pop("sslmode")
+            parsed = parsed.set(query=query)
+    elif backend == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+# async engine for async def route handlers, so their queries don't block the event loop.
+# Same database and the same Session event hooks (AsyncSession wraps a regular Session).
+ASYNC_DATABASE_URL = async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL, "async", is_async=True))
+configure_engine(async_engine.sync_engine, "async")
+
+# expire_on_commit=False: attributes can't be lazy-loaded after commit in async code
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 # base class for models
 Base = declarative_base()
 
+# bump per-table content versions on every committed write (used for ETags)
+register_session_events()
+
 # dependency to get a database session
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# dependency to get an async database session (for async def handlers)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -3,7 +3,7 @@ DanPortfolio Backend - Main FastAPI Application
 
 This module serves as the entry point for the DanPortfolio backend API.
 It configures the FastAPI application with all necessary middleware,
-routers, and startup/shutdown events.
+routers, and the startup/shutdown lifespan.
 
 Key Features:
 - RESTful API with automatic OpenAPI documentation
@@ -17,16 +17,35 @@ Repository: https://github.com/daniyalareeb/portfolio
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.config import settings
 
 # Import all API routers for modular organization
-from app.api.v1 import chat, news, tools, cv, contact, projects, admin, manual_admin, auth, data_backup
+from app.api.v1 import chat, news, tools, cv, contact, projects, admin, manual_admin, auth, data_backup, search, home, changes, jobs
 
 # Import scheduler for background tasks
-from app.services.scheduler import start_scheduler, get_scheduler_status
+from app.services.scheduler import stop_scheduler, get_scheduler_status
+from app.core.startup import readiness, run_startup
+from app.core.db_pool import pool_metrics
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup/shutdown handler.
+    
+    Init steps (tables, search indexes, seeding, storage, scheduler...) run in
+    the background so the app serves right away; /health/ready reports when
+    the database is usable.
+    """
+    print(f"🚀 Starting DanPortfolio Backend...")
+    init_task = asyncio.create_task(run_startup())
+    yield
+    init_task.cancel()
+    stop_scheduler()
 
 # Initialize FastAPI application with project metadata
 app = FastAPI(
@@ -34,7 +53,8 @@ app = FastAPI(
     description="AI-powered portfolio backend with automated content generation",
     version="1.0.0",
     docs_url="/docs",  # Swagger UI documentation
-    redoc_url="/redoc"  # ReDoc documentation
+    redoc_url="/redoc",  # ReDoc documentation
+    lifespan=lifespan
 )
 
 # Configure CORS middleware for frontend integration
@@ -54,6 +74,15 @@ app.add_middleware(
     allow_headers=["*"],     # Allow all headers
 )
 
+# Compress JSON/text responses (gzip or brotli); compressed snapshot bodies are memoised
+from app.core.compression import CompressionMiddleware
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    memo_bytes=settings.COMPRESSION_MEMO_MB * 1024 * 1024,
+    thread_min_size=settings.COMPRESSION_THREAD_MIN_SIZE,
+)
+
 # Mount API routers with versioned prefixes
 # Each router handles a specific domain of functionality
 app.include_router(chat.router, prefix=settings.API_V1_STR, tags=["chat"])
@@ -66,6 +95,10 @@ app.include_router(admin.router, prefix=settings.API_V1_STR, tags=["admin"])
 app.include_router(manual_admin.router, prefix=settings.API_V1_STR, tags=["manual-admin"])
 app.include_router(auth.router, prefix=settings.API_V1_STR, tags=["auth"])
 app.include_router(data_backup.router, prefix=settings.API_V1_STR, tags=["data-backup"])
+app.include_router(search.router, prefix=settings.API_V1_STR, tags=["search"])
+app.include_router(home.router, prefix=settings.API_V1_STR, tags=["home"])
+app.include_router(changes.router, prefix=settings.API_V1_STR, tags=["changes"])
+app.include_router(jobs.router, prefix=settings.API_V1_STR, tags=["jobs"])
 
 # Mount static file serving for uploaded images and assets
 # This allows serving files uploaded through the admin interface
@@ -76,77 +109,11 @@ static_dir = os.path.join(os.environ.get('VOLUME_MOUNT_PATH', './data'), 'upload
 os.makedirs(static_dir, exist_ok=True)
 app.mount("/static/uploads", StaticFiles(directory=static_dir), name="static-uploads")
 
-@app.on_event("startup")
-async def on_startup():
-    """
-    Application startup event handler.
-    
-    Using PostgreSQL for reliable data persistence across deployments.
-    """
-    from app.database import engine, Base
-    from app.config import settings
-    import os
-    
-    print(f"🚀 Starting DanPortfolio Backend...")
-    print(f"📊 Database URL configured: {'Yes' if settings.DATABASE_URL else 'No'}")
-    
-    # Initialize database tables - don't crash if DB unavailable
-    try:
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables initialized")
-    except Exception as e:
-        print(f"⚠️  Warning: Could not initialize database tables: {e}")
-        print("⚠️  App will continue but database features may not work")
-    
-    # Simple check: only populate if database is completely empty
-    try:
-        from app.database import get_db
-        from app.models import Tool, Project, BlogPost
-        
-        db = next(get_db())
-        tools_count = db.query(Tool).count()
-        projects_count = db.query(Project).count()
-        blogs_count = db.query(BlogPost).count()
-        
-        print(f"📊 Database status: {tools_count} tools, {projects_count} projects, {blogs_count} blogs")
-        
-        # Only populate if completely empty (first deployment)
-        if tools_count == 0 and projects_count == 0 and blogs_count == 0:
-            print("📝 Database is empty, populating with sample data...")
-            try:
-                from app.api.v1.admin import populate_database
-                result = populate_database(db)
-                print(f"✅ Sample data populated: {result}")
-            except Exception as e:
-                print(f"⚠️  Could not populate sample data: {e}")
-        else:
-            print("✅ Database has existing data - PostgreSQL persistence working!")
-        db.close()
-            
-    except Exception as e:
-        print(f"⚠️  Warning: Database connection issue during startup: {e}")
-        print("⚠️  App will start but database features may be limited")
-    
-    # Initialize Supabase Storage to verify configuration
-    try:
-        from app.core.storage import get_storage_service
-        storage_service = get_storage_service()  # This will trigger initialization and debug logs
-        if storage_service.is_configured():
-            print("✅ Supabase Storage ready for uploads")
-        else:
-            print("⚠️  Supabase Storage not configured - images will use local storage")
-    except Exception as e:
-        print(f"⚠️  Warning: Could not initialize storage service: {e}")
-    
-    # Start background scheduler for automated content updates
-    try:
-        start_scheduler()
-        print("✅ Scheduler started")
-    except Exception as e:
-        print(f"⚠️  Warning: Could not start scheduler: {e}")
-        print("⚠️  App will continue but automated updates will not run")
-    
-    print("✅ Application startup complete!")
+# Precompressed static JSON export of the public lists (see services/static_export.py)
+from app.core.precompressed import PrecompressedStaticFiles
+from app.services.static_export import export_dir
+os.makedirs(export_dir(), exist_ok=True)
+app.mount("/static/export", PrecompressedStaticFiles(directory=export_dir()), name="static-export")
 
 @app.get("/")
 def root():
@@ -168,6 +135,39 @@ def health():
     """
     return {"ok": True}
 
+@app.get("/health/live")
+def health_live():
+    """
+    Liveness probe: the process is up and serving requests.
+    
+    Returns:
+        dict: Always {"ok": True}; doesn't touch the database
+    """
+    return {"ok": True}
+
+@app.get("/health/ready")
+def health_ready():
+    """
+    Readiness probe: 200 once the database tables and search indexes are
+    initialized, 503 before that (or if they failed).
+    
+    Returns:
+        dict: {"ready", "steps"} with each startup step's status and duration
+    """
+    state = readiness()
+    return JSONResponse(state, status_code=200 if state["ready"] else 503)
+
+@app.get("/metrics/db-pool")
+def db_pool_metrics():
+    """
+    Database connection pool metrics for the sync and async engines.
+    
+    Returns:
+        dict: Per engine: pool size, checked-out connections, overflow,
+        checkout count, timeouts and checkout wait times (avg/p50/p95/max ms)
+    """
+    return pool_metrics()
+
 @app.get("/api/v1/scheduler/status")
 def scheduler_status():
     """
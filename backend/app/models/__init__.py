@@ -5,6 +5,9 @@ from .chat import ChatMessage
 from .cv import CVChunk
 from .contact import ContactSubmission
 from .project import Project
+from .feed_source import FeedSource
+from .tombstone import Tombstone
+from .job import AdminJob
 
 __all__ = [
     "BlogPost",
@@ -13,4 +16,7 @@ __all__ = [
     "CVChunk",
     "ContactSubmission",
     "Project",
+    "FeedSource",
+    "Tombstone",
+    "AdminJob",
 ]
@@ -1,5 +1,5 @@
 # app/models/blog.py
-from sqlalchemy import Column, String, Text, Boolean, DateTime, Integer
+from sqlalchemy import Column, String, Text, Boolean, DateTime, Integer, BigInteger, Index
 from app.database import Base
 from datetime import datetime
 
@@ -17,4 +17,16 @@ class BlogPost(Base):
     source = Column(String(200), nullable=True)
     display_order = Column(Integer, default=0)             # for global custom ordering
     published_date = Column(DateTime, default=datetime.now)
-    last_updated = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    # SimHash of title + source text (signed 64-bit) and its 16-bit bands for near-duplicate lookup
+    simhash = Column(BigInteger, nullable=True)
+    simhash_band0 = Column(Integer, nullable=True, index=True)
+    simhash_band1 = Column(Integer, nullable=True, index=True)
+    simhash_band2 = Column(Integer, nullable=True, index=True)
+    simhash_band3 = Column(Integer, nullable=True, index=True)
+
+# List order (display_order ASC, id DESC), category filter + list order, and the
+# url lookup used to skip already-stored posts during ingestion
+Index("ix_blog_posts_display_order_id", BlogPost.display_order, BlogPost.id.desc())
+Index("ix_blog_posts_category_display_order_id", BlogPost.category, BlogPost.display_order, BlogPost.id.desc())
+Index("ix_blog_posts_url", BlogPost.url)
@@ -0,0 +1,14 @@
+# app/models/feed_source.py
+from sqlalchemy import Column, String, DateTime, Integer
+from app.database import Base
+from datetime import datetime
+
+class FeedSource(Base):
+    """Per-feed high-water mark so refreshes only process entries newer than the last run."""
+    __tablename__ = "feed_sources"
+
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String(500), nullable=False, unique=True)
+    last_published = Column(DateTime, nullable=True)       # newest published_parsed seen
+    last_guid = Column(String(500), nullable=True)         # GUID of the newest entry seen
+    last_checked = Column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -0,0 +1,20 @@
+# app/models/job.py
+from sqlalchemy import Column, String, DateTime, Float, Text, JSON
+from app.database import Base
+from datetime import datetime
+
+class AdminJob(Base):
+    """A long-running admin operation run by the in-process job queue (see services/job_queue.py)."""
+    __tablename__ = "admin_jobs"
+
+    id = Column(String(32), primary_key=True)                # uuid4 hex, also the /jobs/{id} capability
+    kind = Column(String(50), nullable=False, index=True)    # registered handler name
+    status = Column(String(20), nullable=False, default="queued", index=True)  # queued/running/succeeded/failed/interrupted
+    progress = Column(Float, nullable=False, default=0.0)    # 0.0 - 1.0
+    message = Column(String(500), nullable=True)             # latest progress message
+    params = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
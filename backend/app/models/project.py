@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Text, Integer
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index
 from app.database import Base
+from datetime import datetime
 
 class Project(Base):
     __tablename__ = "projects"
@@ -13,3 +14,8 @@ class Project(Base):
     technologies = Column(String(500), nullable=True)
     image_url = Column(String(500), nullable=True)
     display_order = Column(Integer, default=0)             # for global custom ordering
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # for /changes
+
+# List order (display_order ASC, id DESC) and category filter + list order
+Index("ix_projects_display_order_id", Project.display_order, Project.id.desc())
+Index("ix_projects_category_display_order_id", Project.category, Project.display_order, Project.id.desc())
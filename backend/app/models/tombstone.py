@@ -0,0 +1,13 @@
+# app/models/tombstone.py
+from sqlalchemy import Column, String, DateTime, Integer
+from app.database import Base
+from datetime import datetime
+
+class Tombstone(Base):
+    """Record of a deleted content row, so delta-sync clients can drop it too."""
+    __tablename__ = "tombstones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    table_name = Column(String(50), nullable=False)
+    row_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index
 from sqlalchemy.sql import func
+from datetime import datetime
 from app.database import Base
 
 class Tool(Base):
@@ -17,3 +18,10 @@ class Tool(Base):
     source = Column(String(255), nullable=True)            # where we found it
     auto_fetched = Column(Boolean, default=False)          # was it added by the agent?
     last_checked = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # for /changes
+
+# List order (display_order ASC, id DESC), category filter + list order, and the
+# manual/auto-fetched split in the admin stats. url already has a unique index.
+Index("ix_ai_tools_display_order_id", Tool.display_order, Tool.id.desc())
+Index("ix_ai_tools_category_display_order_id", Tool.category, Tool.display_order, Tool.id.desc())
+Index("ix_ai_tools_auto_fetched_category", Tool.auto_fetched, Tool.category)
@@ -1,14 +1,21 @@
 import html
 import logging
+from contextlib import aclosing
 from datetime import datetime
 from typing import List
-import feedparser
 import httpx
-from bs4 import BeautifulSoup
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.models.blog import BlogPost
+from app.models.feed_source import FeedSource
 from app.database import SessionLocal
+from app.config import settings
+from app.core.feed_stream import iter_feed_entries, FeedStreamError
+from app.utils.profiling import stage
+from app.utils.text import (
+    simhash, simhash_bands, hamming_distance, to_signed64, from_signed64, NEAR_DUPLICATE_DISTANCE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +34,9 @@ BLOG_SOURCES = [
     "https://www.artificialintelligence-news.com/feed/",  # AI News
 ]
 
+# Upper bound on entries inspected per source, as a multiple of limit_per_source
+MAX_SCAN_FACTOR = 4
+
 BLOG_CATEGORIES = [
     "AI Research & Development", "Machine Learning", "AI Applications", 
     "AI Business & Industry", "AI Ethics & Policy", "AI Tools & Platforms", 
@@ -164,6 +174,7 @@ def _parse_blog_entry(entry):
     
     # Remove HTML tags from summary - more aggressive cleaning
     try:
+        from bs4 import BeautifulSoup
         soup = BeautifulSoup(summary, 'html.parser')
         # Remove script and style elements
         for script in soup(["script", "style"]):
@@ -200,6 +211,9 @@ def _parse_blog_entry(entry):
         except:
             pass
     
+    # Fingerprint the source text before enhancement adds shared boilerplate
+    fingerprint = simhash(f"{title} {summary}")
+    
     # Ensure content is substantial and create longer summaries
     if len(summary) < 100:
         summary = f"{summary} This article provides insights into the latest developments and trends in the field."
@@ -213,58 +227,199 @@ def _parse_blog_entry(entry):
         "excerpt": enhanced_content[:500] + "..." if len(enhanced_content) > 500 else enhanced_content,
         "content": enhanced_content,
         "published_date": published_date,
-        "source": "RSS Feed"
+        "source": "RSS Feed",
+        "simhash": fingerprint
     }
 
-async def fetch_blogs_from_source(url: str, limit_per_source: int = 5):
-    """Fetch blogs from a single source."""
+def _fingerprint_columns(fingerprint: int) -> dict:
+    """BlogPost column values for a SimHash fingerprint."""
+    columns = {"simhash": to_signed64(fingerprint)}
+    for i, band in enumerate(simhash_bands(fingerprint)):
+        columns[f"simhash_band{i}"] = band
+    return columns
+
+def _find_near_duplicate(db: Session, fingerprint: int, url: str):
+    """Return an existing post (other than ``url``) whose fingerprint is within NEAR_DUPLICATE_DISTANCE bits."""
+    bands = simhash_bands(fingerprint)
+    band_filters = [getattr(BlogPost, f"simhash_band{i}") == band for i, band in enumerate(bands)]
+    candidates = db.query(BlogPost.id, BlogPost.url, BlogPost.simhash).filter(or_(*band_filters)).all()
+    for candidate in candidates:
+        if candidate.url == url or candidate.simhash is None:
+            continue
+        if hamming_distance(from_signed64(candidate.simhash), fingerprint) <= NEAR_DUPLICATE_DISTANCE:
+            return candidate
+    return None
+
+def _entry_guid(entry) -> str:
+    """Stable identifier for a feed entry (GUID/id, falling back to the link)."""
+    return (getattr(entry, "id", "") or getattr(entry, "guid", "") or getattr(entry, "link", "") or "").strip()
+
+def _entry_published(entry):
+    """Published (or updated) timestamp of a feed entry as a datetime, if present."""
+    published = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
+    if published:
+        try:
+            return datetime(*published[:6])
+        except Exception:
+            pass
+    return None
+
+def _is_behind_mark(entry, mark: FeedSource | None) -> bool:
+    """True if the entry is older than the source's high-water mark, or is the marked entry itself.
+
+    Feeds often date entries to the second or minute, so an entry with the
+    same timestamp as the mark but a different GUID is new, not behind.
+    """
+    if mark is None:
+        return False
+    published = _entry_published(entry)
+    if not (published and mark.last_published):
+        return False
+    if published == mark.last_published:
+        return bool(mark.last_guid) and _entry_guid(entry) == mark.last_guid
+    return published < mark.last_published
+
+async def _iter_list(entries):
+    """Adapt an already-parsed entry list to the async iteration used by the streaming reader."""
+    for entry in entries:
+        yield entry
+
+async def _collect_blogs(entries, limit_per_source: int, mark: FeedSource | None):
+    """Parse entries until ``limit_per_source`` usable blogs are produced.
+
+    Entries behind ``mark`` are skipped before any cleaning/enrichment,
+    and reading stops at the entry carrying the last seen GUID.
+    """
     blogs = []
-    try:
-        feed = feedparser.parse(url)
-        if feed and getattr(feed, "entries", None):
-            for entry in feed.entries[:limit_per_source]:
-                blog_data = _parse_blog_entry(entry)
+    scanned = 0
+    # aclosing() makes an early break close the HTTP stream right away
+    async with aclosing(entries) as stream:
+        async for entry in stream:
+            scanned += 1
+            if mark is not None and mark.last_guid and _entry_guid(entry) == mark.last_guid:
+                break
+            if not _is_behind_mark(entry, mark):
+                with stage("clean"):
+                    blog_data = _parse_blog_entry(entry)
                 if blog_data["url"]:
+                    blog_data["guid"] = _entry_guid(entry) or blog_data["url"]
                     blogs.append(blog_data)
-            return blogs
+            if len(blogs) >= limit_per_source or scanned >= limit_per_source * MAX_SCAN_FACTOR:
+                break
+    return blogs
+
+async def fetch_blogs_from_source(url: str, limit_per_source: int = 5, mark: FeedSource | None = None):
+    """Fetch blogs from a single source.
+
+    Uses the streaming reader so large feeds stop downloading once enough
+    entries are collected; falls back to feedparser for feeds it cannot parse.
+    A feed with nothing newer than ``mark`` costs only a few entries of parsing.
+    """
+    if settings.BLOG_STREAMING_PARSER:
+        try:
+            return await _collect_blogs(iter_feed_entries(url), limit_per_source, mark)
+        except FeedStreamError as e:
+            logger.debug("Streaming parse failed for %s, falling back to feedparser: %s", url, e)
+        except Exception as e:
+            logger.debug("Streaming blog feed read failed for %s: %s", url, e)
+    try:
+        # feedparser downloads and parses in one call
+        with stage("fetch+parse (feedparser)"):
+            import feedparser
+            feed = feedparser.parse(url)
+        if feed and getattr(feed, "entries", None):
+            return await _collect_blogs(_iter_list(feed.entries), limit_per_source, mark)
     except Exception as e:
         logger.debug("Blog feed parse failed for %s: %s", url, e)
     
     return []
 
-async def fetch_and_update_blogs(db: Session):
-    """Fetch blogs from all sources and update database with category limits."""
+def _advance_mark(db: Session, mark: FeedSource | None, url: str, blogs: list) -> FeedSource:
+    """Move a source's high-water mark up to the newest entry in ``blogs``."""
+    if mark is None:
+        mark = FeedSource(url=url)
+        db.add(mark)
+    # GUID and date come from the same (newest dated) entry, so _is_behind_mark's
+    # equal-timestamp check compares against the entry the mark was taken from
+    dated = [b for b in blogs if b.get("published_date")]
+    if dated:
+        newest = max(dated, key=lambda b: b["published_date"])
+        if mark.last_published is None or newest["published_date"] > mark.last_published:
+            mark.last_published = newest["published_date"]
+            mark.last_guid = newest["guid"][:500]
+    elif blogs and mark.last_published is None:
+        # Undated feed: fall back to the first entry (feeds list newest first)
+        mark.last_guid = blogs[0]["guid"][:500]
+    mark.last_checked = datetime.now()
+    return mark
+
+async def fetch_and_update_blogs(db: Session, full_refresh: bool = False):
+    """Fetch blogs from all sources and update database with category limits.
+
+    Each source keeps a high-water mark (newest GUID / published date) in
+    ``feed_sources``; only entries newer than it are cleaned, enriched and
+    classified. ``full_refresh`` ignores the marks, which also happens
+    automatically when the blog table is empty (e.g. after a category reset).
+    """
     added_count = 0
     updated_count = 0
     removed_count = 0
+    skipped_sources = 0
+    duplicate_count = 0
+    seen_fingerprints = []
     
     # Track blogs by category to enforce limits
     category_counts = {}
     new_blogs_by_category = {}
+    fetched_by_source = {}
+    
+    if not full_refresh and db.query(BlogPost.id).first() is None:
+        full_refresh = True
+    marks = {} if full_refresh else {m.url: m for m in db.query(FeedSource).all()}
     
     # First, collect all new blogs from sources
     for source_url in BLOG_SOURCES:
         try:
-            blogs = await fetch_blogs_from_source(source_url)
+            blogs = await fetch_blogs_from_source(source_url, mark=marks.get(source_url))
+            fetched_by_source[source_url] = blogs
+            if not blogs:
+                skipped_sources += 1
             
             for blog_data in blogs:
                 # Filter out non-AI content
-                if not _is_ai_related(blog_data["title"], blog_data["content"]):
+                with stage("classify"):
+                    relevant = _is_ai_related(blog_data["title"], blog_data["content"])
+                if not relevant:
                     continue
+                
+                # Skip the same story syndicated under a different URL, in this run or already stored
+                fingerprint = blog_data["simhash"]
+                if any(url != blog_data["url"] and hamming_distance(fp, fingerprint) <= NEAR_DUPLICATE_DISTANCE
+                       for fp, url in seen_fingerprints):
+                    duplicate_count += 1
+                    continue
+                if _find_near_duplicate(db, fingerprint, blog_data["url"]) is not None:
+                    duplicate_count += 1
+                    continue
+                seen_fingerprints.append((fingerprint, blog_data["url"]))
                     
-                category = _heuristic_category(blog_data["title"], blog_data["content"])
+                with stage("classify"):
+                    category = _heuristic_category(blog_data["title"], blog_data["content"])
                 
                 # Initialize category tracking
                 if category not in new_blogs_by_category:
                     new_blogs_by_category[category] = []
                 
                 # Add to new blogs for this category
+                blog_data["category"] = category
                 new_blogs_by_category[category].append(blog_data)
                 
         except Exception as e:
             logger.error("Failed to fetch blogs from %s: %s", source_url, e)
             continue
     
+    failed_categories = set()
+    
     # Process each category
     for category, new_blogs in new_blogs_by_category.items():
         try:
@@ -275,7 +430,7 @@ async def fetch_and_update_blogs(db: Session):
             ).order_by(BlogPost.published_date.desc()).all()
             
             # Sort new blogs by published date (newest first)
-            new_blogs.sort(key=lambda x: x.get("published_date", datetime.now()), reverse=True)
+            new_blogs.sort(key=lambda x: x.get("published_date") or datetime.now(), reverse=True)
             
             # Calculate how many new blogs we can add
             max_blogs_per_category = 10
@@ -300,7 +455,9 @@ async def fetch_and_update_blogs(db: Session):
                     existing.excerpt = blog_data["excerpt"]
                     existing.content = blog_data["content"]
                     existing.category = category
-                    existing.last_updated = datetime.now()
+                    existing.last_updated = datetime.utcnow()
+                    for column, value in _fingerprint_columns(blog_data["simhash"]).items():
+                        setattr(existing, column, value)
                     updated_count += 1
                 else:
                     # Add new blog
@@ -313,21 +470,40 @@ async def fetch_and_update_blogs(db: Session):
                         featured=False,
                         published=True,
                         source=blog_data["source"],
-                        published_date=blog_data["published_date"] or datetime.now()
+                        published_date=blog_data["published_date"] or datetime.now(),
+                        **_fingerprint_columns(blog_data["simhash"])
                     )
                     db.add(new_blog)
                     added_count += 1
             
-            db.commit()
+            with stage("db_write"):
+                db.commit()
             
         except Exception as e:
             logger.error("Failed to process category %s: %s", category, e)
             db.rollback()
+            failed_categories.add(category)
             continue
     
+    # Advance high-water marks, except for sources whose entries failed to save
+    try:
+        if full_refresh:
+            marks = {m.url: m for m in db.query(FeedSource).all()}
+        for source_url, blogs in fetched_by_source.items():
+            if any(b.get("category") in failed_categories for b in blogs):
+                continue
+            _advance_mark(db, marks.get(source_url), source_url, blogs)
+        with stage("db_write"):
+            db.commit()
+    except Exception as e:
+        logger.error("Failed to update feed high-water marks: %s", e)
+        db.rollback()
+    
     return {
         "added": added_count,
         "updated": updated_count,
         "removed": removed_count,
+        "duplicates_skipped": duplicate_count,
+        "unchanged_sources": skipped_sources,
         "timestamp": datetime.now().isoformat()
     }
@@ -0,0 +1,118 @@
+"""
+AI-written blog drafts for the admin panel (/generate-blog).
+
+The prompt and the title/excerpt extraction live here so the background job
+and the streamed variant produce the same draft shape. ``stream_blog_draft``
+yields the markdown as the model writes it, and reports the title and
+excerpt as soon as the lines holding them are complete.
+"""
+from contextlib import aclosing
+from typing import AsyncIterator, List
+
+from app.services.chat_service import ask_model, ask_model_stream
+
+EXCERPT_LENGTH = 200
+
+def blog_prompt(topic: str, category: str, tone: str = "professional", length: str = "medium") -> str:
+    """Prompt asking the model for a natural, first-person blog post in markdown."""
+    return f"""
+        Write a natural, engaging blog post about "{topic}" in the {category} category.
+
+        Requirements:
+        - Write in a {tone} tone that feels conversational and authentic
+        - Make it {length} length (2-3 paragraphs for medium, 4-5 for long)
+        - Write as if Daniyal Areeb (a software engineer and AI enthusiast) wrote it personally
+        - Include personal insights, experiences, and real-world examples
+        - Make it engaging and informative without being overly technical
+        - Use natural language flow - avoid bullet points, asterisks, or excessive formatting
+        - Write in complete sentences and paragraphs
+        - Include practical examples or use cases that readers can relate to
+        - End with a thoughtful conclusion that ties everything together
+        - Make it feel like a genuine blog post someone would actually read
+
+        Write the blog post in clean markdown format with proper headings and natural paragraph flow.
+        Avoid using asterisks (*), hyphens (-), or bullet points for lists.
+        """
+
+def _title_from(line: str) -> str:
+    return line.replace('# ', '').replace('#', '').strip()
+
+def _is_excerpt_line(line: str) -> bool:
+    return bool(line.strip()) and not line.startswith('#') and not line.startswith('*')
+
+def _trim_excerpt(excerpt: str) -> str:
+    return excerpt[:EXCERPT_LENGTH] + "..." if len(excerpt) > EXCERPT_LENGTH else excerpt
+
+def parse_generated_blog(content: str, topic: str, category: str) -> dict:
+    """Draft dict (title from the first line, excerpt from the first paragraph) for save-generated-blog."""
+    lines = content.split('\n')
+    title = _title_from(lines[0])
+
+    excerpt = ""
+    for line in lines:
+        if _is_excerpt_line(line):
+            excerpt = line.strip()
+            break
+
+    return {
+        "title": title,
+        "excerpt": _trim_excerpt(excerpt),
+        "content": content,
+        "category": category,
+        "topic": topic
+    }
+
+class DraftParser:
+    """Incremental parse_generated_blog: emits title/excerpt events as soon as their lines are complete."""
+
+    def __init__(self):
+        self.title = None
+        self.excerpt = None
+        self._partial = ""
+
+    def feed(self, text: str) -> List[dict]:
+        *complete, self._partial = (self._partial + text).split('\n')
+        return self._scan(complete)
+
+    def finish(self) -> List[dict]:
+        partial, self._partial = self._partial, ""
+        return self._scan([partial])
+
+    def _scan(self, lines: List[str]) -> List[dict]:
+        events = []
+        for line in lines:
+            if self.title is None:
+                self.title = _title_from(line)
+                events.append({"type": "title", "title": self.title})
+            if self.excerpt is None and _is_excerpt_line(line):
+                self.excerpt = _trim_excerpt(line.strip())
+                events.append({"type": "excerpt", "excerpt": self.excerpt})
+        return events
+
+async def generate_blog_draft(topic: str, category: str, tone: str = "professional", length: str = "medium") -> dict:
+    content = await ask_model(blog_prompt(topic, category, tone, length), mode="home")
+    return parse_generated_blog(content, topic, category)
+
+async def stream_blog_draft(topic: str, category: str, tone: str = "professional", length: str = "medium") -> AsyncIterator[dict]:
+    """
+    Yield draft events while the model writes: ``delta`` (new markdown), ``title`` and
+    ``excerpt`` (once), then ``done`` with the same dict generate_blog_draft returns.
+
+    Closing this generator early closes the model request too.
+    """
+    parser = DraftParser()
+    parts = []
+    async with aclosing(ask_model_stream(blog_prompt(topic, category, tone, length), mode="home")) as stream:
+        async for text in stream:
+            if not parts:
+                # Same as ask_model's strip(): the title is the first non-blank line
+                text = text.lstrip()
+                if not text:
+                    continue
+            parts.append(text)
+            yield {"type": "delta", "text": text}
+            for event in parser.feed(text):
+                yield event
+    for event in parser.finish():
+        yield event
+    yield {"type": "done", "data": parse_generated_blog("".join(parts).rstrip(), topic, category)}
@@ -0,0 +1,94 @@
+"""
+Delta sync for tools, projects and blogs.
+
+A sync cursor encodes (server time when the previous response was built,
+highest tombstone id it included). Given a cursor, ``get_changes`` returns
+rows whose ``updated_at`` (``last_updated`` for blogs) is at or after that
+time, minus a small overlap for writes that committed just after it, plus
+the ids deleted since. Without a cursor, or with one older than the
+tombstone retention period, it returns every row with ``full_resync``.
+Change timestamps are naive UTC (``datetime.utcnow``), the same clock as the
+CURRENT_TIMESTAMP backfill in migrate_add_sync_tracking.py.
+
+Clients apply ``deletes`` first and then ``upserts``, keyed by id. A row
+can appear in both when its id was deleted and reused. Rows inside the
+overlap window can be re-sent, and upserting them again is harmless.
+"""
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.records import fetch_records
+from app.models.blog import BlogPost
+from app.models.project import Project
+from app.models.tombstone import Tombstone
+from app.models.tool import Tool
+from app.services.content_service import PROJECT_LIST_COLUMNS, SUMMARY_COLUMNS, TOOL_LIST_COLUMNS
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# Re-send rows updated this long before the cursor, to cover transactions
+# that stamped updated_at before the cursor was taken but committed after
+SYNC_OVERLAP = timedelta(seconds=5)
+
+# collection -> (table, model, change timestamp column, columns returned)
+SYNC_COLLECTIONS = {
+    "tools": ("ai_tools", Tool, Tool.updated_at, TOOL_LIST_COLUMNS + (Tool.display_order, Tool.updated_at)),
+    "projects": ("projects", Project, Project.updated_at, PROJECT_LIST_COLUMNS + (Project.display_order, Project.updated_at)),
+    "blogs": ("blog_posts", BlogPost, BlogPost.last_updated, SUMMARY_COLUMNS + (
+        BlogPost.content, BlogPost.url, BlogPost.source, BlogPost.published_date, BlogPost.last_updated,
+    )),
+}
+
+def parse_sync_cursor(cursor: str):
+    """Returns (since datetime, last tombstone id); raises ValueError if malformed."""
+    since, tombstone_id = decode_cursor(cursor, 2)
+    if not isinstance(tombstone_id, int):
+        raise ValueError("Invalid cursor")
+    try:
+        return datetime.fromisoformat(since), tombstone_id
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+def get_changes(db: Session, since: Optional[str] = None, types: Optional[Iterable[str]] = None) -> dict:
+    """
+    Inserts/updates and deletes since ``since`` (a next_cursor from a previous call).
+
+    Raises:
+        ValueError: if ``since`` is not a valid sync cursor
+    """
+    # Take the cursor position before reading so nothing committed meanwhile is skipped
+    now = datetime.utcnow()
+    last_tombstone = db.execute(select(func.max(Tombstone.id))).scalar() or 0
+
+    since_at, since_tombstone = parse_sync_cursor(since) if since else (None, 0)
+    retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    full_resync = since_at is None or since_at < now - retention
+
+    upserts, deletes = {}, {}
+    for name in [t for t in (types or SYNC_COLLECTIONS) if t in SYNC_COLLECTIONS]:
+        table, model, changed_col, columns = SYNC_COLLECTIONS[name]
+        stmt = select(*columns).order_by(model.display_order.asc(), model.id.desc())
+        if not full_resync:
+            stmt = stmt.where(changed_col >= since_at - SYNC_OVERLAP)
+        upserts[name] = fetch_records(db, stmt)
+        deletes[name] = [] if full_resync else db.execute(
+            select(Tombstone.row_id).distinct()
+            .where(Tombstone.table_name == table, Tombstone.id > since_tombstone, Tombstone.id <= last_tombstone)
+        ).scalars().all()
+
+    return {
+        "full_resync": full_resync,
+        "upserts": upserts,
+        "deletes": deletes,
+        "next_cursor": encode_cursor(now.isoformat(), last_tombstone),
+    }
+
+def purge_tombstones(db: Session) -> int:
+    """Delete tombstones older than the retention period; clients that far behind resync fully."""
+    cutoff = datetime.utcnow() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    result = db.execute(delete(Tombstone).where(Tombstone.deleted_at < cutoff))
+    db.commit()
+    return result.rowcount or 0
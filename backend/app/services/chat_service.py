@@ -1,5 +1,6 @@
 import os, json, asyncio
-from app.core.ai_client import chat_complete
+from typing import AsyncIterator
+from app.core.ai_client import chat_complete, chat_complete_stream
 DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "..", "data", "cv_data.json")
 
 # Load Daniyal facts with fallback
@@ -109,6 +110,18 @@ YOUR CAREER GOALS:
 
 Remember: You ARE Daniyal. Speak professionally as yourself."""
 
+# Best free models for natural conversation (no "think" models that expose reasoning)
+CHAT_MODELS = [
+    "openai/gpt-oss-20b:free",
+    "google/gemma-3-27b-it:free",
+    "mistralai/mistral-7b-instruct:free",
+    "nex-agi/deepseek-v3.1-nex-n1:free",
+]
+
+def _clean_dashes(text: str) -> str:
+    # Clean up special characters (em-dashes, en-dashes)
+    return text.replace('‑', '-').replace('–', '-').replace('—', '-')
+
 def build_prompt(user_message: str, mode: str):
     if mode == "cv":
         system = CV_TONE
@@ -155,7 +168,8 @@ Use this information to answer questions about Daniyal Ahmad. Be helpful and con
     
     return system + "\n\nDANIYAL'S INFORMATION:\n" + personal_context + "\n\nUSER QUESTION:\n" + user_message
 
-async def ask_model(message: str, mode: str | None = "home") -> str:
+def _guardrail_reply(message: str) -> str | None:
+    """The canned refusal for obvious non-Daniyal requests, or None if the message may go to the model."""
     # Simple check for obvious non-Daniyal questions
     message_lower = message.lower()
     
@@ -166,25 +180,23 @@ async def ask_model(message: str, mode: str | None = "home") -> str:
         "help me with my", "solve my problem", "fix my code", "debug my"
     ]):
         return "I can tell you about Daniyal's coding projects and technical skills, but I can't generate code for you. What would you like to know about Daniyal's background, projects, or skills?"
+    return None
+
+async def ask_model(message: str, mode: str | None = "home") -> str:
+    refusal = _guardrail_reply(message)
+    if refusal:
+        return refusal
     
     prompt = build_prompt(message, mode or "home")
-    # Best free models for natural conversation (no "think" models that expose reasoning)
-    models = [
-        "openai/gpt-oss-20b:free",
-        "google/gemma-3-27b-it:free",
-        "mistralai/mistral-7b-instruct:free",
-        "nex-agi/deepseek-v3.1-nex-n1:free",
-    ]
     last_error = None
-    for m in models:
+    for m in CHAT_MODELS:
         try:
             ans = await chat_complete(prompt, model=m, max_tokens=350, temperature=0.5 if mode=="cv" else 0.8)
             # Skip empty responses (some models return empty strings)
             if not ans or not ans.strip():
                 print(f"Model {m} returned empty response, trying next...")
                 continue
-            # Clean up special characters (em-dashes, en-dashes)
-            ans = ans.replace('‑', '-').replace('–', '-').replace('—', '-')
+            ans = _clean_dashes(ans)
             # If it refused to talk about Daniyal, force guardrail
             if "I can only answer about Daniyal" in ans:
                 return ans
@@ -247,4 +259,36 @@ All projects showcase Daniyal's backend expertise, AI integration skills, and ab
         elif "hey" in message.lower() or "hello" in message.lower() or "hi" in message.lower():
             return error_msg + "Hi! I'm Daniyal Ahmad's AI assistant. I'm currently experiencing some technical difficulties, but I can tell you about Daniyal! He's a 20-year-old final year Computer Science student at University of East London, passionate about AI/ML and backend development. Ask me about his projects, skills, or career goals!"
         else:
-            return error_msg + "I'm having trouble connecting to my AI services right now. However, I can tell you about Daniyal! He's a skilled backend developer with expertise in Python, FastAPI, AI/ML technologies, and modern web development. Ask me about his projects, skills, or career goals!"
\ No newline at end of file
+            return error_msg + "I'm having trouble connecting to my AI services right now. However, I can tell you about Daniyal! He's a skilled backend developer with expertise in Python, FastAPI, AI/ML technologies, and modern web development. Ask me about his projects, skills, or career goals!"
+
+async def ask_model_stream(message: str, mode: str | None = "home") -> AsyncIterator[str]:
+    """
+    Streaming ask_model: yields the answer as the model generates it.
+
+    A model that fails before sending anything falls back to the next one;
+    once text has been sent, a failure is raised to the caller instead.
+
+    Raises:
+        RuntimeError: if every model failed before producing output
+    """
+    refusal = _guardrail_reply(message)
+    if refusal:
+        yield refusal
+        return
+    prompt = build_prompt(message, mode or "home")
+    last_error = None
+    for m in CHAT_MODELS:
+        sent = False
+        try:
+            async for delta in chat_complete_stream(prompt, model=m, max_tokens=350, temperature=0.5 if mode=="cv" else 0.8):
+                sent = True
+                yield _clean_dashes(delta)
+            if sent:
+                return
+            print(f"Model {m} returned empty response, trying next...")
+        except Exception as e:
+            if sent:
+                raise
+            last_error = e
+            print(f"Model {m} failed: {e}")
+    raise RuntimeError(f"AI service unavailable: {last_error}")
@@ -0,0 +1,104 @@
+"""
+Public payloads for the content list endpoints.
+
+The same builders back the live endpoints, their in-memory snapshots and
+the static JSON export, so all three always produce identical documents.
+"""
+from fastapi import HTTPException
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+from app.schemas.common import APIResponse
+from app.models.blog import BlogPost
+from app.models.project import Project
+from app.models.tool import Tool
+from app.core.records import fetch_records
+from app.services.tools_service import list_tool_records
+from app.utils.pagination import encode_cursor, decode_cursor
+
+# Fields of each public list item, selected as plain columns (no ORM instances)
+PROJECT_LIST_COLUMNS = (
+    Project.id, Project.name, Project.description, Project.url, Project.github_url,
+    Project.category, Project.technologies, Project.image_url,
+)
+TOOL_LIST_COLUMNS = (
+    Tool.id, Tool.name, Tool.description, Tool.category, Tool.status, Tool.url, Tool.pricing,
+    Tool.image_url, Tool.source, Tool.auto_fetched, Tool.last_checked,
+)
+
+# Columns of the light list projection (no content)
+SUMMARY_COLUMNS = (
+    BlogPost.id, BlogPost.title, BlogPost.excerpt, BlogPost.category,
+    BlogPost.published, BlogPost.featured, BlogPost.display_order,
+)
+
+def projects_payload(db: Session) -> APIResponse:
+    stmt = select(*PROJECT_LIST_COLUMNS).order_by(Project.display_order.asc(), Project.id.desc())
+    return APIResponse(success=True, data={"items": fetch_records(db, stmt)})
+
+def tools_payload(db: Session, q: str = None, category: str = None, limit: int = 200) -> dict:
+    items = list_tool_records(db, TOOL_LIST_COLUMNS, q, category, limit)
+    return {"success": True, "data": {"items": items}}
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def blog_list_payload(db: Session, limit=None, cursor=None, category=None, featured=None, view=None) -> APIResponse:
+    paginated = limit is not None or cursor is not None
+    include_content = (view or ("summary" if paginated else "full")) == "full"
+
+    # NULL display_order sorts as 0, so it can't end up in (and stall) a cursor
+    sort_order = func.coalesce(BlogPost.display_order, 0)
+    columns = SUMMARY_COLUMNS + ((BlogPost.content,) if include_content else ())
+    query = db.query(*columns, sort_order.label("sort_order"))
+    if category:
+        query = query.filter(BlogPost.category == category)
+    if featured is not None:
+        query = query.filter(BlogPost.featured == featured)
+    if cursor:
+        try:
+            after_order, after_id = decode_cursor(cursor, 2)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if not (_is_int(after_order) and _is_int(after_id)):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # Keyset continuation for ORDER BY display_order ASC, id DESC
+        query = query.filter(or_(
+            sort_order > after_order,
+            and_(sort_order == after_order, BlogPost.id < after_id),
+        ))
+    query = query.order_by(sort_order.asc(), BlogPost.id.desc())
+
+    page_size = limit or 20
+    rows = query.limit(page_size + 1).all() if paginated else query.all()
+    has_more = paginated and len(rows) > page_size
+    rows = rows[:page_size] if paginated else rows
+
+    # shape like frontend expects
+    items = []
+    for b in rows:
+        item = {
+            "id": b.id, "title": b.title, "excerpt": b.excerpt, "category": b.category,
+            "published": b.published, "featured": b.featured,
+        }
+        if include_content:
+            item["content"] = b.content
+        items.append(item)
+
+    data = {"items": items}
+    if paginated:
+        data["has_more"] = has_more
+        data["next_cursor"] = encode_cursor(rows[-1].sort_order, rows[-1].id) if has_more else None
+    return APIResponse(success=True, data=data)
+
+def blog_detail_payload(db: Session, blog_id: int) -> APIResponse:
+    b = db.query(BlogPost).filter(BlogPost.id == blog_id).first()
+    if not b:
+        raise HTTPException(status_code=404, detail="Blog not found")
+    data = {
+        "id": b.id, "title": b.title, "excerpt": b.excerpt, "category": b.category,
+        "published": b.published, "featured": b.featured, "content": b.content,
+        "url": b.url, "source": b.source,
+        "published_date": b.published_date.isoformat() if b.published_date else None,
+        "last_updated": b.last_updated.isoformat() if b.last_updated else None,
+    }
+    return APIResponse(success=True, data=data)
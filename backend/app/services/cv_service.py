@@ -5,8 +5,6 @@ import uuid
 from typing import List, Dict
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
-from PyPDF2 import PdfReader
-from docx import Document
 
 from app.models.cv import CVDocument
 from app.core.vectorstore import add_documents, query_similar
@@ -14,10 +12,13 @@ from app.core.ai_client import OpenRouterClient
 
 def _extract_text(file: UploadFile) -> str:
     """Extract text from uploaded files (PDF, DOCX, or text)."""
+    # PDF/DOCX parsers are imported on first upload, not at app startup
     if file.filename.lower().endswith(".pdf"):
+        from PyPDF2 import PdfReader
         reader = PdfReader(file.file)
         return "\n".join([page.extract_text() or "" for page in reader.pages])
     elif file.filename.lower().endswith(".docx"):
+        from docx import Document
         d = Document(file.file)
         return "\n".join([p.text for p in d.paragraphs])
     else:
@@ -0,0 +1,344 @@
+"""
+Streaming export and import of the site's content as (gzip-compressed) NDJSON.
+
+The stream is one JSON object per line:
+
+    {"type": "header", "format": "portfolio-ndjson", "version": 1, "exported_at": ..., "tables": [...]}
+    {"table": "ai_tools", "row": {...every column...}}
+    ...
+    {"type": "footer", "counts": {"ai_tools": 1234, ...}}
+
+Rows are read with ``yield_per`` (a server-side cursor on Postgres), encoded
+and fed through an incremental gzip compressor. Output is flushed every
+``CHUNK_BYTES``, so memory use stays flat however large the tables get. The
+footer lets an importer check that it received the whole file.
+
+``import_ndjson`` reads such a file (gzip or plain) line by line and writes
+it in batches of ``IMPORT_BATCH_SIZE`` rows, in a single transaction:
+
+- ``upsert`` (default): rows matching an existing row on the table's
+  natural key (IMPORT_KEYS) update it by primary key, the rest are
+  inserted with fresh ids.
+- ``insert``: like upsert, but existing rows are left untouched.
+- ``replace``: the tables in the file are emptied first and rows are
+  inserted with their original ids (via COPY on Postgres + psycopg2), then
+  the id sequences are moved past the highest id.
+"""
+import gzip
+import io
+import json
+import time
+import zlib
+from datetime import datetime
+from typing import IO, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import DateTime, bindparam, delete, insert, select, text, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.change_tracking import bump_version
+from app.core.records import columns_of
+from app.core.snapshots import encode_json
+from app.database import SessionLocal
+from app.models import BlogPost, ContactSubmission, Project, Tool
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    _loads = json.loads
+
+EXPORT_FORMAT = "portfolio-ndjson"
+EXPORT_VERSION = 1
+
+# table name -> model, in the order they are written
+EXPORT_TABLES = {
+    "ai_tools": Tool,
+    "projects": Project,
+    "blog_posts": BlogPost,
+    "contact_submissions": ContactSubmission,
+}
+
+# Rows fetched per round trip from the server-side cursor
+YIELD_PER = 1000
+# Uncompressed bytes buffered before handing them to the compressor
+CHUNK_BYTES = 256 * 1024
+
+def resolve_tables(names: Optional[Iterable[str]] = None) -> list:
+    """Validate requested table names; ``None`` means all, in export order."""
+    if not names:
+        return list(EXPORT_TABLES)
+    unknown = [n for n in names if n not in EXPORT_TABLES]
+    if unknown:
+        raise ValueError(f"Unknown tables: {', '.join(unknown)}")
+    return [n for n in EXPORT_TABLES if n in names]
+
+def iter_export_lines(tables: Iterable[str]) -> Iterator[bytes]:
+    """Yield the NDJSON lines (header, rows, footer) for ``tables``, using its own session."""
+    tables = list(tables)
+    counts: Dict[str, int] = {}
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            # One snapshot for every table, so rows that reference each other stay consistent
+            db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        yield encode_json({
+            "type": "header", "format": EXPORT_FORMAT, "version": EXPORT_VERSION,
+            "exported_at": datetime.now(), "tables": tables,
+        }) + b"\n"
+        for table in tables:
+            model = EXPORT_TABLES[table]
+            result = db.execute(
+                select(*columns_of(model)).order_by(model.id).execution_options(yield_per=YIELD_PER)
+            )
+            keys = tuple(result.keys())
+            count = 0
+            for row in result.tuples():
+                yield encode_json({"table": table, "row": dict(zip(keys, row))}) + b"\n"
+                count += 1
+            counts[table] = count
+        yield encode_json({"type": "footer", "counts": counts}) + b"\n"
+    finally:
+        db.rollback()
+        db.close()
+
+def iter_export_gzip(tables: Iterable[str]) -> Iterator[bytes]:
+    """The export as a stream of gzip chunks of roughly bounded size."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    buffer, size = [], 0
+    for line in iter_export_lines(tables):
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            chunk = compressor.compress(b"".join(buffer))
+            buffer, size = [], 0
+            if chunk:
+                yield chunk
+    yield compressor.compress(b"".join(buffer)) + compressor.flush()
+
+def export_filename(now: Optional[datetime] = None) -> str:
+    return f"portfolio-export-{(now or datetime.now()):%Y%m%d-%H%M%S}.ndjson.gz"
+
+# table -> columns identifying "the same" row across databases (ids differ
+# between them). The first column must be non-null; it is used for lookups.
+IMPORT_KEYS = {
+    "ai_tools": ("url",),
+    "projects": ("name",),
+    "blog_posts": ("title", "url"),
+    "contact_submissions": ("email", "message"),
+}
+
+IMPORT_MODES = ("upsert", "insert", "replace")
+
+class ImportFormatError(ValueError):
+    """The upload isn't a valid export file (bad JSON, unknown table, wrong format)."""
+
+def _iter_lines(fileobj: IO[bytes]) -> Iterator[bytes]:
+    """Lines of a plain or gzip-compressed binary file, decompressed on the fly."""
+    head = fileobj.read(2)
+    fileobj.seek(0)
+    stream = gzip.GzipFile(fileobj=fileobj, mode="rb") if head == b"\x1f\x8b" else fileobj
+    for line in stream:
+        yield line
+
+def _copy_value(value) -> str:
+    """One field in COPY's text format (tab-separated, \\N for NULL, backslash escapes)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    value = value.isoformat() if isinstance(value, datetime) else str(value)
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+class _TableImport:
+    """Buffers one table's rows and writes them batch by batch."""
+
+    def __init__(self, db: Session, table: str, mode: str, now: datetime):
+        self.db = db
+        self.table = table
+        self.mode = mode
+        self.model = EXPORT_TABLES[table]
+        self.keys = IMPORT_KEYS[table]
+        self.now = now
+        self.pending: List[dict] = []
+        self.stats = {"inserted": 0, "updated": 0, "skipped": 0}
+
+        # Rows are normalised to the full column list, so each batch is one executemany
+        columns = [c for c in self.model.__table__.columns if mode == "replace" or c.key != "id"]
+        self.names = [c.key for c in columns]
+        self.datetimes = [c.key for c in columns if isinstance(c.type, DateTime)]
+        # Change-time columns are always stamped, so /changes clients pick the imported rows up
+        self.stamped = [c.key for c in columns if c.onupdate is not None]
+        # Values for columns missing from a row: (key, value or callable, is_callable)
+        self.defaults = []
+        for c in columns:
+            if c.onupdate is not None or c.key == "id":
+                continue
+            if c.default is not None:
+                self.defaults.append((c.key, c.default.arg, c.default.is_callable))
+            elif c.server_default is not None and isinstance(c.type, DateTime):
+                self.defaults.append((c.key, now, False))
+
+        if mode == "replace":
+            # ORM-enabled delete, so change tracking writes tombstones for every removed row
+            self.db.execute(delete(self.model))
+
+    def clean(self, raw: dict) -> dict:
+        row = {name: raw.get(name) for name in self.names}
+        for key in self.datetimes:
+            if type(row[key]) is str:
+                try:
+                    row[key] = datetime.fromisoformat(row[key])
+                except ValueError:
+                    raise ImportFormatError(f"invalid datetime for {self.table}.{key}: {row[key]!r}") from None
+        for key in self.stamped:
+            row[key] = self.now
+        for key, value, is_callable in self.defaults:
+            if key not in raw:
+                row[key] = value(None) if is_callable else value
+        return row
+
+    def add(self, raw: dict, batch_size: int) -> None:
+        self.pending.append(self.clean(raw))
+        if len(self.pending) >= batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        rows, self.pending = self.pending, []
+        if not rows:
+            return
+        if self.mode == "replace":
+            self._insert(rows, keep_ids=True)
+            return
+
+        key_of = lambda r: tuple(r[k] for k in self.keys)
+        key_cols = [self.model.__table__.c[k] for k in self.keys]
+        existing = {}
+        lookup = select(self.model.id, *key_cols).where(key_cols[0].in_({r[self.keys[0]] for r in rows}))
+        for row_id, *values in self.db.execute(lookup):
+            existing.setdefault(tuple(values), row_id)
+
+        # Later duplicates within the batch win
+        inserts, updates = {}, {}
+        for row in rows:
+            key = key_of(row)
+            if key in existing:
+                if self.mode == "upsert":
+                    updates[existing[key]] = {**row, "_id": existing[key]}
+                else:
+                    self.stats["skipped"] += 1
+            else:
+                inserts[key] = row
+        if updates:
+            table = self.model.__table__
+            stmt = update(table).where(table.c.id == bindparam("_id")).values(
+                {name: bindparam(name) for name in self.names}
+            )
+            self.db.execute(stmt, list(updates.values()))
+            self.stats["updated"] += len(updates)
+        if inserts:
+            self._insert(list(inserts.values()), keep_ids=False)
+
+    def _insert(self, rows: List[dict], keep_ids: bool) -> None:
+        bind = self.db.get_bind()
+        if keep_ids and bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2":
+            self._copy(rows)
+        else:
+            # Core executemany (no ORM bookkeeping); psycopg2 batches it into multi-row VALUES
+            self.db.execute(insert(self.model.__table__), rows)
+        self.stats["inserted"] += len(rows)
+
+    def _copy(self, rows: List[dict]) -> None:
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_value(row[n]) for n in self.names))
+            buffer.write("\n")
+        buffer.seek(0)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {self.table} ({', '.join(self.names)}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+
+    def fix_sequence(self) -> None:
+        """Move the id sequence past rows inserted with explicit ids (Postgres only)."""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        self.db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{self.table}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {self.table}), 0) + 1, false)"
+        ))
+
+def import_ndjson(db: Session, fileobj: IO[bytes], mode: str = "upsert", batch_size: Optional[int] = None) -> dict:
+    """
+    Import an export file (see module docstring) in one transaction.
+
+    Returns per-table inserted/updated/skipped counts, timing and throughput,
+    plus warnings (e.g. a footer count that doesn't match what was read).
+
+    Raises:
+        ImportFormatError: on malformed input; nothing is written
+    """
+    if mode not in IMPORT_MODES:
+        raise ValueError(f"Unknown import mode: {mode}")
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    started = time.perf_counter()
+    now = datetime.now()
+    importers: Dict[str, _TableImport] = {}
+    seen: Dict[str, int] = {}
+    footer = None
+    try:
+        for number, line in enumerate(_iter_lines(fileobj), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = _loads(line)
+            except ValueError as e:
+                raise ImportFormatError(f"Line {number}: invalid JSON ({e})") from e
+            kind = record.get("type") if isinstance(record, dict) else None
+            if kind == "header":
+                if record.get("format") != EXPORT_FORMAT or record.get("version") != EXPORT_VERSION:
+                    raise ImportFormatError(f"Unsupported export format: {record.get('format')} v{record.get('version')}")
+                continue
+            if kind == "footer":
+                footer = record.get("counts") or {}
+                continue
+            table = record.get("table") if isinstance(record, dict) else None
+            row = record.get("row") if isinstance(record, dict) else None
+            if table not in EXPORT_TABLES or not isinstance(row, dict):
+                raise ImportFormatError(f"Line {number}: expected {{\"table\": ..., \"row\": {{...}}}} for a known table")
+            if table not in importers:
+                importers[table] = _TableImport(db, table, mode, now)
+            try:
+                importers[table].add(row, batch_size)
+            except ImportFormatError as e:
+                raise ImportFormatError(f"Line {number}: {e}") from e
+            seen[table] = seen.get(table, 0) + 1
+        for importer in importers.values():
+            importer.flush()
+            if mode == "replace":
+                importer.fix_sequence()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    # Core inserts/updates bypass the ORM session hooks, so mark the tables changed here
+    bump_version(*importers)
+
+    warnings = []
+    if footer is None:
+        warnings.append("No footer found; the file may be truncated")
+    else:
+        for table, count in footer.items():
+            if seen.get(table, 0) != count:
+                warnings.append(f"{table}: footer says {count} rows, read {seen.get(table, 0)}")
+    elapsed = time.perf_counter() - started
+    total = sum(seen.values())
+    return {
+        "mode": mode,
+        "tables": {table: importer.stats for table, importer in importers.items()},
+        "rows": total,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(total / elapsed) if elapsed else total,
+        "warnings": warnings,
+    }
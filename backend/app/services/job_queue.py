@@ -0,0 +1,199 @@
+"""
+In-process background jobs for slow admin operations.
+
+Endpoints call ``submit_job(kind, params)``, which stores an ``admin_jobs``
+row and returns its id straight away; the client then polls
+``/jobs/{id}`` for status, progress, duration and the result. That keeps
+RSS refreshes and model calls out of the request, and clear of Heroku's
+30 s router timeout.
+
+Jobs run as coroutines on a dedicated event loop thread, at most
+``JOB_CONCURRENCY`` at a time. Each handler gets its own DB session, its
+params and a ``progress(fraction, message)`` callback that writes to the
+row. Handlers are registered with ``@job_handler("kind")`` next to the
+endpoints that submit them.
+
+State lives in the database, so it survives restarts: ``recover_jobs``
+(run at startup) re-queues jobs that never started and marks the ones that
+were running as ``interrupted``, since their work may be half done.
+"""
+import asyncio
+import logging
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.job import AdminJob
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed", "interrupted")
+FINISHED_STATUSES = ("succeeded", "failed", "interrupted")
+
+Progress = Callable[[float, Optional[str]], None]
+JobHandler = Callable[[Session, dict, Progress], Awaitable[Any]]
+
+_handlers: Dict[str, JobHandler] = {}
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_slots: Optional[asyncio.Semaphore] = None
+_lock = threading.Lock()
+
+def job_handler(kind: str):
+    """Register an ``async def handler(db, params, progress)`` under ``kind``."""
+    def register(fn: JobHandler) -> JobHandler:
+        _handlers[kind] = fn
+        return fn
+    return register
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _slots
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="job-queue", daemon=True).start()
+            _slots = asyncio.Semaphore(max(1, settings.JOB_CONCURRENCY))
+            _loop = loop
+    return _loop
+
+def _update(job_id: str, **values) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(update(AdminJob).where(AdminJob.id == job_id).values(**values))
+        db.commit()
+    finally:
+        db.close()
+
+def _progress_callback(job_id: str) -> Progress:
+    def progress(fraction: float, message: Optional[str] = None) -> None:
+        values = {"progress": max(0.0, min(1.0, float(fraction)))}
+        if message:
+            values["message"] = message[:500]
+        _update(job_id, **values)
+    return progress
+
+async def _run(job_id: str) -> None:
+    async with _slots:
+        db = SessionLocal()
+        try:
+            job = db.get(AdminJob, job_id)
+            if job is None or job.status != "queued":
+                return
+            handler = _handlers.get(job.kind)
+            params = job.params or {}
+            if handler is None:
+                _update(job_id, status="failed", error=f"Unknown job kind: {job.kind}", finished_at=datetime.now())
+                return
+            _update(job_id, status="running", started_at=datetime.now(), message="Running")
+            try:
+                result = await handler(db, params, _progress_callback(job_id))
+            except Exception as e:
+                logger.exception("Job %s (%s) failed", job_id, job.kind)
+                db.rollback()
+                _update(job_id, status="failed", error=str(e) or type(e).__name__,
+                        message="Failed", finished_at=datetime.now())
+                return
+            _update(job_id, status="succeeded", progress=1.0, message="Done",
+                    result=jsonable_encoder(result), finished_at=datetime.now())
+        finally:
+            db.close()
+
+def _schedule(job_id: str) -> None:
+    asyncio.run_coroutine_threadsafe(_run(job_id), _ensure_loop())
+
+def submit_job(kind: str, params: Optional[dict] = None) -> str:
+    """
+    Persist a queued job and hand it to the worker loop.
+
+    Returns:
+        str: the job id, for ``/jobs/{id}``
+
+    Raises:
+        ValueError: if no handler is registered for ``kind``
+    """
+    if kind not in _handlers:
+        raise ValueError(f"Unknown job kind: {kind}")
+    job_id = uuid.uuid4().hex
+    db = SessionLocal()
+    try:
+        db.add(AdminJob(id=job_id, kind=kind, status="queued", message="Queued",
+                        params=jsonable_encoder(params or {})))
+        db.commit()
+    finally:
+        db.close()
+    _schedule(job_id)
+    return job_id
+
+def queued_response(job_id: str, message: str) -> dict:
+    """Body returned by endpoints that hand their work to a job (sent with 202 Accepted)."""
+    return {
+        "success": True,
+        "message": message,
+        "data": {"job_id": job_id, "status": "queued", "status_url": f"{settings.API_V1_STR}/jobs/{job_id}"}
+    }
+
+def recover_jobs() -> dict:
+    """Mark jobs cut off by a restart as interrupted and re-queue those that never started."""
+    db = SessionLocal()
+    try:
+        interrupted = db.execute(
+            update(AdminJob).where(AdminJob.status == "running").values(
+                status="interrupted", message="Interrupted",
+                error="Server restarted while the job was running", finished_at=datetime.now(),
+            )
+        ).rowcount or 0
+        queued = db.execute(
+            select(AdminJob.id).where(AdminJob.status == "queued").order_by(AdminJob.created_at)
+        ).scalars().all()
+        db.commit()
+    finally:
+        db.close()
+    for job_id in queued:
+        _schedule(job_id)
+    return {"interrupted": interrupted, "requeued": len(queued)}
+
+def job_to_dict(job: AdminJob) -> dict:
+    end = job.finished_at or (datetime.now() if job.started_at else None)
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "params": job.params,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "duration_seconds": round((end - job.started_at).total_seconds(), 3) if job.started_at else None,
+    }
+
+def get_job(db: Session, job_id: str) -> Optional[dict]:
+    job = db.get(AdminJob, job_id)
+    return job_to_dict(job) if job else None
+
+def list_jobs(db: Session, status: Optional[str] = None, limit: int = 50) -> List[dict]:
+    """Most recent jobs first, without their (possibly large) results."""
+    stmt = select(AdminJob).order_by(AdminJob.created_at.desc()).limit(limit)
+    if status:
+        stmt = stmt.where(AdminJob.status == status)
+    return [
+        {key: value for key, value in job_to_dict(job).items() if key != "result"}
+        for job in db.execute(stmt).scalars()
+    ]
+
+def purge_jobs(db: Session) -> int:
+    """Delete finished jobs older than JOB_RETENTION_DAYS."""
+    cutoff = datetime.now() - timedelta(days=settings.JOB_RETENTION_DAYS)
+    result = db.execute(
+        delete(AdminJob).where(AdminJob.status.in_(FINISHED_STATUSES), AdminJob.created_at < cutoff)
+    )
+    db.commit()
+    return result.rowcount or 0
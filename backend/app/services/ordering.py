@@ -0,0 +1,148 @@
+"""
+Bulk and incremental ``display_order`` updates for tools, projects and blogs.
+
+``bulk_reorder`` writes a whole drag-and-drop order as one
+``UPDATE ... SET display_order = CASE id WHEN ... END WHERE id IN (...)``
+per chunk. RETURNING reports which ids matched, so missing ids are found in
+the same statement and the transaction is rolled back.
+
+``move_item`` places one row between two neighbours by giving it an integer
+key halfway between theirs, so it touches one row. Keys are integers
+(display_order is an INTEGER column everywhere). When neighbours have no
+gap left, the list is respaced once to multiples of ORDER_SPACING, leaving
+room for about ten more moves into the same spot before the next respace.
+"""
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+ORDER_SPACING = 1024
+# Keeps bound parameters per statement well under SQLite's limit
+CHUNK_SIZE = 1000
+
+class MissingItemsError(LookupError):
+    """Raised when ids passed to a reorder/move don't exist."""
+
+    def __init__(self, missing_ids: Sequence[int]):
+        self.missing_ids = sorted(missing_ids)
+        super().__init__(f"Items not found: {', '.join(map(str, self.missing_ids))}")
+
+def _apply_orders(db: Session, model, orders: Dict[int, int]) -> set:
+    """Set display_order for ``orders`` (id -> order); returns the ids that matched."""
+    found = set()
+    returning = db.get_bind().dialect.update_returning
+    ids = list(orders)
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = {i: orders[i] for i in ids[start:start + CHUNK_SIZE]}
+        stmt = (
+            update(model)
+            .where(model.id.in_(chunk))
+            .values(display_order=case(chunk, value=model.id))
+            .execution_options(synchronize_session=False)
+        )
+        if returning:
+            found.update(db.execute(stmt.returning(model.id)).scalars().all())
+        else:
+            found.update(db.execute(select(model.id).where(model.id.in_(chunk))).scalars().all())
+            db.execute(stmt)
+    return found
+
+def bulk_reorder(db: Session, model, items: Sequence[Tuple[int, int]]) -> int:
+    """
+    Set display_order for every (id, order) pair in one statement per chunk and commit.
+
+    Raises:
+        ValueError: if an id appears twice
+        MissingItemsError: if any id doesn't exist (nothing is changed)
+    """
+    orders = dict(items)
+    if len(orders) != len(items):
+        raise ValueError("Duplicate ids in reorder request")
+    if not orders:
+        return 0
+    found = _apply_orders(db, model, orders)
+    missing = set(orders) - found
+    if missing:
+        db.rollback()
+        raise MissingItemsError(missing)
+    db.commit()
+    return len(orders)
+
+def _respace(db: Session, model) -> None:
+    """Rewrite the whole list's keys to ORDER_SPACING multiples, keeping the current order."""
+    order = func.coalesce(model.display_order, 0)
+    ids = db.execute(select(model.id).order_by(order.asc(), model.id.desc())).scalars().all()
+    _apply_orders(db, model, {row_id: (n + 1) * ORDER_SPACING for n, row_id in enumerate(ids)})
+
+def _neighbour_keys(db: Session, model, item_id: int, after_id: Optional[int], before_id: Optional[int]):
+    wanted = {i for i in (item_id, after_id, before_id) if i is not None}
+    rows = dict(db.execute(select(model.id, model.display_order).where(model.id.in_(wanted))).all())
+    missing = wanted - set(rows)
+    if missing:
+        raise MissingItemsError(missing)
+    after = rows[after_id] or 0 if after_id is not None else None
+    before = rows[before_id] or 0 if before_id is not None else None
+    return after, before
+
+def _adjacent_id(db: Session, model, item_id: int, anchor_id: int, anchor_key: int, below: bool) -> Optional[int]:
+    """The row sorting directly below (or above) the anchor, ignoring the item being moved."""
+    order = func.coalesce(model.display_order, 0)
+    if below:
+        position = or_(order > anchor_key, and_(order == anchor_key, model.id < anchor_id))
+        order_by = (order.asc(), model.id.desc())
+    else:
+        position = or_(order < anchor_key, and_(order == anchor_key, model.id > anchor_id))
+        order_by = (order.desc(), model.id.asc())
+    stmt = select(model.id).where(position, model.id != item_id).order_by(*order_by).limit(1)
+    return db.execute(stmt).scalar()
+
+def _key_between(after: Optional[int], before: Optional[int]) -> Optional[int]:
+    """An integer strictly between the neighbours (None if there is no room)."""
+    if after is None and before is None:
+        return 0
+    if after is None:
+        return before - ORDER_SPACING
+    if before is None:
+        return after + ORDER_SPACING
+    if before - after >= 2:
+        return (after + before) // 2
+    return None
+
+def move_item(db: Session, model, item_id: int, after_id: Optional[int] = None, before_id: Optional[int] = None) -> int:
+    """
+    Move one item so it sorts right after ``after_id`` and right before ``before_id``.
+
+    With only one of them, the item goes directly next to that neighbour
+    (between it and the row currently adjacent to it); a neighbour at the
+    top/bottom of the list moves the item to the top/bottom. Only the moved
+    row is updated, except when the two neighbours have no gap left and the
+    list has to be respaced first.
+
+    Returns:
+        int: the item's new display_order
+
+    Raises:
+        ValueError: if the item is its own neighbour or after_id doesn't sort above before_id
+        MissingItemsError: if any of the ids doesn't exist
+    """
+    if item_id in (after_id, before_id):
+        raise ValueError("An item can't be moved relative to itself")
+    after, before = _neighbour_keys(db, model, item_id, after_id, before_id)
+    if after is not None and before is not None and (after, -after_id) >= (before, -before_id):
+        # Neighbours given out of order, e.g. before_id sorts above after_id
+        raise ValueError("after_id must sort above before_id")
+    # With one neighbour, the other side is the row currently next to it
+    if after_id is not None and before_id is None:
+        before_id = _adjacent_id(db, model, item_id, after_id, after, below=True)
+    elif before_id is not None and after_id is None:
+        after_id = _adjacent_id(db, model, item_id, before_id, before, below=False)
+    after, before = _neighbour_keys(db, model, item_id, after_id, before_id)
+    key = _key_between(after, before)
+    if key is None:
+        _respace(db, model)
+        after, before = _neighbour_keys(db, model, item_id, after_id, before_id)
+        key = _key_between(after, before)
+    _apply_orders(db, model, {item_id: key})
+    db.commit()
+    return key
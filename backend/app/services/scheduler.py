@@ -3,8 +3,9 @@ APScheduler – runs background jobs:
 - fetch blogs every 3 days
 - sync projects DISABLED (was: every 2 hours) - commented out to prevent auto-adding GitHub repos
 - tools auto-update placeholder
+- purge delta-sync tombstones daily
+- purge finished admin jobs daily
 """
-from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.services.blog_service import fetch_and_update_blogs
@@ -28,20 +29,44 @@ def _job(fn):
             db.close()
     return runner
 
+async def run_tombstone_purge(db: Session):
+    """Delete delta-sync tombstones past their retention period"""
+    from app.services.changes_service import purge_tombstones
+    return purge_tombstones(db)
+
+async def run_job_purge(db: Session):
+    """Delete finished admin jobs past their retention period"""
+    from app.services.job_queue import purge_jobs
+    return purge_jobs(db)
+
 def start_scheduler():
     global _scheduler
     if _scheduler and _scheduler.running:
         return
+    # Imported here so processes that never start the scheduler don't pay for it
+    from apscheduler.schedulers.background import BackgroundScheduler
     _scheduler = BackgroundScheduler(timezone="UTC")
     # Run blogs every 3 days for automatic updates
     _scheduler.add_job(_job(fetch_and_update_blogs), "interval", days=3, id="blogs")
     # Projects sync disabled - commented out to prevent auto-adding GitHub repos (like "Daniyal-Portfolio")
     # _scheduler.add_job(_job(sync_projects), "interval", hours=2, id="projects")
     
+    # Drop delete tombstones older than the delta-sync retention window
+    _scheduler.add_job(_job(run_tombstone_purge), "interval", days=1, id="tombstones")
+    
+    # Drop finished admin jobs older than JOB_RETENTION_DAYS
+    _scheduler.add_job(_job(run_job_purge), "interval", days=1, id="admin_jobs")
+    
     # Data backup removed - using PostgreSQL for persistence
     _scheduler.start()
     print("Scheduler started successfully")
 
+def stop_scheduler():
+    """Stop the scheduler on shutdown without waiting for running jobs."""
+    global _scheduler
+    if _scheduler and _scheduler.running:
+        _scheduler.shutdown(wait=False)
+
 # Admin functions for manual refresh
 async def run_blog_update():
     """Manual blog update for admin endpoint"""
@@ -0,0 +1,211 @@
+"""
+Static JSON export of the public content lists.
+
+Renders the payloads of /projects/list, /tools/list and /news/list (plus one
+shard per category) into ``<VOLUME_MOUNT_PATH>/static_export`` so they can be
+served by StaticFiles or synced to any static host / CDN:
+
+    manifest.json                       name -> current versioned file + hashes
+    projects.json, tools.json, ...      stable aliases (short cache)
+    v/tools.3f9c2a1b7e4d.json           content-addressed, cacheable forever
+    *.json.gz / *.json.br               precompressed siblings of every file
+
+Exports are incremental: only documents whose source tables changed since the
+last export are re-rendered, and files are only rewritten when their content
+hash changes. Versioned files from the previous export are kept so clients
+holding the old manifest don't 404.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.change_tracking import on_change, version_token
+from app.core.snapshots import encode_json
+from app.services.content_service import blog_list_payload, projects_payload, tools_payload
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is in requirements.txt
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+VERSIONED_DIR = "v"
+# Export every tool, not just the endpoint's default page
+ALL_TOOLS = 100000
+
+# document group -> (source table, payload builder)
+DOCUMENTS: Dict[str, Tuple[str, Callable[[Session], object]]] = {
+    "projects": ("projects", projects_payload),
+    "tools": ("ai_tools", lambda db: tools_payload(db, limit=ALL_TOOLS)),
+    "blogs": ("blog_posts", blog_list_payload),
+}
+
+_export_lock = threading.Lock()
+
+def export_dir() -> str:
+    return settings.STATIC_EXPORT_DIR or os.path.join(os.environ.get('VOLUME_MOUNT_PATH', './data'), 'static_export')
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-") or "uncategorized"
+
+def _render(name: str, db: Session) -> Dict[str, object]:
+    """The full document for ``name`` plus one shard per category, keyed by file name."""
+    _, builder = DOCUMENTS[name]
+    payload = builder(db)
+    payload = payload.model_dump() if hasattr(payload, "model_dump") else payload
+    docs = {name: payload}
+    shards: Dict[str, list] = {}
+    for item in payload["data"]["items"]:
+        if item.get("category"):
+            shards.setdefault(_slug(item["category"]), []).append(item)
+    for slug, items in shards.items():
+        docs[f"{name}/category/{slug}"] = {**payload, "data": {"items": items}}
+    return docs
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+def _write_with_encodings(path: str, body: bytes) -> Dict[str, int]:
+    """Write ``path`` plus .gz/.br siblings; returns the size of each variant."""
+    sizes = {"bytes": len(body)}
+    _write_atomic(path, body)
+    # mtime=0 keeps the gzip output byte-identical across exports
+    gz = gzip.compress(body, compresslevel=9, mtime=0)
+    _write_atomic(path + ".gz", gz)
+    sizes["gzip_bytes"] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(body, quality=11)
+        _write_atomic(path + ".br", br)
+        sizes["br_bytes"] = len(br)
+    return sizes
+
+def load_manifest(root: Optional[str] = None) -> dict:
+    try:
+        with open(os.path.join(root or export_dir(), MANIFEST)) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+def _prune(root: str, keep: Iterable[str]) -> int:
+    keep = set(keep)
+    removed = 0
+    vdir = os.path.join(root, VERSIONED_DIR)
+    for dirpath, _, filenames in os.walk(vdir):
+        for filename in filenames:
+            rel = os.path.relpath(os.path.join(dirpath, filename), root)
+            base = re.sub(r"\.(gz|br)$", "", rel)
+            if base not in keep:
+                os.remove(os.path.join(dirpath, filename))
+                removed += 1
+    return removed
+
+def export_static(db: Session, full: bool = False, root: Optional[str] = None) -> dict:
+    """
+    Render changed document groups to static files and update the manifest.
+
+    Args:
+        full: re-render every group even if its table version is unchanged
+
+    Returns:
+        dict: counts of written / unchanged / pruned files and the export path
+    """
+    root = root or export_dir()
+    with _export_lock:
+        started = time.perf_counter()
+        previous = load_manifest(root)
+        files = dict(previous.get("files", {}))
+        versions = dict(previous.get("versions", {}))
+        written, unchanged, rendered = [], 0, []
+
+        for name, (table, _) in DOCUMENTS.items():
+            token = version_token([table])
+            if not full and versions.get(name) == token and any(k == name or k.startswith(name + "/") for k in files):
+                continue
+            rendered.append(name)
+            docs = _render(name, db)
+            # Drop entries for shards that no longer exist (e.g. a category emptied)
+            for key in [k for k in files if k == name or k.startswith(name + "/")]:
+                if key not in docs:
+                    files.pop(key)
+                    alias = os.path.join(root, key + ".json")
+                    for suffix in ("", ".gz", ".br"):
+                        if os.path.exists(alias + suffix):
+                            os.remove(alias + suffix)
+            for key, payload in docs.items():
+                body = encode_json(payload)
+                digest = hashlib.sha256(body).hexdigest()
+                if files.get(key, {}).get("sha256") == digest and os.path.exists(os.path.join(root, files[key]["path"])):
+                    unchanged += 1
+                    continue
+                versioned = f"{VERSIONED_DIR}/{key}.{digest[:12]}.json"
+                sizes = _write_with_encodings(os.path.join(root, versioned), body)
+                _write_with_encodings(os.path.join(root, key + ".json"), body)
+                files[key] = {"path": versioned, "sha256": digest, "table": table, **sizes}
+                written.append(key)
+            versions[name] = token
+
+        manifest = {
+            "generated_at": datetime.utcnow().isoformat(),
+            "versions": versions,
+            "files": dict(sorted(files.items())),
+        }
+        _write_atomic(os.path.join(root, MANIFEST), json.dumps(manifest, indent=2).encode("utf-8"))
+        # Keep the previous generation's versioned files for clients holding the old manifest
+        keep = [f["path"] for f in files.values()] + [f["path"] for f in previous.get("files", {}).values()]
+        pruned = _prune(root, keep)
+
+        return {
+            "path": os.path.abspath(root),
+            "rendered_groups": rendered,
+            "written": written,
+            "unchanged": unchanged,
+            "pruned_files": pruned,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+_pending = threading.Event()
+_worker = None
+
+def _run_auto_export() -> None:
+    from app.database import SessionLocal
+
+    while True:
+        _pending.wait()
+        # Coalesce bursts of admin edits into one export
+        time.sleep(settings.STATIC_EXPORT_DEBOUNCE_SECONDS)
+        _pending.clear()
+        db = SessionLocal()
+        try:
+            result = export_static(db)
+            logger.info("Static export updated: %s", result["written"])
+        except Exception as e:
+            logger.warning("Static export failed: %s", e)
+        finally:
+            db.close()
+
+def _on_tables_changed(tables: set) -> None:
+    global _worker
+    if not settings.STATIC_EXPORT_ENABLED:
+        return
+    if _worker is None:
+        _worker = threading.Thread(target=_run_auto_export, name="static-export", daemon=True)
+        _worker.start()
+    _pending.set()
+
+on_change(_on_tables_changed)
@@ -0,0 +1,87 @@
+"""
+Row counts for the admin dashboard, startup check and home page facets.
+
+All three content tables are counted in one round trip: a UNION ALL of one
+``GROUP BY category`` aggregate per table (tools are also grouped by
+``auto_fetched``). Totals, manual/auto splits and category lists are then
+derived in Python from those few grouped rows.
+
+The result is cached per content version (see change_tracking), so any
+write made through the app invalidates it immediately. A short TTL on top
+covers writes the versions can't see (one-off scripts, psql).
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import false, func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.change_tracking import TRACKED_TABLES, version_token
+from app.models.blog import BlogPost
+from app.models.project import Project
+from app.models.tool import Tool
+
+# Dashboard key -> (table, model)
+STATS_TABLES = {
+    "tools": ("ai_tools", Tool),
+    "projects": ("projects", Project),
+    "blogs": ("blog_posts", BlogPost),
+}
+
+_cache: Dict[str, object] = {"token": None, "expires": 0.0, "stats": None}
+_lock = threading.Lock()
+
+def _grouped_counts(db: Session) -> List[tuple]:
+    """(collection, category, auto_fetched, count) rows for every table in one query."""
+    parts = []
+    for name, (_, model) in STATS_TABLES.items():
+        auto = model.auto_fetched if model is Tool else false()
+        parts.append(
+            select(literal(name).label("collection"), model.category.label("category"),
+                   auto.label("auto_fetched"), func.count().label("count"))
+            .group_by(model.category, *([model.auto_fetched] if model is Tool else []))
+        )
+    return db.execute(union_all(*parts)).all()
+
+def _build(rows: List[tuple]) -> dict:
+    stats = {name: {"total": 0, "by_category": {}} for name in STATS_TABLES}
+    stats["tools"].update(manual=0, auto=0)
+    for name, category, auto_fetched, count in rows:
+        entry = stats[name]
+        entry["total"] += count
+        if category:
+            entry["by_category"][category] = entry["by_category"].get(category, 0) + count
+        if name == "tools":
+            entry["auto" if auto_fetched else "manual"] += count
+    for entry in stats.values():
+        entry["categories"] = sorted(entry["by_category"])
+    return stats
+
+def get_content_stats(db: Session, max_age: Optional[float] = None) -> dict:
+    """
+    Totals and per-category counts for tools, projects and blogs.
+
+    Returns:
+        dict: {"tools": {"total", "manual", "auto", "categories", "by_category"},
+               "projects": {...}, "blogs": {...}} - shared, don't mutate
+    """
+    token = version_token(TRACKED_TABLES)
+    now = time.monotonic()
+    with _lock:
+        if _cache["stats"] is not None and _cache["token"] == token and now < _cache["expires"]:
+            return _cache["stats"]
+    stats = _build(_grouped_counts(db))
+    ttl = settings.STATS_CACHE_TTL_SECONDS if max_age is None else max_age
+    with _lock:
+        _cache.update(token=token, expires=now + ttl, stats=stats)
+    return stats
+
+def category_facets(db: Session, collection: str) -> List[dict]:
+    """[{category, count}] for one collection, most common first."""
+    by_category = get_content_stats(db)[collection]["by_category"]
+    return [
+        {"category": category, "count": count}
+        for category, count in sorted(by_category.items(), key=lambda item: (-item[1], item[0]))
+    ]
@@ -2,15 +2,16 @@ import uuid
 import html
 import logging
 from datetime import datetime
-from typing import List
-import feedparser
+from typing import Any, List
 import httpx
-from bs4 import BeautifulSoup
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.tool import Tool
 from app.core.tools_sources import TOOLS_SOURCES
 from app.core.ai_client import llm_chat  # existing helper that calls OpenRouter
+from app.core.search import search_tools
+from app.core.records import fetch_records
 from app.database import SessionLocal
 
 logger = logging.getLogger(__name__)
@@ -69,6 +70,7 @@ async def fetch_tools_from_source(url: str, limit_per_source: int = 10):
     """
     tools = []
     try:
+        import feedparser
         feed = feedparser.parse(url)
         if not feed.entries:
             logger.warning("No entries found in feed: %s", url)
@@ -152,15 +154,44 @@ async def fetch_and_update_tools(db: Session):
         db.commit()
     return {"added": added, "timestamp": datetime.utcnow().isoformat()}
 
-def list_tools_db(db: Session, q: str = None, category: str = None, limit: int = 200):
-    """List tools with optional search and category filtering."""
-    query = db.query(Tool)
-    
+def _search_tool_ids(db: Session, q: str, category: str, limit: int):
+    """Ranked ids from the trigram index, or None to fall back to a LIKE filter."""
+    try:
+        return search_tools(db, q, category, limit)
+    except Exception as e:
+        logger.warning("Trigram tool search failed, using LIKE: %s", e)
+        db.rollback()
+        return None
+
+def _filter_tools(stmt, q: str = None, category: str = None):
     if q:
-        query = query.filter(Tool.name.ilike(f"%{q}%") | Tool.description.ilike(f"%{q}%"))
-    
+        stmt = stmt.filter(Tool.name.ilike(f"%{q}%") | Tool.description.ilike(f"%{q}%"))
     if category:
-        query = query.filter(Tool.category == category)
-    
+        stmt = stmt.filter(Tool.category == category)
     # Order by display_order first, then by id as fallback
-    return query.order_by(Tool.display_order.asc(), Tool.id.desc()).limit(limit).all()
\ No newline at end of file
+    return stmt.order_by(Tool.display_order.asc(), Tool.id.desc())
+
+def list_tools_db(db: Session, q: str = None, category: str = None, limit: int = 200):
+    """List tools with optional search and category filtering.
+
+    Searches go through the trigram index (typo tolerant, ranked by
+    similarity); queries under three characters, or databases without the
+    index, fall back to a substring filter in display order.
+    """
+    if q:
+        ids = _search_tool_ids(db, q, category, limit)
+        if ids is not None:
+            tools = {t.id: t for t in db.query(Tool).filter(Tool.id.in_(ids)).all()} if ids else {}
+            return [tools[i] for i in ids if i in tools]
+    return _filter_tools(db.query(Tool), q, category).limit(limit).all()
+
+def list_tool_records(db: Session, columns, q: str = None, category: str = None, limit: int = 200) -> List[Any]:
+    """Same results as list_tools_db, but as records of ``columns`` (must include Tool.id)."""
+    if q:
+        ids = _search_tool_ids(db, q, category, limit)
+        if ids is not None:
+            if not ids:
+                return []
+            by_id = {r.id: r for r in fetch_records(db, select(*columns).where(Tool.id.in_(ids)))}
+            return [by_id[i] for i in ids if i in by_id]
+    return fetch_records(db, _filter_tools(select(*columns), q, category).limit(limit))
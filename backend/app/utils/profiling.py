@@ -0,0 +1,51 @@
+"""
+Opt-in per-stage timing for pipeline code.
+
+Code wraps its stages in ``with stage("parse"):``. Outside of
+``collect_stage_timings()`` that is a single context-variable lookup, so the
+hooks can stay in production paths; benchmarks activate a collector to get
+cumulative wall time and call counts per stage.
+"""
+import contextvars
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+_current = contextvars.ContextVar("stage_timings", default=None)
+
+class StageTimings:
+    """Cumulative seconds and call counts per named stage."""
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    def add(self, name: str, elapsed: float):
+        self.seconds[name] += elapsed
+        self.calls[name] += 1
+
+    def as_dict(self) -> dict:
+        return {name: {"seconds": self.seconds[name], "calls": self.calls[name]} for name in self.seconds}
+
+@contextmanager
+def stage(name: str):
+    """Time the enclosed block under ``name`` if a collector is active."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, perf_counter() - start)
+
+@contextmanager
+def collect_stage_timings():
+    """Activate a StageTimings collector for the enclosed block (and tasks it awaits)."""
+    timings = StageTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
@@ -1,2 +1,75 @@
+import hashlib
+import re
+
 def safe_truncate(text: str, n: int) -> str:
     return (text[: n - 3] + "...") if len(text) > n else text
+
+# SimHash fingerprints for near-duplicate detection.
+# A 64-bit fingerprint is split into SIMHASH_BANDS bands of 16 bits; two
+# fingerprints within SIMHASH_BANDS - 1 bits of each other must share at
+# least one band exactly (pigeonhole), so an index on each band finds
+# every near-duplicate candidate without scanning.
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+SIMHASH_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+NEAR_DUPLICATE_DISTANCE = SIMHASH_BANDS - 1
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+def _shingles(text: str, size: int = 3):
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of word 3-gram shingles (unsigned)."""
+    weights = [0] * SIMHASH_BITS
+    for shingle in _shingles(text):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value
+
+def simhash_bands(value: int) -> list:
+    """Split an unsigned fingerprint into SIMHASH_BANDS integer bands."""
+    mask = (1 << SIMHASH_BAND_BITS) - 1
+    return [(value >> (i * SIMHASH_BAND_BITS)) & mask for i in range(SIMHASH_BANDS)]
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count("1")
+
+def to_signed64(value: int) -> int:
+    """Store an unsigned 64-bit fingerprint in a signed BIGINT column."""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+def from_signed64(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+# Trigram similarity, computed the way PostgreSQL's pg_trgm does: each word is
+# lower-cased and padded with two leading spaces and one trailing space before
+# being split into 3-character grams.
+def trigrams(text: str) -> set:
+    grams = set()
+    for word in _WORD_RE.findall((text or "").lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def trigram_similarity(a: str, b: str) -> float:
+    """pg_trgm ``similarity``: shared trigrams over the union of both sets."""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
+
+def word_similarity(query: str, text: str) -> float:
+    """Approximation of pg_trgm ``word_similarity``: share of the query's trigrams found in ``text``."""
+    tq = trigrams(query)
+    if not tq:
+        return 0.0
+    return len(tq & trigrams(text)) / len(tq)
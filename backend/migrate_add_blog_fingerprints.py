@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Migration script to add SimHash fingerprint columns to blog_posts
+Run this script to add near-duplicate detection columns and their band indexes,
+then fingerprint the existing rows in batches with the same SimHash and band
+functions ingestion uses. Ingestion hashes the feed's title and summary before
+enhancement; only the enhanced content is stored, so existing rows are hashed
+from their title and content. Re-running only fills rows still missing one.
+"""
+
+import os
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.utils.text import simhash, simhash_bands, to_signed64
+
+BACKFILL_BATCH_SIZE = 500
+
+def get_database_url():
+    """Get database URL from environment variables"""
+    # Try PostgreSQL first (production)
+    if 'DATABASE_URL' in os.environ:
+        return os.environ['DATABASE_URL']
+    
+    # Fallback to local SQLite
+    return 'sqlite:///./data/portfolio.db'
+
+def add_fingerprint_columns():
+    """Add simhash columns and band indexes to blog_posts"""
+    db_url = get_database_url()
+    print(f"Connecting to database: {db_url[:50]}...")
+    
+    engine = create_engine(db_url)
+    
+    migrations = [
+        "ALTER TABLE blog_posts ADD COLUMN simhash BIGINT;",
+        "ALTER TABLE blog_posts ADD COLUMN simhash_band0 INTEGER;",
+        "ALTER TABLE blog_posts ADD COLUMN simhash_band1 INTEGER;",
+        "ALTER TABLE blog_posts ADD COLUMN simhash_band2 INTEGER;",
+        "ALTER TABLE blog_posts ADD COLUMN simhash_band3 INTEGER;",
+        "CREATE INDEX IF NOT EXISTS ix_blog_posts_simhash_band0 ON blog_posts (simhash_band0);",
+        "CREATE INDEX IF NOT EXISTS ix_blog_posts_simhash_band1 ON blog_posts (simhash_band1);",
+        "CREATE INDEX IF NOT EXISTS ix_blog_posts_simhash_band2 ON blog_posts (simhash_band2);",
+        "CREATE INDEX IF NOT EXISTS ix_blog_posts_simhash_band3 ON blog_posts (simhash_band3);",
+    ]
+    
+    with engine.connect() as conn:
+        for migration in migrations:
+            try:
+                print(f"Executing: {migration}")
+                conn.execute(text(migration))
+                conn.commit()
+                print("✅ Success")
+            except (OperationalError, ProgrammingError) as e:
+                conn.rollback()
+                if "already exists" in str(e) or "duplicate column" in str(e):
+                    print("⚠️  Column already exists, skipping")
+                else:
+                    print(f"❌ Error: {e}")
+            except Exception as e:
+                conn.rollback()
+                print(f"❌ Unexpected error: {e}")
+    
+    backfill_fingerprints(engine)
+    print("Migration completed!")
+
+def backfill_fingerprints(engine, batch_size: int = BACKFILL_BATCH_SIZE):
+    """Fingerprint blog_posts rows whose simhash is NULL, batch_size rows per transaction"""
+    select_batch = text(
+        "SELECT id, title, content FROM blog_posts "
+        "WHERE simhash IS NULL AND id > :last_id ORDER BY id LIMIT :limit"
+    )
+    update_row = text(
+        "UPDATE blog_posts SET simhash = :simhash, simhash_band0 = :band0, simhash_band1 = :band1, "
+        "simhash_band2 = :band2, simhash_band3 = :band3 WHERE id = :id"
+    )
+    last_id, total = 0, 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(select_batch, {"last_id": last_id, "limit": batch_size}).all()
+            if not rows:
+                break
+            params = []
+            for row in rows:
+                fingerprint = simhash(f"{row.title} {row.content}")
+                bands = simhash_bands(fingerprint)
+                params.append({"id": row.id, "simhash": to_signed64(fingerprint),
+                               **{f"band{i}": band for i, band in enumerate(bands)}})
+            conn.execute(update_row, params)
+        last_id = rows[-1].id
+        total += len(rows)
+        print(f"✅ Fingerprinted {total} existing posts")
+    if not total:
+        print("⚠️  No posts without fingerprints, skipping backfill")
+
+if __name__ == "__main__":
+    add_fingerprint_columns()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the list/lookup indexes declared on the models
+Creates the (display_order, id DESC) and (category, display_order, id DESC)
+indexes used by every list query, plus blog_posts.url and
+ai_tools(auto_fetched, category). New databases get them from create_all;
+this brings existing ones up to date.
+
+On PostgreSQL the indexes are built with CREATE INDEX CONCURRENTLY so the
+live site keeps reading and writing while they build. CONCURRENTLY can't
+run inside a transaction, so each statement runs in autocommit mode; an
+index left INVALID by an earlier interrupted build is dropped and rebuilt.
+
+Run scripts/check_query_plans.py afterwards to confirm the planner uses them.
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+from sqlalchemy.schema import CreateIndex
+
+sys.path.append(os.path.dirname(__file__))
+
+INDEXED_TABLES = ["ai_tools", "projects", "blog_posts"]
+
+# Indexes added by this migration (the older id / simhash band indexes are left alone)
+NEW_INDEXES = {
+    "ix_ai_tools_display_order_id",
+    "ix_ai_tools_category_display_order_id",
+    "ix_ai_tools_auto_fetched_category",
+    "ix_projects_display_order_id",
+    "ix_projects_category_display_order_id",
+    "ix_blog_posts_display_order_id",
+    "ix_blog_posts_category_display_order_id",
+    "ix_blog_posts_url",
+}
+
+def get_database_url():
+    """Get database URL from environment variables"""
+    # Try PostgreSQL first (production)
+    if 'DATABASE_URL' in os.environ:
+        return os.environ['DATABASE_URL']
+
+    # Fallback to local SQLite
+    return 'sqlite:///./data/portfolio.db'
+
+def index_statements(dialect):
+    """CREATE INDEX statements for NEW_INDEXES, compiled from the model definitions."""
+    from app.database import Base
+    import app.models  # noqa: F401 - register models
+
+    for table in INDEXED_TABLES:
+        for index in sorted(Base.metadata.tables[table].indexes, key=lambda i: i.name):
+            if index.name not in NEW_INDEXES:
+                continue
+            sql = str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect))
+            if dialect.name == "postgresql":
+                sql = sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+            yield index.name, table, sql
+
+def drop_invalid_index(conn, name):
+    """Drop an index left INVALID by an interrupted concurrent build."""
+    invalid = conn.execute(text(
+        "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+        "WHERE c.relname = :name AND NOT i.indisvalid"
+    ), {"name": name}).first()
+    if invalid:
+        print(f"⚠️  {name} is INVALID from an earlier attempt, rebuilding")
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+def add_list_indexes():
+    """Create the list/lookup indexes and refresh planner statistics"""
+    db_url = get_database_url()
+    print(f"Connecting to database: {db_url[:50]}...")
+
+    engine = create_engine(db_url)
+    is_postgres = engine.dialect.name == "postgresql"
+
+    # CONCURRENTLY refuses to run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for name, table, sql in index_statements(engine.dialect):
+            try:
+                if is_postgres:
+                    drop_invalid_index(conn, name)
+                print(f"Executing: {sql}")
+                conn.execute(text(sql))
+                print("✅ Success")
+            except Exception as e:
+                print(f"❌ Error creating {name}: {e}")
+
+        for table in INDEXED_TABLES:
+            try:
+                conn.execute(text(f"ANALYZE {table}"))
+            except Exception as e:
+                print(f"⚠️  ANALYZE {table} failed: {e}")
+
+    print("Migration completed!")
+
+if __name__ == "__main__":
+    add_list_indexes()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Migration script for delta sync (/changes)
+Adds updated_at to ai_tools and projects (backfilled to the migration time so
+the first incremental sync after it re-sends every row once), indexes the
+change timestamps, and creates the tombstones table for deletes.
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+sys.path.append(os.path.dirname(__file__))
+
+def get_database_url():
+    """Get database URL from environment variables"""
+    # Try PostgreSQL first (production)
+    if 'DATABASE_URL' in os.environ:
+        return os.environ['DATABASE_URL']
+    
+    # Fallback to local SQLite
+    return 'sqlite:///./data/portfolio.db'
+
+def add_sync_tracking():
+    """Add updated_at columns, change-timestamp indexes and the tombstones table"""
+    db_url = get_database_url()
+    print(f"Connecting to database: {db_url[:50]}...")
+    
+    engine = create_engine(db_url)
+    timestamp = "TIMESTAMP" if engine.dialect.name == "postgresql" else "DATETIME"
+    
+    migrations = [
+        f"ALTER TABLE ai_tools ADD COLUMN updated_at {timestamp};",
+        f"ALTER TABLE projects ADD COLUMN updated_at {timestamp};",
+        "UPDATE ai_tools SET updated_at = CURRENT_TIMESTAMP WHERE updated_at IS NULL;",
+        "UPDATE projects SET updated_at = CURRENT_TIMESTAMP WHERE updated_at IS NULL;",
+        "UPDATE blog_posts SET last_updated = CURRENT_TIMESTAMP WHERE last_updated IS NULL;",
+        "CREATE INDEX IF NOT EXISTS ix_ai_tools_updated_at ON ai_tools (updated_at);",
+        "CREATE INDEX IF NOT EXISTS ix_projects_updated_at ON projects (updated_at);",
+        "CREATE INDEX IF NOT EXISTS ix_blog_posts_last_updated ON blog_posts (last_updated);",
+    ]
+    
+    with engine.connect() as conn:
+        for migration in migrations:
+            try:
+                print(f"Executing: {migration}")
+                conn.execute(text(migration))
+                conn.commit()
+                print("✅ Success")
+            except (OperationalError, ProgrammingError) as e:
+                conn.rollback()
+                if "already exists" in str(e) or "duplicate column" in str(e):
+                    print("⚠️  Column already exists, skipping")
+                else:
+                    print(f"❌ Error: {e}")
+            except Exception as e:
+                conn.rollback()
+                print(f"❌ Unexpected error: {e}")
+    
+    # The tombstones table is new, so create_all can build it (with its indexes)
+    from app.models.tombstone import Tombstone
+    Tombstone.__table__.create(bind=engine, checkfirst=True)
+    print("✅ tombstones table ready")
+    
+    print("Migration completed!")
+
+if __name__ == "__main__":
+    add_sync_tracking()
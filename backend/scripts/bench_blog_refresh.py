@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Offline feed-replay benchmark for the blog refresh job.
+
+Serves the recorded feeds in scripts/fixtures/feeds (plus generated multi-MB
+feeds) from a local HTTP server, points BLOG_SOURCES at them and runs
+fetch_and_update_blogs against a fresh database. Each run does a cold
+refresh (empty tables) followed by a warm one (high-water marks in place),
+and reports per-stage timings and peak memory.
+
+Usage:
+    python scripts/bench_blog_refresh.py
+    python scripts/bench_blog_refresh.py --runs 5 --large-mb 8 --json bench.json
+    python scripts/bench_blog_refresh.py --no-streaming          # feedparser only
+    python scripts/bench_blog_refresh.py --database-url postgresql://...   # tables are dropped!
+
+Compare two JSON reports with --compare old.json.
+"""
+import argparse
+import asyncio
+import functools
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "feeds"
+STAGES = ["fetch", "parse", "fetch+parse (feedparser)", "clean", "classify", "db_write"]
+
+def generate_large_feed(path: Path, size_mb: float, tag: str):
+    """Write an RSS feed of roughly ``size_mb`` MB with full HTML bodies per item."""
+    paragraph = (
+        "<p>Researchers trained a transformer language model on a new dataset and report "
+        "gains in machine learning benchmarks, with analysis of neural network scaling.</p>"
+    )
+    body = paragraph * 60  # ~10 KB of HTML per item
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write('<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0" '
+                 'xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>'
+                 f"<title>Large fixture {tag}</title>")
+        i = 0
+        while written < target:
+            item = (
+                f"<item><title>Large feed {tag} deep learning study {i}</title>"
+                f"<link>https://large.example.com/{tag}/{i}</link><guid>{tag}-{i}</guid>"
+                f"<pubDate>Mon, 12 Oct 2026 {i % 24:02d}:00:00 GMT</pubDate>"
+                f"<description>Model training research summary {i} for {tag}.</description>"
+                f"<content:encoded><![CDATA[{body}]]></content:encoded></item>"
+            )
+            fh.write(item)
+            written += len(item)
+            i += 1
+        fh.write("</channel></rss>")
+
+def start_server(directory: Path):
+    """Serve ``directory`` on an ephemeral localhost port; returns (server, base_url)."""
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+    handler = functools.partial(QuietHandler, directory=str(directory))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def run_refresh(label: str):
+    """Run one fetch_and_update_blogs pass and collect timings / memory."""
+    from app.database import SessionLocal
+    from app.services.blog_service import fetch_and_update_blogs
+    from app.utils.profiling import collect_stage_timings
+
+    db = SessionLocal()
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        with collect_stage_timings() as timings:
+            result = asyncio.run(fetch_and_update_blogs(db))
+    finally:
+        db.close()
+    total = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "label": label,
+        "total_seconds": total,
+        "peak_traced_mb": peak / (1024 * 1024),
+        "stages": timings.as_dict(),
+        "result": {k: v for k, v in result.items() if k != "timestamp"},
+    }
+
+def reset_database():
+    from app.database import engine, Base
+    from app.core.search import ensure_search_indexes
+    import app.models  # noqa: F401 - register models
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    try:
+        ensure_search_indexes(engine)
+    except Exception as e:
+        print(f"⚠️  Search indexes not created: {e}")
+
+def print_report(runs):
+    header = f"{'run':<10}{'total s':>10}{'peak MB':>10}" + "".join(f"{s[:12]:>14}" for s in STAGES) + "   result"
+    print(header)
+    print("-" * len(header))
+    for r in runs:
+        cells = "".join(f"{r['stages'].get(s, {}).get('seconds', 0.0):>14.4f}" for s in STAGES)
+        print(f"{r['label']:<10}{r['total_seconds']:>10.4f}{r['peak_traced_mb']:>10.2f}{cells}   {r['result']}")
+
+def summarise(runs):
+    """Median per label so repeated runs can be compared."""
+    summary = {}
+    for label in sorted({r["label"] for r in runs}):
+        subset = [r for r in runs if r["label"] == label]
+        def median(values):
+            values = sorted(values)
+            return values[len(values) // 2]
+        summary[label] = {
+            "total_seconds": median([r["total_seconds"] for r in subset]),
+            "peak_traced_mb": median([r["peak_traced_mb"] for r in subset]),
+            "stages": {s: median([r["stages"].get(s, {}).get("seconds", 0.0) for r in subset]) for s in STAGES},
+        }
+    return summary
+
+def compare(current, previous_path):
+    with open(previous_path) as fh:
+        previous = json.load(fh)["summary"]
+    print(f"\nComparison against {previous_path} (median seconds, negative is faster):")
+    for label, stats in current.items():
+        old = previous.get(label)
+        if not old:
+            continue
+        delta = stats["total_seconds"] - old["total_seconds"]
+        pct = (delta / old["total_seconds"] * 100) if old["total_seconds"] else 0.0
+        print(f"  {label:<8} total {stats['total_seconds']:.4f}s ({delta:+.4f}s, {pct:+.1f}%), "
+              f"peak {stats['peak_traced_mb']:.2f}MB (was {old['peak_traced_mb']:.2f}MB)")
+        for s in STAGES:
+            d = stats["stages"][s] - old["stages"].get(s, 0.0)
+            if stats["stages"][s] or old["stages"].get(s):
+                print(f"      {s:<26}{stats['stages'][s]:.4f}s ({d:+.4f}s)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the blog refresh job against recorded feeds")
+    parser.add_argument("--runs", type=int, default=3, help="number of cold+warm iterations")
+    parser.add_argument("--large-mb", type=float, default=4.0, help="size of each generated large feed (0 to skip)")
+    parser.add_argument("--large-feeds", type=int, default=2, help="number of generated large feeds")
+    parser.add_argument("--database-url", help="database to benchmark against (tables are dropped and recreated)")
+    parser.add_argument("--no-streaming", action="store_true", help="disable the streaming feed reader")
+    parser.add_argument("--json", help="write the full report to this file")
+    parser.add_argument("--compare", help="previous --json report to compare against")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="blog-bench-"))
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{workdir / 'bench.db'}"
+    os.environ["BLOG_STREAMING_PARSER"] = "false" if args.no_streaming else "true"
+
+    # Import the app only after DATABASE_URL points at the benchmark database
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+    from app.services import blog_service
+
+    feeds_dir = workdir / "feeds"
+    feeds_dir.mkdir()
+    for fixture in sorted(FIXTURES_DIR.glob("*.xml")):
+        (feeds_dir / fixture.name).write_bytes(fixture.read_bytes())
+    if args.large_mb > 0:
+        for n in range(args.large_feeds):
+            generate_large_feed(feeds_dir / f"large_{n}.xml", args.large_mb, f"l{n}")
+
+    server, base_url = start_server(feeds_dir)
+    feed_files = sorted(p.name for p in feeds_dir.glob("*.xml"))
+    blog_service.BLOG_SOURCES = [f"{base_url}/{name}" for name in feed_files]
+    total_mb = sum((feeds_dir / n).stat().st_size for n in feed_files) / (1024 * 1024)
+    print(f"📡 Serving {len(feed_files)} feeds ({total_mb:.1f} MB) from {base_url}")
+    print(f"🗄️  Database: {os.environ['DATABASE_URL'].split('@')[-1]}")
+    print(f"⚙️  Streaming parser: {'off' if args.no_streaming else 'on'}\n")
+
+    runs = []
+    try:
+        for i in range(args.runs):
+            reset_database()
+            runs.append(run_refresh("cold"))
+            runs.append(run_refresh("warm"))
+    finally:
+        server.shutdown()
+
+    print_report(runs)
+    summary = summarise(runs)
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"\nProcess max RSS: {max_rss_mb:.1f} MB")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump({
+                "streaming": not args.no_streaming,
+                "feeds": feed_files,
+                "feed_mb": total_mb,
+                "max_rss_mb": max_rss_mb,
+                "runs": runs,
+                "summary": summary,
+            }, fh, indent=2, default=str)
+        print(f"📝 Report written to {args.json}")
+    if args.compare:
+        compare(summary, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Per-row cost of the list read path: ORM hydration vs column records.
+
+Seeds a throwaway database with N tools and projects, then times, per row:
+  - orm:      db.query(Model).all() + per-field dict copy + jsonable_encoder + json
+  - records:  column select into dicts (app.core.records) + encode_json (orjson)
+split into query/build and serialise stages.
+
+Usage:
+    python scripts/bench_list_queries.py                # 10k rows, SQLite
+    python scripts/bench_list_queries.py --rows 50000 --repeat 7
+    python scripts/bench_list_queries.py --database-url postgresql://...   # tables are dropped!
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+def seed(rows: int):
+    from sqlalchemy import insert
+    from app.database import Base, SessionLocal, engine
+    from app.models import Project, Tool
+    import app.models  # noqa: F401 - register models
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.execute(insert(Tool), [{
+            "name": f"Tool {i}", "description": "An AI tool for writing, coding and image generation " * 3,
+            "category": f"Category {i % 12}", "status": "Active", "url": f"https://tools.example.com/{i}",
+            "pricing": "Freemium", "display_order": i % 500, "auto_fetched": i % 3 == 0,
+        } for i in range(rows)])
+        db.execute(insert(Project), [{
+            "name": f"Project {i}", "description": "A full-stack project with FastAPI and Next.js " * 3,
+            "github_url": f"https://github.com/example/{i}", "category": f"Category {i % 12}",
+            "technologies": "Python, FastAPI, React", "display_order": i % 500,
+        } for i in range(rows)])
+        db.commit()
+    finally:
+        db.close()
+
+def orm_tools(db):
+    from app.models import Tool
+    rows = db.query(Tool).order_by(Tool.display_order.asc(), Tool.id.desc()).all()
+    return [{
+        "id": r.id, "name": r.name, "description": r.description, "category": r.category,
+        "status": r.status, "url": r.url, "pricing": r.pricing, "image_url": r.image_url,
+        "source": r.source, "auto_fetched": r.auto_fetched,
+        "last_checked": r.last_checked.isoformat() if r.last_checked else None,
+    } for r in rows]
+
+def record_tools(db):
+    from app.services.content_service import TOOL_LIST_COLUMNS
+    from app.services.tools_service import list_tool_records
+    return list_tool_records(db, TOOL_LIST_COLUMNS, limit=10 ** 9)
+
+def orm_projects(db):
+    from app.models import Project
+    rows = db.query(Project).order_by(Project.display_order.asc(), Project.id.desc()).all()
+    return [{
+        "id": p.id, "name": p.name, "description": p.description, "url": p.url,
+        "github_url": p.github_url, "category": p.category, "technologies": p.technologies,
+        "image_url": p.image_url,
+    } for p in rows]
+
+def record_projects(db):
+    from app.services.content_service import projects_payload
+    return projects_payload(db).data["items"]
+
+def serialise_legacy(items) -> bytes:
+    from fastapi.encoders import jsonable_encoder
+    return json.dumps(jsonable_encoder({"success": True, "data": {"items": items}})).encode("utf-8")
+
+def serialise_fast(items) -> bytes:
+    from app.core.snapshots import encode_json
+    return encode_json({"success": True, "data": {"items": items}})
+
+def measure(build, serialise, repeat: int):
+    """Median (build seconds, serialise seconds, row count) over ``repeat`` runs."""
+    from app.database import SessionLocal
+    builds, sers, count = [], [], 0
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            items = build(db)
+            built = time.perf_counter()
+            serialise(items)
+            done = time.perf_counter()
+        finally:
+            db.close()
+        builds.append(built - started)
+        sers.append(done - built)
+        count = len(items)
+    builds.sort()
+    sers.sort()
+    return builds[len(builds) // 2], sers[len(sers) // 2], count
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ORM hydration with column records for list endpoints")
+    parser.add_argument("--rows", type=int, default=10000, help="rows per table")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per variant (median reported)")
+    parser.add_argument("--database-url", help="database to benchmark against (tables are dropped and recreated)")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="list-bench-"))
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{workdir / 'bench.db'}"
+    # Import the app only after DATABASE_URL points at the benchmark database
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+    print(f"🌱 Seeding {args.rows} tools and projects into {os.environ['DATABASE_URL'].split('@')[-1]}")
+    seed(args.rows)
+
+    variants = [
+        ("tools", "orm", orm_tools, serialise_legacy),
+        ("tools", "records", record_tools, serialise_fast),
+        ("projects", "orm", orm_projects, serialise_legacy),
+        ("projects", "records", record_projects, serialise_fast),
+    ]
+    print(f"\n{'list':<10}{'path':<10}{'rows':>8}{'build µs/row':>15}{'encode µs/row':>15}{'total ms':>11}")
+    results = {}
+    for table, label, build, serialise in variants:
+        build_s, ser_s, count = measure(build, serialise, args.repeat)
+        results[(table, label)] = build_s + ser_s
+        per = 1e6 / max(count, 1)
+        print(f"{table:<10}{label:<10}{count:>8}{build_s * per:>15.2f}{ser_s * per:>15.2f}{(build_s + ser_s) * 1000:>11.1f}")
+
+    print()
+    for table in ("tools", "projects"):
+        speedup = results[(table, "orm")] / results[(table, "records")]
+        print(f"{table}: records path is {speedup:.1f}x faster end to end")
+
+if __name__ == "__main__":
+    main()
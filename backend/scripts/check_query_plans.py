@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN the hot list/lookup queries and fail if any falls back to a
+sequential scan of a content table.
+
+Small tables are always cheaper to scan, so plans are only meaningful at
+scale. --seed N inserts N synthetic rows per table inside a transaction
+that is rolled back at the end (nothing is kept), refreshes statistics and
+then checks the plans.
+
+Usage:
+    python scripts/check_query_plans.py                 # current data
+    python scripts/check_query_plans.py --seed 20000    # exit 1 on seq scans
+    DATABASE_URL=postgresql://... python scripts/check_query_plans.py --seed 20000
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, insert, text
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import BlogPost, Project, Tool
+
+CHECKED_TABLES = {"ai_tools", "projects", "blog_posts"}
+PAGE = 20
+
+def hot_queries(db: Session):
+    """(label, query) pairs mirroring the queries the endpoints and jobs run."""
+    tool_order = (Tool.display_order.asc(), Tool.id.desc())
+    blog_order = (BlogPost.display_order.asc(), BlogPost.id.desc())
+    return [
+        ("tools list", db.query(Tool).order_by(*tool_order).limit(PAGE)),
+        ("tools by category", db.query(Tool).filter(Tool.category == "Category 3").order_by(*tool_order).limit(PAGE)),
+        ("tool by url", db.query(Tool).filter(Tool.url == "https://tools.example.com/42")),
+        ("auto-fetched tool count", db.query(func.count(Tool.id)).filter(Tool.auto_fetched == True)),
+        ("projects list", db.query(Project).order_by(Project.display_order.asc(), Project.id.desc()).limit(PAGE)),
+        ("projects by category", db.query(Project).filter(Project.category == "Category 3")
+            .order_by(Project.display_order.asc(), Project.id.desc()).limit(PAGE)),
+        ("blogs list page", db.query(BlogPost.id, BlogPost.title).order_by(*blog_order).limit(PAGE + 1)),
+        ("blogs by category", db.query(BlogPost.id, BlogPost.title).filter(BlogPost.category == "Category 3")
+            .order_by(*blog_order).limit(PAGE + 1)),
+        ("blog by url", db.query(BlogPost).filter(BlogPost.url == "https://blogs.example.com/42")),
+    ]
+
+def seed(db: Session, rows: int):
+    """Insert synthetic rows with a realistic spread of categories and display orders."""
+    categories = [f"Category {i}" for i in range(12)]
+    db.execute(insert(Tool), [{
+        "name": f"Tool {i}", "description": "Synthetic tool", "category": categories[i % 12],
+        "url": f"https://tools.example.com/{i}", "display_order": i % 500, "auto_fetched": i % 3 == 0,
+    } for i in range(rows)])
+    db.execute(insert(Project), [{
+        "name": f"Project {i}", "description": "Synthetic project", "category": categories[i % 12],
+        "display_order": i % 500,
+    } for i in range(rows)])
+    db.execute(insert(BlogPost), [{
+        "title": f"Post {i}", "excerpt": "Synthetic", "content": "Synthetic body", "category": categories[i % 12],
+        "url": f"https://blogs.example.com/{i}", "display_order": i % 500,
+    } for i in range(rows)])
+    for table in CHECKED_TABLES:
+        db.execute(text(f"ANALYZE {table}"))
+
+def _compile(db: Session, query) -> str:
+    return str(query.statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+
+def _pg_seq_scans(node, found):
+    if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in CHECKED_TABLES:
+        found.append(node["Relation Name"])
+    for child in node.get("Plans", []):
+        _pg_seq_scans(child, found)
+    return found
+
+def explain(db: Session, sql: str):
+    """Returns (plan lines, tables scanned sequentially)."""
+    if db.get_bind().dialect.name == "postgresql":
+        plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+        plan = plan if isinstance(plan, list) else json.loads(plan)
+        lines = db.execute(text(f"EXPLAIN {sql}")).scalars().all()
+        return lines, _pg_seq_scans(plan[0]["Plan"], [])
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    lines = [row[-1] for row in rows]
+    seq = []
+    for line in lines:
+        # "SCAN ai_tools" is a full table scan; "SCAN ai_tools USING INDEX ..." is an ordered index walk
+        parts = line.split()
+        if parts[:1] == ["SCAN"] and len(parts) > 1 and parts[1] in CHECKED_TABLES and "INDEX" not in line:
+            seq.append(parts[1])
+    return lines, seq
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if hot queries use sequential scans")
+    parser.add_argument("--seed", type=int, default=0, help="rows per table to insert temporarily before checking")
+    parser.add_argument("--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    failures = []
+    try:
+        if args.seed:
+            print(f"🌱 Seeding {args.seed} rows per table (rolled back afterwards)")
+            seed(db, args.seed)
+        for label, query in hot_queries(db):
+            lines, seq = explain(db, _compile(db, query))
+            status = "❌" if seq else "✅"
+            print(f"{status} {label}")
+            if seq or args.verbose:
+                for line in lines:
+                    print(f"      {line}")
+            if seq:
+                failures.append((label, seq))
+    finally:
+        db.rollback()
+        db.close()
+
+    if failures:
+        print(f"\n{len(failures)} queries use sequential scans: " + ", ".join(label for label, _ in failures))
+        print("Run migrate_add_list_indexes.py, or re-check with --seed if the tables are small.")
+        sys.exit(1)
+    print("\nAll hot queries use indexes.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Export the public content lists as precompressed static JSON.
+
+Writes to $VOLUME_MOUNT_PATH/static_export (or STATIC_EXPORT_DIR / --out).
+Point a static host or CDN at that directory, or let the backend serve it
+at /static/export. Only documents whose content changed are rewritten.
+
+Usage:
+    python scripts/export_static.py
+    python scripts/export_static.py --full --out ../frontend/public/data
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import SessionLocal
+from app.services.static_export import export_static
+
+def main():
+    parser = argparse.ArgumentParser(description="Export public lists to static JSON files")
+    parser.add_argument("--full", action="store_true", help="re-render every document, not just changed ones")
+    parser.add_argument("--out", help="output directory (defaults to STATIC_EXPORT_DIR or $VOLUME_MOUNT_PATH/static_export)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = export_static(db, full=args.full, root=args.out)
+    finally:
+        db.close()
+
+    print(f"📦 Exported to {result['path']} in {result['seconds']}s")
+    print(f"   written: {len(result['written'])}, unchanged: {result['unchanged']}, pruned: {result['pruned_files']}")
+    print(json.dumps(result["written"], indent=2))
+
+if __name__ == "__main__":
+    main()
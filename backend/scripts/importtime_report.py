@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Profile how long ``import app.main`` takes (the dyno's cold start before
+uvicorn can serve) using ``python -X importtime``.
+
+Prints the total, the slowest modules by self and cumulative time, and
+exits 1 if one of the heavy optional dependencies that should only load on
+first use (chromadb, supabase, PDF/DOCX parsers, feed parsers, APScheduler)
+is imported at startup, or if the total exceeds --budget-ms.
+
+Each run is a fresh interpreter; with --runs N the median run is reported.
+
+Usage:
+    python scripts/importtime_report.py
+    python scripts/importtime_report.py --runs 5 --budget-ms 1500
+    python scripts/importtime_report.py --json > importtime.json
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Imported lazily by vectorstore, storage, cv_service, the blog/tools services and the scheduler
+DEFERRED_MODULES = ("chromadb", "supabase", "PyPDF2", "docx", "feedparser", "bs4", "apscheduler")
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+def profile(target: str) -> list:
+    """[{module, self_us, cumulative_us, depth}] for one fresh ``import target``."""
+    env = dict(os.environ, PYTHONPATH=str(BACKEND_DIR))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import {target} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append({
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": len(indent) // 2,
+            })
+    return rows
+
+def summarize(rows: list, target: str, top: int) -> dict:
+    modules = {row["module"] for row in rows}
+    total = next((row["cumulative_us"] for row in rows if row["module"] == target), 0)
+    by_package = {}
+    for row in rows:
+        package = row["module"].split(".")[0]
+        by_package[package] = by_package.get(package, 0) + row["self_us"]
+    return {
+        "target": target,
+        "total_ms": round(total / 1000, 1),
+        "modules": len(rows),
+        "deferred_imported": [name for name in DEFERRED_MODULES if name in modules],
+        "slowest_self": [
+            {"module": row["module"], "self_ms": round(row["self_us"] / 1000, 1)}
+            for row in sorted(rows, key=lambda row: -row["self_us"])[:top]
+        ],
+        "slowest_packages": [
+            {"package": package, "ms": round(us / 1000, 1)}
+            for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]
+        ],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import time report")
+    parser.add_argument("--target", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters to run; the median is reported")
+    parser.add_argument("--top", type=int, default=15, help="Rows per table")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if the total import time exceeds this")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    runs = sorted((summarize(profile(args.target), args.target, args.top) for _ in range(max(1, args.runs))),
+                  key=lambda report: report["total_ms"])
+    report = runs[len(runs) // 2]
+    report["runs_ms"] = [run["total_ms"] for run in runs]
+
+    failures = []
+    if report["deferred_imported"]:
+        failures.append(f"imported at startup: {', '.join(report['deferred_imported'])}")
+    if args.budget_ms is not None and report["total_ms"] > args.budget_ms:
+        failures.append(f"import time {report['total_ms']} ms exceeds budget {args.budget_ms} ms")
+    report["failures"] = failures
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import {report['target']}: {report['total_ms']} ms median "
+              f"(runs: {', '.join(str(ms) for ms in report['runs_ms'])}), {report['modules']} modules")
+        print("\nSlowest packages (self time):")
+        for row in report["slowest_packages"]:
+            print(f"  {row['ms']:>8.1f} ms  {row['package']}")
+        print("\nSlowest modules (self time):")
+        for row in report["slowest_self"]:
+            print(f"  {row['self_ms']:>8.1f} ms  {row['module']}")
+        print()
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        if not failures:
+            print("OK: no deferred dependency imported at startup")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
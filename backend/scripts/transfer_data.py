@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Export the database to, or import it from, a gzip NDJSON file
+(the same format as GET /export-data and POST /import-data).
+
+Usage:
+    python scripts/transfer_data.py export backup.ndjson.gz
+    python scripts/transfer_data.py export tools.ndjson.gz --tables ai_tools
+    python scripts/transfer_data.py import backup.ndjson.gz                 # upsert by natural key
+    python scripts/transfer_data.py import backup.ndjson.gz --mode replace --batch-size 5000
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import SessionLocal
+from app.services.data_transfer import IMPORT_MODES, import_ndjson, iter_export_gzip, resolve_tables
+
+def export(path: str, tables):
+    started = time.perf_counter()
+    with open(path, "wb") as out:
+        for chunk in iter_export_gzip(resolve_tables(tables)):
+            out.write(chunk)
+    size = Path(path).stat().st_size
+    print(f"📦 Exported to {path} ({size / 1024:.0f} KB) in {time.perf_counter() - started:.2f}s")
+
+def restore(path: str, mode: str, batch_size: int):
+    db = SessionLocal()
+    try:
+        with open(path, "rb") as f:
+            report = import_ndjson(db, f, mode=mode, batch_size=batch_size)
+    finally:
+        db.close()
+    print(f"✅ Imported {report['rows']} rows in {report['seconds']}s ({report['rows_per_second']} rows/s)")
+    print(json.dumps(report["tables"], indent=2))
+    for warning in report["warnings"]:
+        print(f"⚠️ {warning}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import content as gzip NDJSON")
+    parser.add_argument("action", choices=["export", "import"])
+    parser.add_argument("path")
+    parser.add_argument("--tables", help="comma-separated tables to export (default: all)")
+    parser.add_argument("--mode", choices=IMPORT_MODES, default="upsert", help="import mode")
+    parser.add_argument("--batch-size", type=int, help="rows per INSERT/UPDATE batch (default: IMPORT_BATCH_SIZE)")
+    args = parser.parse_args()
+
+    if args.action == "export":
+        export(args.path, args.tables.split(",") if args.tables else None)
+    else:
+        restore(args.path, args.mode, args.batch_size)
+
+if __name__ == "__main__":
+    main()
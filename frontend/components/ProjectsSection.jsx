@@ -1,33 +1,13 @@
 import Section from './Section'
 import ProjectCard from './ProjectCard'
 import { motion } from 'framer-motion'
-import { useState, useEffect } from 'react'
-import { ApiClient } from '../lib/api'
 
-export default function ProjectsSection(){
-  const [projects, setProjects] = useState([])
-  const [loading, setLoading] = useState(true)
-
-  useEffect(() => {
-    loadProjects()
-  }, [])
-
-  const loadProjects = async () => {
-    try {
-      setLoading(true)
-      console.log('Loading projects...')
-      const startTime = Date.now()
-      const response = await ApiClient.getProjects()
-      const endTime = Date.now()
-      console.log(`Projects loaded in ${endTime - startTime}ms`)
-      setProjects(response.data.items || [])
-    } catch (error) {
-      console.error('Failed to load projects:', error)
-      setProjects([])
-    } finally {
-      setLoading(false)
-    }
-  }
+/**
+ * Projects grid. The page fetches the list (see pages/index.js, /api/v1/home)
+ * and passes it in, so the homepage sections share a single request.
+ */
+export default function ProjectsSection({ items, loading = false }){
+  const projects = items || []
 
   if (loading) {
     return (
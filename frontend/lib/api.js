@@ -157,6 +157,25 @@ export const ApiClient = {
     return this.post('/api/v1/contact/submit', { name, email, message });
   },
 
+  /**
+   * Get the homepage bundle in one request
+   * 
+   * Returns capped, trimmed lists of tools, projects and blogs, each with
+   * category facets, a total and a version string.
+   * 
+   * @param {Object} limits - Optional { tools, projects, blogs } item counts
+   * @returns {Promise<Object>} { tools, projects, blogs } collections
+   */
+  async getHome(limits = {}) {
+    const params = new URLSearchParams();
+    Object.entries(limits).forEach(([key, value]) => {
+      if (value !== undefined && value !== null) params.append(key, value);
+    });
+    const qs = params.toString();
+    
+    return this.get(`/api/v1/home${qs ? `?${qs}` : ''}`);
+  },
+
   /**
    * Get list of projects
    * 
@@ -186,10 +205,46 @@ export const ApiClient = {
   /**
    * Get list of blog posts/news articles
    * 
-   * @returns {Promise<Object>} List of blog posts
+   * Without options every post is returned with full content. Passing a
+   * limit (or cursor) switches to keyset pagination with a light summary
+   * projection; use getNewsItem for a post's full content.
+   * 
+   * @param {Object} options - Optional { limit, cursor, category, featured, view }
+   * @returns {Promise<Object>} List of blog posts (plus next_cursor when paginated)
+   */
+  async getNews(options = {}) {
+    const params = new URLSearchParams();
+    Object.entries(options).forEach(([key, value]) => {
+      if (value !== undefined && value !== null) params.append(key, value);
+    });
+    const qs = params.toString();
+    
+    return this.get(`/api/v1/news/list${qs ? `?${qs}` : ''}`);
+  },
+
+  /**
+   * Get a single blog post with full content
+   * 
+   * @param {number} id - Blog post ID
+   * @returns {Promise<Object>} Blog post detail
    */
-  async getNews() {
-    return this.get('/api/v1/news/list');
+  async getNewsItem(id) {
+    return this.get(`/api/v1/news/${id}`);
+  },
+
+  /**
+   * Full-text search across blogs, tools and projects
+   * 
+   * @param {string} query - Search terms
+   * @param {string[]} types - Optional subset of "blogs", "tools", "projects"
+   * @param {number} limit - Maximum number of results
+   * @returns {Promise<Object>} Ranked results with highlighted snippets
+   */
+  async search(query, types = null, limit = 20) {
+    const params = new URLSearchParams({ q: query, limit });
+    if (types && types.length) params.append('types', types.join(','));
+    
+    return this.get(`/api/v1/search?${params.toString()}`);
   },
 
   /**
@@ -1,7 +1,7 @@
 import { useEffect, useState } from "react";
 import SessionTimeout from "../../components/SessionTimeout";
 import BrowserCloseHandler from "../../components/BrowserCloseHandler";
-import { safeFetch, fetchMultiple } from "../../utils/fetchWithTimeout";
+import { safeFetch, fetchMultiple, waitForJob } from "../../utils/fetchWithTimeout";
 
 export default function Admin() {
   const [tools, setTools] = useState([]);
@@ -21,12 +21,17 @@ export default function Admin() {
     setMessage("Refreshing blogs and resetting timer...");
     const base = process.env.NEXT_PUBLIC_API_URL;
     
-    const result = await safeFetch(`${base}/api/v1/refresh-blogs`, { 
+    const queued = await safeFetch(`${base}/api/v1/refresh-blogs`, { 
       method: "POST", 
       headers: {
         'Content-Type': 'application/json'
       }
-    }, 30000); // 30 second timeout for blog refresh
+    });
+    
+    // The refresh runs as a background job; poll it until it finishes
+    const result = queued.success
+      ? await waitForJob(base, queued.data.data.job_id, { onProgress: (job) => job.message && setMessage(`Refreshing blogs... (${job.message})`) })
+      : queued;
     
     if (result.success) {
       setMessage(`✅ ${result.data.message} - ${result.data.data?.added || 0} new blogs added`);
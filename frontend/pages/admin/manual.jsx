@@ -1,7 +1,8 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import SessionTimeout from "../../components/SessionTimeout";
 import BrowserCloseHandler from "../../components/BrowserCloseHandler";
 import DragDropList, { DragHandle } from "../../components/DragDropList";
+import { waitForJob } from "../../utils/fetchWithTimeout";
 
 function normalizeImageUrl(url) {
   if (!url) return url;
@@ -66,6 +67,7 @@ export default function ManualAdmin() {
     length: "medium"
   });
   const [generatedBlog, setGeneratedBlog] = useState(null);
+  const generationRef = useRef(null);
 
   const categories = [
     "AI Chat & Assistant", "Image & Visual AI", "Video & Media AI", "Audio & Voice AI", 
@@ -256,28 +258,72 @@ export default function ManualAdmin() {
     setBusy(true);
     setMessage("Generating blog...");
     const base = process.env.NEXT_PUBLIC_API_URL;
+    const controller = new AbortController();
+    generationRef.current = controller;
+    // Streamed generation: the preview fills in as the model writes
+    let draft = { title: "", excerpt: "", content: "", category: blogForm.category, topic: blogForm.topic };
     try {
-      const response = await fetch(`${base}/api/v1/generate-blog`, {
+      const response = await fetch(`${base}/api/v1/generate-blog/stream`, {
         method: "POST",
         headers: { 
           "Content-Type": "application/json"
         },
         credentials: 'include',
-        body: JSON.stringify(blogForm)
+        body: JSON.stringify(blogForm),
+        signal: controller.signal
       });
-      const result = await response.json();
-      if (result.success) {
-        setGeneratedBlog(result.data);
-        setMessage("Blog generated successfully!");
-      } else {
-        setMessage(`Error: ${result.error}`);
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      let failed = null;
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split("\n");
+        buffer = lines.pop();
+        for (const line of lines) {
+          if (!line.trim()) continue;
+          const event = JSON.parse(line);
+          if (event.type === "delta") {
+            draft = { ...draft, content: draft.content + event.text };
+          } else if (event.type === "title") {
+            draft = { ...draft, title: event.title };
+          } else if (event.type === "excerpt") {
+            draft = { ...draft, excerpt: event.excerpt };
+          } else if (event.type === "done") {
+            draft = event.data;
+          } else if (event.type === "error") {
+            failed = event.error;
+          }
+        }
+        setGeneratedBlog(draft);
+      }
+      setMessage(failed ? `Error: ${failed}` : "Blog generated successfully!");
+      if (failed && !draft.content) {
+        setGeneratedBlog(null);
       }
     } catch (error) {
-      setMessage(`Error generating blog: ${error.message}`);
+      if (error.name === 'AbortError') {
+        setMessage("Blog generation cancelled");
+      } else {
+        setMessage(`Error generating blog: ${error.message}`);
+      }
     }
+    generationRef.current = null;
     setBusy(false);
   }
 
+  function cancelGeneration() {
+    if (generationRef.current) {
+      generationRef.current.abort();
+    }
+    setGeneratedBlog(null);
+  }
+
   async function saveBlog() {
     if (!generatedBlog) return;
     setBusy(true);
@@ -472,9 +518,10 @@ export default function ManualAdmin() {
           "Content-Type": "application/json"
         }
       });
-      const result = await response.json();
+      const queued = await response.json();
+      const result = queued.success ? await waitForJob(base, queued.data.job_id) : queued;
       if (result.success) {
-        setMessage(`✅ ${result.message}`);
+        setMessage(`✅ ${result.data.message}`);
         fetchStats();
       } else {
         setMessage(`❌ Error: ${result.error}`);
@@ -496,9 +543,10 @@ export default function ManualAdmin() {
           "Content-Type": "application/json"
         }
       });
-      const result = await response.json();
+      const queued = await response.json();
+      const result = queued.success ? await waitForJob(base, queued.data.job_id) : queued;
       if (result.success) {
-        setMessage(`✅ ${result.message}`);
+        setMessage(`✅ ${result.data.message}`);
         fetchStats();
       } else {
         setMessage(`❌ Error: ${result.error}`);
@@ -1225,10 +1273,10 @@ export default function ManualAdmin() {
                     opacity: busy ? 0.6 : 1
                   }}
                 >
-                  {busy ? "Saving..." : "Save Blog Post"}
+                  {busy && !generationRef.current ? "Saving..." : "Save Blog Post"}
                 </button>
                 <button
-                  onClick={() => setGeneratedBlog(null)}
+                  onClick={cancelGeneration}
                   style={{
                     background: '#6c757d',
                     color: '#fff',
@@ -1238,7 +1286,7 @@ export default function ManualAdmin() {
                     cursor: 'pointer'
                   }}
                 >
-                  Generate New
+                  {busy && generationRef.current ? "Cancel" : "Generate New"}
                 </button>
               </div>
             </div>
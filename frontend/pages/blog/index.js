@@ -3,31 +3,87 @@ import { useState, useEffect } from 'react'
 import { ApiClient } from '../../lib/api'
 import Footer from '../../components/Footer'
 
+// Posts per page; the list comes without content, which is loaded per post on "Read More"
+const PAGE_SIZE = 12
+
 export default function BlogPage() {
   const [blogs, setBlogs] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [categories, setCategories] = useState(['All'])
   const [selectedCategory, setSelectedCategory] = useState('All')
   const [searchTerm, setSearchTerm] = useState('')
   const [expandedBlogs, setExpandedBlogs] = useState(new Set())
+  const [contents, setContents] = useState({})
 
   useEffect(() => {
-    loadBlogs()
+    loadCategories()
   }, [])
 
+  useEffect(() => {
+    loadBlogs()
+  }, [selectedCategory])
+
+  const loadCategories = async () => {
+    try {
+      // Category facets of the whole blog, not just the pages loaded so far
+      const response = await ApiClient.getHome({ tools: 0, projects: 0, blogs: 0 })
+      setCategories(['All', ...(response.data.blogs.facets || []).map(f => f.category)])
+    } catch (error) {
+      console.error('Failed to load blog categories:', error)
+    }
+  }
+
+  const fetchPage = (cursor) => ApiClient.getNews({
+    limit: PAGE_SIZE,
+    view: 'summary',
+    category: selectedCategory === 'All' ? undefined : selectedCategory,
+    cursor: cursor || undefined,
+  })
+
   const loadBlogs = async () => {
     try {
       setLoading(true)
-      const response = await ApiClient.getNews()
+      const response = await fetchPage()
       setBlogs(response.data.items || [])
+      setNextCursor(response.data.next_cursor)
     } catch (error) {
       console.error('Failed to load blogs:', error)
       setBlogs([])
+      setNextCursor(null)
     } finally {
       setLoading(false)
     }
   }
 
+  const loadMore = async () => {
+    try {
+      setLoadingMore(true)
+      const response = await fetchPage(nextCursor)
+      setBlogs(prev => [...prev, ...(response.data.items || [])])
+      setNextCursor(response.data.next_cursor)
+    } catch (error) {
+      console.error('Failed to load more blogs:', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  const loadContent = async (blogId) => {
+    try {
+      const response = await ApiClient.getNewsItem(blogId)
+      setContents(prev => ({ ...prev, [blogId]: response.data.content }))
+    } catch (error) {
+      console.error('Failed to load blog content:', error)
+      setContents(prev => ({ ...prev, [blogId]: 'Could not load this article. Please try again.' }))
+    }
+  }
+
   const toggleBlogExpansion = (blogId) => {
+    if (!expandedBlogs.has(blogId) && contents[blogId] === undefined) {
+      loadContent(blogId)
+    }
     setExpandedBlogs(prev => {
       const newSet = new Set(prev)
       if (newSet.has(blogId)) {
@@ -39,18 +95,16 @@ export default function BlogPage() {
     })
   }
 
+  // The category filter runs on the server; search narrows the posts loaded so far
   const filteredBlogs = blogs.filter(blog => {
-    const matchesCategory = selectedCategory === 'All' || blog.category === selectedCategory
     const matchesSearch = blog.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
                          blog.excerpt.toLowerCase().includes(searchTerm.toLowerCase())
-    return matchesCategory && matchesSearch
+    return matchesSearch
   })
 
   const featuredBlogs = filteredBlogs.filter(blog => blog.featured)
   const regularBlogs = filteredBlogs.filter(blog => !blog.featured)
 
-  const categories = ['All', ...new Set(blogs.map(b => b.category))]
-
   if (loading) {
     return (
       <div className="pt-20 md:pt-24 px-4 md:px-6 flex justify-center items-center min-h-screen">
@@ -162,7 +216,7 @@ export default function BlogPage() {
                         animate={{ opacity: 1, height: 'auto' }}
                         className="mb-4 p-6 bg-gray-800/50 rounded-lg"
                       >
-                        <p className="text-gray-200 text-base leading-relaxed whitespace-pre-wrap">{blog.content}</p>
+                        <p className="text-gray-200 text-base leading-relaxed whitespace-pre-wrap">{contents[blog.id] ?? 'Loading...'}</p>
                       </motion.div>
                     )}
                     
@@ -209,7 +263,7 @@ export default function BlogPage() {
                     animate={{ opacity: 1, height: 'auto' }}
                     className="mb-4 p-4 bg-gray-800/50 rounded-lg"
                   >
-                    <p className="text-gray-200 text-sm leading-relaxed whitespace-pre-wrap">{blog.content}</p>
+                    <p className="text-gray-200 text-sm leading-relaxed whitespace-pre-wrap">{contents[blog.id] ?? 'Loading...'}</p>
                   </motion.div>
                 )}
                 
@@ -231,6 +285,19 @@ export default function BlogPage() {
             ))}
           </div>
 
+          {/* Next page (keyset cursor from the previous response) */}
+          {nextCursor && (
+            <div className="flex justify-center mt-10">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-6 py-3 bg-white/5 hover:bg-white/10 text-slate-300 rounded-xl transition-all duration-200 ring-1 ring-white/10 hover:ring-white/20 disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load More Articles'}
+              </button>
+            </div>
+          )}
+
           {filteredBlogs.length === 0 && (
             <motion.div
               initial={{ opacity: 0 }}
@@ -1,16 +1,26 @@
+import useSWR from 'swr'
 import Hero from '../components/Hero'
 import About from '../components/About'
 import WorkExperience from '../components/WorkExperience'
 import ProjectsSection from '../components/ProjectsSection'
 import Footer from '../components/Footer'
+import { ApiClient } from '../lib/api'
+
+// Item counts requested from /api/v1/home (50 is the endpoint's cap).
+// Only the projects section is on this page, so tools and blogs are skipped.
+const HOME_LIMITS = { projects: 50, tools: 0, blogs: 0 }
 
 export default function Home() {
+  // One request (and one SWR key) for everything the homepage sections render
+  const { data, isLoading } = useSWR(['home', HOME_LIMITS], () => ApiClient.getHome(HOME_LIMITS))
+  const home = data?.data || {}
+
   return (
     <main className="bg-hero min-h-screen">
       <Hero />
       <About />
       <WorkExperience />
-      <ProjectsSection />
+      <ProjectsSection items={home.projects?.items} loading={isLoading} />
       <Footer />
     </main>
   )
@@ -70,3 +70,33 @@ export async function fetchMultiple(requests) {
   
   return Promise.all(promises);
 }
+
+/**
+ * Poll a background job (see /api/v1/jobs/{id}) until it finishes.
+ * Needs an admin session: the admin session cookie is sent with each poll.
+ * @param {string} base - API base URL
+ * @param {string} jobId - Job id returned by the endpoint that queued the job
+ * @param {Object} opts - { onProgress(job), interval (ms, default 1500), timeout (ms, default 300000) }
+ * @returns {Promise<{success: boolean, data?: any, error?: string}>} - data is the job's result
+ */
+export async function waitForJob(base, jobId, { onProgress, interval = 1500, timeout = 300000 } = {}) {
+  const deadline = Date.now() + timeout;
+  while (Date.now() < deadline) {
+    const result = await safeFetch(`${base}/api/v1/jobs/${jobId}`, { credentials: 'include' });
+    if (!result.success) {
+      return result;
+    }
+    const job = result.data.data;
+    if (onProgress) {
+      onProgress(job);
+    }
+    if (job.status === 'succeeded') {
+      return { success: true, data: job.result };
+    }
+    if (job.status === 'failed' || job.status === 'interrupted') {
+      return { success: false, error: job.error || `Job ${job.status}` };
+    }
+    await new Promise((resolve) => setTimeout(resolve, interval));
+  }
+  return { success: false, error: 'Job timeout' };
+}